@@ -6,15 +6,24 @@ from django.urls import reverse, path
 from django.utils.safestring import mark_safe
 from django.db.models import Count
 from django.contrib.admin import SimpleListFilter
-from django.db.models import Q
+from django.contrib.admin.utils import unquote
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.db.models import Q , OuterRef , Subquery , Value
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
 from .models import (
     MasterCategory,
     Category,
     Tag,
     Post,
     Comment,
+    PostLink,
     PostRevision
 )
+from .annotations import active_categories_count , has_published_posts , published_posts_count
+from .pagination import EstimatedCountPaginator
+from .search import search_posts
+from .seo import seo_status
 from django import forms
 from django.contrib import messages
 
@@ -35,10 +44,61 @@ class PublishedPostsFilter(SimpleListFilter):
         )
 
     def queryset(self, request, queryset):
+        # EXISTS per row rather than joining every post and de-duplicating
         if self.value() == 'yes':
-            return queryset.filter(posts__status='published').distinct()
+            return queryset.filter(has_published_posts(queryset.model))
         if self.value() == 'no':
-            return queryset.exclude(posts__status='published').distinct()
+            return queryset.filter(~has_published_posts(queryset.model))
+
+class AutocompleteListFilter(SimpleListFilter):
+    """
+    Foreign key filter rendered as a select2 box fed by the admin
+    autocomplete view, instead of listing every related row in the sidebar.
+    Subclasses set ``title`` and ``field_name``.
+    """
+    template = 'admin/blog/autocomplete_filter.html'
+    field_name = None
+
+    def __init__(self , request , params , model , model_admin):
+        self.parameter_name = f'{self.field_name}__id__exact'
+        self.app_label = model._meta.app_label
+        self.model_name = model._meta.model_name
+        self.related_model = model._meta.get_field(self.field_name).remote_field.model
+        super().__init__(request , params , model , model_admin)
+
+    def has_output(self):
+        return True
+
+    def lookups(self , request , model_admin):
+        return ()
+
+    def choices(self , changelist):
+        yield {
+            'selected': self.value() is None ,
+            'query_string': changelist.get_query_string(remove=[self.parameter_name]) ,
+            'display': 'All' ,
+        }
+
+    @cached_property
+    def selected(self):
+        if not self.value():
+            return None
+        return self.related_model._default_manager.filter(pk=self.value()).first()
+
+    def queryset(self , request , queryset):
+        if self.value():
+            return queryset.filter(**{f'{self.field_name}_id': self.value()})
+
+
+class AuthorFilter(AutocompleteListFilter):
+    title = 'author'
+    field_name = 'author'
+
+
+class CategoryFilter(AutocompleteListFilter):
+    title = 'category'
+    field_name = 'category'
+
 
 class CategoryInline(admin.TabularInline):
     model = Category
@@ -76,15 +136,21 @@ class MasterCategoryAdmin(admin.ModelAdmin):
         return "-"
     display_featured_image.short_description = 'Featured Image Preview'
 
+    def total_posts(self, obj):
+        return obj._total_posts
+    total_posts.short_description = 'Total Posts'
+    total_posts.admin_order_field = '_total_posts'
+
     def active_categories_count(self, obj):
-        return obj.categories.filter(is_active=True).count()
+        return obj._active_categories_count
     active_categories_count.short_description = 'Active Categories'
+    active_categories_count.admin_order_field = '_active_categories_count'
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
         queryset = queryset.annotate(
-            _total_posts=Count('categories__posts', 
-                filter=Q(categories__posts__status='published'))
+            _total_posts=published_posts_count(MasterCategory),
+            _active_categories_count=active_categories_count()
         )
         return queryset
 
@@ -93,6 +159,7 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name', 'master_category', 'site', 'parent', 'post_count', 'order', 'show_in_menu', 'is_active')
     list_editable = ('order', 'show_in_menu', 'is_active')
     list_filter = ('site', 'master_category', 'is_active', 'show_in_menu', PublishedPostsFilter)
+    list_select_related = ('site', 'master_category', 'parent__site', 'parent__master_category')
     search_fields = ('name', 'description')
     prepopulated_fields = {'slug': ('name',)}
     readonly_fields = ('created_at', 'updated_at', 'display_featured_image')
@@ -127,13 +194,20 @@ class CategoryAdmin(admin.ModelAdmin):
     display_featured_image.short_description = 'Featured Image Preview'
 
     def post_count(self, obj):
-        return obj.posts.filter(status='published').count()
+        return obj._post_count
     post_count.short_description = 'Published Posts'
+    post_count.admin_order_field = '_post_count'
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _post_count=published_posts_count(self.model)
+        )
 
 @admin.register(Tag)
 class TagAdmin(admin.ModelAdmin):
     list_display = ('name', 'site', 'post_count', 'is_active', 'created_at')
     list_filter = ('site', 'is_active', PublishedPostsFilter)
+    list_select_related = ('site',)
     search_fields = ('name', 'description')
     prepopulated_fields = {'slug': ('name',)}
     readonly_fields = ('created_at', 'updated_at', 'display_featured_image')
@@ -159,8 +233,14 @@ class TagAdmin(admin.ModelAdmin):
     display_featured_image.short_description = 'Featured Image Preview'
 
     def post_count(self, obj):
-        return obj.posts.filter(status='published').count()
+        return obj._post_count
     post_count.short_description = 'Published Posts'
+    post_count.admin_order_field = '_post_count'
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _post_count=published_posts_count(self.model)
+        )
 
 class CommentInline(admin.TabularInline):
     model = Comment
@@ -169,28 +249,44 @@ class CommentInline(admin.TabularInline):
     fields = ('author_name', 'author_email', 'content', 'is_approved', 'created_at')
 
 class PostRevisionInline(admin.TabularInline):
+    """The latest revisions only; ``PostAdmin.revision_history`` links to the rest"""
     model = PostRevision
     extra = 0
     readonly_fields = ('created_at', 'author')
-    fields = ('title', 'excerpt', 'content', 'revision_note', 'author', 'created_at')
+    fields = ('title', 'revision_note', 'author', 'created_at')
+    show_change_link = True
     max_num = 0
     can_delete = False
+    recent_revisions = 10
 
     def has_add_permission(self, request, obj=None):
         return False
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request).select_related('author').defer('content', 'content_delta')
+        object_id = request.resolver_match.kwargs.get('object_id') if request.resolver_match else None
+        if object_id is None:
+            return queryset
+        recent = PostRevision.objects.filter(post_id=unquote(object_id)).order_by('-created_at', '-id')
+        return queryset.filter(
+            pk__in=list(recent.values_list('pk', flat=True)[:self.recent_revisions])
+        ).order_by('-created_at', '-id')
+
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = ('title' , 'site' , 'category' , 'author' , 'status' , 'seo_health_score' , 'visibility' ,
                     'is_featured' , 'view_count' , 'get_comment_count' ,
                     'published_at')  # Changed comment_count to get_comment_count
-    list_filter = ('site' , 'status' , 'visibility' , 'is_featured' , 'category' ,
-                   'author' , 'created_at' , 'published_at')
-    search_fields = ('title' , 'content' , 'excerpt')
+    list_filter = ('site' , 'status' , 'visibility' , 'is_featured' , CategoryFilter ,
+                   AuthorFilter , 'created_at' , 'published_at')
+    # Shows the search box; get_search_results hands the term to search_posts
+    search_fields = ('title' , 'excerpt')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     prepopulated_fields = {'slug': ('title' ,)}
     readonly_fields = ('created_at' , 'updated_at',
-                       'estimated_reading_time' , 'seo_health_display' ,
-                       'get_featured_image')  # Changed display_featured_image to get_featured_image
+                       'estimated_reading_time' , 'word_count' , 'seo_health_display' ,
+                       'get_featured_image' , 'revision_history')  # Changed display_featured_image to get_featured_image
     filter_horizontal = ('tags' , 'related_posts')
     autocomplete_fields = ['category']
     inlines = [CommentInline , PostRevisionInline]
@@ -230,7 +326,7 @@ class PostAdmin(admin.ModelAdmin):
         ('Additional Options' , {
             'fields': (
                 'allow_comments' , 'show_in_feed' ,
-                'estimated_reading_time' , 'view_count'
+                'estimated_reading_time' , 'word_count' , 'view_count'
             ) ,
             'classes': ('collapse' ,)
         }) ,
@@ -239,16 +335,17 @@ class PostAdmin(admin.ModelAdmin):
             'classes': ('collapse' ,)
         }) ,
         ('Timestamps' , {
-            'fields': ('created_at' , 'updated_at') ,
+            'fields': ('created_at' , 'updated_at' , 'revision_history') ,
             'classes': ('collapse' ,)
         }) ,
     )
 
 
     def get_comment_count(self , obj):
-        return obj.comments.count()
+        return obj._comment_count
 
     get_comment_count.short_description = 'Comments'
+    get_comment_count.admin_order_field = '_comment_count'
 
     def get_featured_image(self , obj):
         if obj.featured_image:
@@ -257,8 +354,21 @@ class PostAdmin(admin.ModelAdmin):
 
     get_featured_image.short_description = 'Featured Image Preview'
 
+    def revision_history(self , obj):
+        if not obj.pk:
+            return "-"
+        url = reverse('admin:Blog_postrevision_changelist')
+        return format_html(
+            '<a href="{}?post__id__exact={}">View all revisions</a> (the latest {} are listed below)' ,
+            url , obj.pk , PostRevisionInline.recent_revisions
+        )
+
+    revision_history.short_description = 'Revision history'
+
     def seo_health_score(self , obj):
-        health = obj.get_seo_health()
+        if obj.seo_score is None:
+            return "-"
+        status = seo_status(obj.seo_score)
         return format_html(
             '<span style="color: {};">{}/100 ({})</span>' ,
             {
@@ -266,12 +376,13 @@ class PostAdmin(admin.ModelAdmin):
                 'Good': '#17a2b8' ,
                 'Fair': '#ffc107' ,
                 'Poor': '#dc3545'
-            }[health['status']] ,
-            health['score'] ,
-            health['status']
+            }[status] ,
+            obj.seo_score ,
+            status
         )
 
     seo_health_score.short_description = 'SEO Health'
+    seo_health_score.admin_order_field = 'seo_score'
 
     def seo_health_display(self , obj):
         health = obj.get_seo_health()
@@ -309,19 +420,27 @@ class PostAdmin(admin.ModelAdmin):
 
         # Create revision
         if change:  # Only create revision when editing
-            PostRevision.objects.create(
-                post=obj ,
-                title=obj.title ,
-                content=obj.content ,
-                excerpt=obj.excerpt ,
-                author=request.user ,
-                revision_note=f"Updated by {request.user}"
-            )
+            PostRevision.record(obj , request.user , revision_note=f"Updated by {request.user}")
 
     def get_queryset(self , request):
+        # Correlated subquery: only evaluated for the rows on the current page
+        comment_count = Comment.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(
+            count=Count('pk')
+        ).values('count')
         return super().get_queryset(request).select_related(
-            'site' , 'category' , 'author'
-        ).prefetch_related('tags')
+            'site' , 'category__site' , 'category__master_category' , 'author'
+        ).annotate(_comment_count=Coalesce(Subquery(comment_count) , Value(0)))
+
+    def get_search_results(self , request , queryset , search_term):
+        if search_term:
+            return search_posts(queryset , search_term) , False
+        return super().get_search_results(request , queryset , search_term)
+
+    @property
+    def media(self):
+        # select2 and the autocomplete widget script for the FK list filters
+        autocomplete = AutocompleteSelect(Post._meta.get_field('author') , self.admin_site)
+        return super().media + autocomplete.media
 
     def get_urls(self):
         urls = super().get_urls()
@@ -422,14 +541,39 @@ class CommentAdmin(admin.ModelAdmin):
 
 @admin.register(PostRevision)
 class PostRevisionAdmin(admin.ModelAdmin):
-    list_display = ('post', 'author', 'created_at')
+    list_display = ('post', 'author', 'is_snapshot', 'created_at')
     list_filter = ('post__site', 'author', 'created_at')
     search_fields = ('post__title', 'revision_note')
-    readonly_fields = ('post', 'title', 'content', 'excerpt', 'author',
+    readonly_fields = ('post', 'title', 'full_content', 'excerpt', 'author',
                       'created_at', 'updated_at')
+    exclude = ('content', 'content_delta', 'content_hash')
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('post__site', 'author').defer(
+            'content', 'content_delta', 'post__content', 'post__rendered_content'
+        )
+
+    def full_content(self, obj):
+        return obj.get_content()
+    full_content.short_description = 'Content'
 
     def has_add_permission(self, request):
         return False
 
     def has_delete_permission(self, request, obj=None):
-        return False
\ No newline at end of file
+        return False
+
+
+@admin.register(PostLink)
+class PostLinkAdmin(admin.ModelAdmin):
+    """Read-only view of the link graph; rows are rewritten whenever a post is saved"""
+    list_display = ('source', 'target_slug', 'target', 'anchor_text')
+    list_filter = ('source__site', ('target', admin.EmptyFieldListFilter))
+    search_fields = ('target_slug', 'anchor_text', 'source__title')
+    list_select_related = ('source__site', 'target__site')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,128 @@
+# Blog/analysis.py
+"""
+Plain-text statistics of a post's HTML body.
+
+The HTML is tokenized once with the standard library parser; script and
+style bodies are dropped and block-level tags act as word breaks, so
+``<p>one</p><p>two</p>`` is two words. ``Post.save`` stores the result in
+columns, which is what reading time, SEO health and the list serializers
+read afterwards.
+"""
+import math
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+WORDS_PER_MINUTE = 200
+
+# Tags that don't separate words, e.g. "<b>bold</b>ness" is one word
+INLINE_TAGS = frozenset((
+    'a' , 'abbr' , 'b' , 'bdi' , 'bdo' , 'cite' , 'code' , 'data' , 'dfn' , 'em' , 'font' , 'i' , 'kbd' ,
+    'mark' , 'q' , 's' , 'samp' , 'small' , 'span' , 'strike' , 'strong' , 'sub' , 'sup' , 'time' , 'u' , 'var'
+))
+SKIPPED_TAGS = frozenset(('script' , 'style' , 'template' , 'noscript'))
+
+ContentStats = namedtuple('ContentStats' , [
+    'text' , 'word_count' , 'character_count' , 'internal_link_count' , 'external_link_count' , 'image_count' ,
+    'internal_links' , 'image_sources'
+])
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self , domain=None):
+        super().__init__(convert_charrefs=True)
+        self.hosts = {domain , f'www.{domain}'} if domain else set()
+        self.chunks = []
+        self.skipping = 0
+        self.internal_links = 0
+        self.external_links = 0
+        self.images = 0
+        # [href, anchor text chunks] of every internal link, in document order
+        self.links = []
+        self.open_link = None
+        self.image_sources = []
+
+    def handle_starttag(self , tag , attrs):
+        if tag in SKIPPED_TAGS:
+            self.skipping += 1
+        elif tag == 'img':
+            self.count_image(attrs)
+        elif tag == 'a':
+            self.open_link = self.count_link(dict(attrs).get('href'))
+        if tag not in INLINE_TAGS:
+            self.chunks.append(' ')
+
+    def handle_startendtag(self , tag , attrs):
+        # <img/> and <br/> never wrap skipped content
+        if tag == 'img':
+            self.count_image(attrs)
+        if tag not in INLINE_TAGS:
+            self.chunks.append(' ')
+
+    def handle_endtag(self , tag):
+        if tag == 'a':
+            self.open_link = None
+        if tag in SKIPPED_TAGS:
+            self.skipping = max(0 , self.skipping - 1)
+        elif tag not in INLINE_TAGS:
+            self.chunks.append(' ')
+
+    def handle_data(self , data):
+        if not self.skipping:
+            self.chunks.append(data)
+            if self.open_link is not None:
+                self.open_link[1].append(data)
+
+    def count_image(self , attrs):
+        self.images += 1
+        attrs = dict(attrs)
+        if attrs.get('src'):
+            self.image_sources.append(attrs['src'].strip())
+        for candidate in (attrs.get('srcset') or '').split(','):
+            if candidate.strip():
+                self.image_sources.append(candidate.split()[0])
+
+    def count_link(self , href):
+        """Count a link; internal ones are also recorded and returned"""
+        href = (href or '').strip()
+        if not href:
+            return None
+        parts = urlsplit(href)
+        if parts.scheme in ('' , 'http' , 'https') and (not parts.netloc or parts.hostname in self.hosts):
+            self.internal_links += 1
+            link = [href , []]
+            self.links.append(link)
+            return link
+        if parts.scheme in ('http' , 'https'):
+            self.external_links += 1
+        return None
+
+
+def analyze_html(html , domain=None):
+    """
+    ``ContentStats`` for ``html``. Links are internal when they are relative
+    or point at ``domain`` (with or without ``www.``); mailto:, tel: and
+    other schemes are not counted. ``internal_links`` lists the
+    ``(href, anchor text)`` of every internal link and ``image_sources``
+    every ``<img>`` ``src`` and ``srcset`` URL.
+    """
+    parser = _TextExtractor(domain)
+    parser.feed(html or '')
+    parser.close()
+    words = ''.join(parser.chunks).split()
+    text = ' '.join(words)
+    return ContentStats(
+        text=text ,
+        word_count=len(words) ,
+        character_count=len(text) ,
+        internal_link_count=parser.internal_links ,
+        external_link_count=parser.external_links ,
+        image_count=parser.images ,
+        internal_links=[(href , ' '.join(''.join(anchor).split())) for href , anchor in parser.links] ,
+        image_sources=parser.image_sources ,
+    )
+
+
+def reading_time(word_count):
+    """Whole minutes at ``WORDS_PER_MINUTE``, at least one for any text"""
+    return math.ceil(word_count / WORDS_PER_MINUTE)
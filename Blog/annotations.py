@@ -0,0 +1,43 @@
+# Blog/annotations.py
+"""
+Correlated subqueries for per-row counts and flags on category/tag lists.
+
+Each one is evaluated against its own indexed foreign key, so several can
+sit on the same queryset without the join fan-out (and ``DISTINCT``) that
+chaining ``Count('categories__posts')`` style aggregates causes.
+"""
+from django.db.models import Exists , F , Func , IntegerField , OuterRef , Subquery , Value
+from django.db.models.functions import Coalesce
+
+# How a published post points back at each model that lists posts
+POST_LOOKUPS = {
+    'mastercategory': 'category__master_category' ,
+    'category': 'category' ,
+    'tag': 'tags' ,
+}
+
+
+def _published_posts(model):
+    from .models import Post
+    return Post.objects.filter(status='published' , **{POST_LOOKUPS[model._meta.model_name]: OuterRef('pk')})
+
+
+def _count(queryset):
+    # A plain COUNT() function rather than an aggregate, so no GROUP BY is added
+    counted = queryset.order_by().annotate(count=Func(F('pk') , function='COUNT')).values('count')
+    return Coalesce(Subquery(counted , output_field=IntegerField()) , Value(0))
+
+
+def has_published_posts(model):
+    """``EXISTS`` flag: at least one published post for the outer row"""
+    return Exists(_published_posts(model))
+
+
+def published_posts_count(model):
+    return _count(_published_posts(model))
+
+
+def active_categories_count():
+    """Active categories under the outer ``MasterCategory`` row"""
+    from .models import Category
+    return _count(Category.objects.filter(master_category=OuterRef('pk') , is_active=True))
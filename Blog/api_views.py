@@ -8,7 +8,11 @@ from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import AllowAny
 from rest_framework.generics import ListAPIView
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import APIView
+from django.db import router
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from .models import (
     MasterCategory,
     Category,
@@ -29,16 +33,27 @@ from .serializers import (
     CommentSerializer,
     CommentCreateSerializer,
     PostRevisionSerializer,
+    PostRevisionDetailSerializer,
     PostListLatestSerializer,
     PostListPublishedSerializer,
     PostListSlugSerializer,
     CategorySlugSerializer,
-    PostSerializer
+    PostSerializer,
+    project_queryset
 )
 from rest_framework.pagination import PageNumberPagination
+from .pagination import LookaheadPagination
+from .streaming import CONTENT_TYPES , encode_rows , serialized_rows , streaming_response
 from django.contrib.sites.models import Site
 from django.shortcuts import get_object_or_404
 
+class SparseFieldsetViewMixin:
+    """Project the queryset down to the columns the (sparse) serializer renders"""
+
+    def project_queryset(self, queryset):
+        return project_queryset(queryset, self.get_serializer())
+
+
 class MasterCategoryViewSet(viewsets.ModelViewSet):
     # Add explicit queryset
     queryset = MasterCategory.objects.all()
@@ -137,7 +152,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             return CommentCreateSerializer
         return CommentSerializer
 
-class PostViewFilter(ListAPIView):
+class PostViewFilter(SparseFieldsetViewMixin, ListAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
     lookup_field = 'slug'
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
@@ -167,7 +182,7 @@ class PostViewFilter(ListAPIView):
         )
         
         # Apply filters dynamically
-        return self.filter_queryset(queryset)
+        return self.project_queryset(self.filter_queryset(queryset))
 
     def featured(self, request):
         """Get featured blog posts (without pagination)"""
@@ -187,12 +202,32 @@ class PostViewFilter(ListAPIView):
         serializer = PostListSerializer(posts, many=True)
         return Response(serializer.data)
 
-class CustomPagination(PageNumberPagination):
+class NoDataListMixin:
+    """
+    Shared list() that answers "No Available Data" from the rows it fetched
+    instead of running a separate exists() query first.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else list(queryset)
+        if not rows:
+            return Response(
+                {"message": "No Available Data"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        serializer = self.get_serializer(rows, many=True)
+        if page is not None:
+            return self.get_paginated_response(serializer.data)
+        return Response(serializer.data)
+
+class CustomPagination(LookaheadPagination):
     page_size = 6
     page_size_query_param = 'page_size'
     max_page_size = 100
 
-class UnplugPublishedPostsView(ListAPIView):
+class UnplugPublishedPostsView(NoDataListMixin, ListAPIView):
     serializer_class = PostListPublishedSerializer
     pagination_class = CustomPagination
 
@@ -205,28 +240,13 @@ class UnplugPublishedPostsView(ListAPIView):
 
         return queryset
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
 class PostDetailView(RetrieveAPIView):
     queryset = Post.objects.all()
     serializer_class = PostListSlugSerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
 
-class PostsLatestDataView(ListAPIView):
+class PostsLatestDataView(NoDataListMixin, ListAPIView):
     serializer_class = PostListLatestSerializer
 
     def get_queryset(self):
@@ -238,22 +258,7 @@ class PostsLatestDataView(ListAPIView):
 
         return queryset[:4]
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
-class PostsPopularDataView(ListAPIView):
+class PostsPopularDataView(NoDataListMixin, ListAPIView):
     serializer_class = PostListLatestSerializer
     
     def get_queryset(self):
@@ -265,25 +270,10 @@ class PostsPopularDataView(ListAPIView):
 
         return queryset[:3]
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
 
 # Category-Name wise Data get
 
-class PostCategoryDataView(ListAPIView):
+class PostCategoryDataView(NoDataListMixin, ListAPIView):
     serializer_class = PostListLatestSerializer
     
     def get_queryset(self):
@@ -303,22 +293,7 @@ class PostCategoryDataView(ListAPIView):
 
         return queryset.order_by('-view_count')
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
-class CategorySlugDataView(ListAPIView):
+class CategorySlugDataView(NoDataListMixin, ListAPIView):
     serializer_class = CategorySlugSerializer
     
     def get_queryset(self):
@@ -337,21 +312,7 @@ class CategorySlugDataView(ListAPIView):
             queryset = queryset.filter(slug__iexact=category_slug_param)
         return queryset
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
-class UnplugPublishedPostsWPView(ListAPIView):
+class UnplugPublishedPostsWPView(NoDataListMixin, ListAPIView):
     serializer_class = PostListPublishedSerializer
 
     def get_queryset(self):
@@ -363,21 +324,54 @@ class UnplugPublishedPostsWPView(ListAPIView):
 
         return queryset
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        if not queryset.exists():
-            return Response(
-                {"message": "No Available Data"},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+class UnplugPublishedPostsWPStreamView(APIView):
+    """
+    Streaming ``all-posts/``: the same rows, written incrementally as a JSON
+    array (``?output=ndjson`` for one object per line) so memory stays flat
+    however many posts there are. ``?since=<ISO datetime>`` limits the feed
+    to posts updated after that moment; the ``X-Sync-Until`` header is the
+    value to pass as ``since`` on the next sync.
+    """
+    permission_classes = [AllowAny]
+    chunk_size = 500
+
+    def get(self, request):
+        output_format = request.query_params.get('output', 'json')
+        if output_format not in CONTENT_TYPES:
+            raise ValidationError({'output': f'Choose one of: {", ".join(CONTENT_TYPES)}.'})
+
+        sync_until = timezone.now()
+        # Pin the alias now: the body is produced after the middleware has returned
+        queryset = Post.objects.using(router.db_for_read(Post)).filter(
+            status='published', updated_at__lte=sync_until
+        ).select_related('author', 'category').prefetch_related('tags')
+
+        site_domain_param = request.query_params.get('site_domain', None)
+        if site_domain_param:
+            queryset = queryset.filter(site__domain=site_domain_param)
+
+        since_param = request.query_params.get('since', None)
+        if since_param:
+            since = parse_datetime(since_param.replace(' ', '+'))
+            if since is None:
+                raise ValidationError({'since': 'Use an ISO 8601 datetime.'})
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+            queryset = queryset.filter(updated_at__gt=since).order_by('updated_at', 'id')
+        else:
+            queryset = queryset.order_by('id')
+
+        rows = serialized_rows(queryset, PostListPublishedSerializer, {'request': request}, self.chunk_size)
+        response = streaming_response(request, encode_rows(rows, output_format), output_format)
+        response.headers['X-Sync-Until'] = sync_until.isoformat()
+        return response
+
+class PostRevisionDetailView(RetrieveAPIView):
+    """Staff-only view of a single revision with its content reconstructed"""
+    queryset = PostRevision.objects.select_related('author')
+    serializer_class = PostRevisionDetailSerializer
+    permission_classes = [IsAdminUser]
 
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
-    
 class PostCreateView(generics.CreateAPIView):
     permission_classes = [AllowAny]
     queryset = Post.objects.all()
@@ -4,3 +4,42 @@ from django.apps import AppConfig
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Blog'
+
+    def ready(self):
+        from django.core import checks
+        from django.core.files.storage import default_storage
+        from django.db.models.signals import post_delete , post_migrate , post_save , pre_save
+        from . import snapshots , storage
+        from .cache import bump_content_version
+        from .models import Category , MasterCategory , Post , Tag
+        from .search import repair_search_index
+        from .signals import posts_published
+        from Nativeblog.db import check_database_connections , check_database_settings
+
+        # The database profile is validated on every start; migrate and
+        # `check --database` also connect and compare the live settings
+        checks.register(check_database_settings)
+        checks.register(check_database_connections , checks.Tags.database)
+
+        post_save.connect(bump_content_version , sender=Post , dispatch_uid='blog_post_saved_version')
+        post_delete.connect(bump_content_version , sender=Post , dispatch_uid='blog_post_deleted_version')
+        posts_published.connect(bump_content_version , dispatch_uid='blog_posts_published_version')
+        post_migrate.connect(repair_search_index , sender=self , dispatch_uid='blog_repair_search_index')
+
+        # Static JSON snapshots for the headless frontend (BLOG_SNAPSHOTS_ENABLED)
+        post_save.connect(snapshots.post_saved , sender=Post , dispatch_uid='blog_snapshot_post_saved')
+        post_delete.connect(snapshots.post_deleted , sender=Post , dispatch_uid='blog_snapshot_post_deleted')
+        posts_published.connect(snapshots.posts_published , dispatch_uid='blog_snapshot_posts_published')
+        post_save.connect(snapshots.category_saved , sender=Category , dispatch_uid='blog_snapshot_category_saved')
+        post_delete.connect(snapshots.category_deleted , sender=Category , dispatch_uid='blog_snapshot_category_deleted')
+
+        # Refcounts of content-addressed media blobs
+        if isinstance(default_storage , storage.ContentAddressedStorage):
+            for model in (Post , Category , Tag , MasterCategory):
+                label = model._meta.model_name
+                pre_save.connect(storage.references_before_save , sender=model ,
+                                 dispatch_uid=f'blog_media_refs_before_{label}_saved')
+                post_save.connect(storage.references_after_save , sender=model ,
+                                  dispatch_uid=f'blog_media_refs_{label}_saved')
+                post_delete.connect(storage.references_after_delete , sender=model ,
+                                    dispatch_uid=f'blog_media_refs_{label}_deleted')
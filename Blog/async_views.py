@@ -0,0 +1,125 @@
+# Blog/async_views.py
+"""
+Native async versions of the public read endpoints.
+
+They return the same payloads as their DRF counterparts in api_views.py,
+but fetch with the async ORM and cache rendered responses with the async
+cache API. Under ASGI a single worker can then hold many slow clients
+without tying up a thread each. Relations are always loaded up front, so
+serialization never touches the database.
+"""
+import functools
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .api_views import CustomPagination
+from .cache import acontent_version
+from .models import Post
+from .serializers import (
+    PostListLatestSerializer ,
+    PostListPublishedSerializer ,
+    PostListSlugSerializer
+)
+
+
+def json_response(data , status=200):
+    return HttpResponse(JSONRenderer().render(data) , status=status , content_type='application/json')
+
+
+def no_data_response():
+    return json_response({"message": "No Available Data"} , status=404)
+
+
+def async_cached(view):
+    """Cache rendered responses per URL until the next post change"""
+
+    @functools.wraps(view)
+    async def wrapper(request , *args , **kwargs):
+        timeout = settings.BLOG_ASYNC_CACHE_TIMEOUT
+        url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        key = f'blog:async:{await acontent_version()}:{url_hash}'
+
+        cached = await cache.aget(key) if timeout else None
+        if cached is not None:
+            status , body = cached
+            return HttpResponse(body , status=status , content_type='application/json')
+
+        response = await view(request , *args , **kwargs)
+        if timeout and response.status_code in (200 , 404):
+            await cache.aset(key , (response.status_code , response.content) , timeout)
+        return response
+
+    return wrapper
+
+
+def published_posts_queryset(request):
+    queryset = Post.objects.filter(status='published')
+    site_domain_param = request.GET.get('site_domain')
+    if site_domain_param:
+        queryset = queryset.filter(site__domain=site_domain_param)
+    return queryset
+
+
+@require_safe
+@async_cached
+async def published_posts(request):
+    """Async ``posts/``"""
+    drf_request = Request(request)
+    queryset = published_posts_queryset(request).select_related(
+        'author' , 'category'
+    ).prefetch_related('tags')
+
+    paginator = CustomPagination()
+    try:
+        rows = await paginator.apaginate_queryset(queryset , drf_request)
+    except NotFound as exc:
+        return json_response({'detail': exc.detail} , status=404)
+    if not rows:
+        return no_data_response()
+
+    data = PostListPublishedSerializer(rows , many=True , context={'request': drf_request}).data
+    return json_response(paginator.get_paginated_data(data))
+
+
+@require_safe
+@async_cached
+async def post_detail(request , slug):
+    """Async ``post/<slug>/``"""
+    post = await Post.objects.select_related('author' , 'category').prefetch_related('tags').filter(
+        slug=slug
+    ).afirst()
+    if post is None:
+        return json_response({'detail': 'Not found.'} , status=404)
+
+    data = PostListSlugSerializer(post , context={'request': Request(request)}).data
+    return json_response(data)
+
+
+async def _top_posts(request , order_by , limit):
+    queryset = published_posts_queryset(request).select_related('author' , 'category').order_by(order_by)
+    rows = [post async for post in queryset[:limit].aiterator()]
+    if not rows:
+        return no_data_response()
+    data = PostListLatestSerializer(rows , many=True , context={'request': Request(request)}).data
+    return json_response(data)
+
+
+@require_safe
+@async_cached
+async def latest_posts(request):
+    """Async ``posts-latest/``"""
+    return await _top_posts(request , '-published_at' , 4)
+
+
+@require_safe
+@async_cached
+async def popular_posts(request):
+    """Async ``posts-popular/``"""
+    return await _top_posts(request , '-view_count' , 3)
@@ -0,0 +1,26 @@
+# Blog/cache.py
+from django.core.cache import cache
+
+# Cached API payloads embed this number in their keys; bumping it whenever a
+# post changes retires every cached payload at once.
+CONTENT_VERSION_KEY = 'blog:content-version'
+
+
+def content_version():
+    return cache.get_or_set(CONTENT_VERSION_KEY , 1 , None)
+
+
+async def acontent_version():
+    version = await cache.aget(CONTENT_VERSION_KEY)
+    if version is None:
+        version = 1
+        await cache.aset(CONTENT_VERSION_KEY , version , None)
+    return version
+
+
+def bump_content_version(**kwargs):
+    """Signal receiver for post saves/deletes and scheduled publishing"""
+    try:
+        cache.incr(CONTENT_VERSION_KEY)
+    except ValueError:
+        cache.set(CONTENT_VERSION_KEY , 2 , None)
@@ -0,0 +1,152 @@
+# Blog/feeds.py
+"""
+RSS and Atom feeds per site, category and tag.
+
+Only published posts with ``show_in_feed`` are listed. Every feed has a
+fingerprint (newest ``updated_at`` plus post count) that serves as its ETag
+and Last-Modified. The fingerprint is cached until the next post change,
+so an unchanged poll costs a cache read and a 304. The rendered body is
+cached under its fingerprint, so a post change rebuilds only the feeds
+that post appears in.
+"""
+import hashlib
+
+from django.contrib.sites.models import Site
+from django.contrib.syndication.views import Feed
+from django.core.cache import cache
+from django.db.models import Count , Max
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.feedgenerator import Atom1Feed
+from django.utils.http import http_date
+
+from .cache import content_version
+from .links import post_url
+from .models import Category , Post , Tag
+
+FEED_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+class PostFeed(Feed):
+    """Latest posts of a site, optionally narrowed to a category or a tag"""
+    items_count = 20
+    scope = 'site'
+
+    def get_object(self , request , domain , slug=None):
+        site = get_object_or_404(Site , domain=domain)
+        if self.scope == 'category':
+            return site , get_object_or_404(Category , site=site , slug=slug)
+        if self.scope == 'tag':
+            return site , get_object_or_404(Tag , site=site , slug=slug)
+        return site , None
+
+    def feed_posts(self , obj):
+        site , narrowed_by = obj
+        queryset = Post.objects.filter(site=site , status='published' , show_in_feed=True)
+        if self.scope == 'category':
+            queryset = queryset.filter(category=narrowed_by)
+        elif self.scope == 'tag':
+            queryset = queryset.filter(tags=narrowed_by)
+        return queryset
+
+    def fingerprint(self , obj):
+        """(newest updated_at, post count) of the feed, cached per content version"""
+        site , narrowed_by = obj
+        key = f'blog:feed-state:{content_version()}:{self.scope}:{site.pk}:{getattr(narrowed_by , "pk" , 0)}'
+        state = cache.get(key)
+        if state is None:
+            state = self.feed_posts(obj).aggregate(updated=Max('updated_at') , count=Count('pk'))
+            state = (state['updated'] , state['count'])
+            cache.set(key , state , FEED_CACHE_TIMEOUT)
+        return state
+
+    def __call__(self , request , *args , **kwargs):
+        obj = self.get_object(request , *args , **kwargs)
+        updated , count = self.fingerprint(obj)
+        site , narrowed_by = obj
+        digest = hashlib.md5(
+            f'{self.feed_type.__name__}:{self.scope}:{site.pk}:{getattr(narrowed_by , "pk" , 0)}:'
+            f'{updated.isoformat() if updated else ""}:{count}'.encode()
+        ).hexdigest()
+        etag = f'"{digest}"'
+        last_modified = int(updated.timestamp()) if updated else None
+
+        response = get_conditional_response(request , etag=etag , last_modified=last_modified)
+        if response is None:
+            key = f'blog:feed:{digest}'
+            cached = cache.get(key)
+            if cached is None:
+                rendered = super().__call__(request , *args , **kwargs)
+                cached = (rendered.content , rendered.headers['Content-Type'])
+                cache.set(key , cached , FEED_CACHE_TIMEOUT)
+            response = HttpResponse(cached[0] , content_type=cached[1])
+        response.headers['ETag'] = etag
+        if last_modified is not None:
+            response.headers['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def title(self , obj):
+        site , narrowed_by = obj
+        return f'{site.name} - {narrowed_by.name}' if narrowed_by else site.name
+
+    def link(self , obj):
+        return f'https://{obj[0].domain}/'
+
+    def description(self , obj):
+        site , narrowed_by = obj
+        return getattr(narrowed_by , 'description' , '') or f'Latest posts from {site.name}'
+
+    def items(self , obj):
+        return self.feed_posts(obj).select_related('site' , 'author' , 'category').prefetch_related(
+            'tags'
+        ).order_by('-published_at')[:self.items_count]
+
+    def item_title(self , item):
+        return item.title
+
+    def item_description(self , item):
+        return item.excerpt
+
+    def item_link(self , item):
+        return post_url(item.site.domain , item.slug)
+
+    def item_guid(self , item):
+        return f'{item.site.domain}:post:{item.pk}'
+
+    item_guid_is_permalink = False
+
+    def item_pubdate(self , item):
+        return item.published_at
+
+    def item_updateddate(self , item):
+        return item.updated_at
+
+    def item_author_name(self , item):
+        return item.author.get_full_name() or item.author.username
+
+    def item_categories(self , item):
+        return [item.category.name] + [tag.name for tag in item.tags.all()]
+
+
+class AtomPostFeed(PostFeed):
+    feed_type = Atom1Feed
+
+    def subtitle(self , obj):
+        return self.description(obj)
+
+
+class CategoryFeed(PostFeed):
+    scope = 'category'
+
+
+class CategoryAtomFeed(AtomPostFeed):
+    scope = 'category'
+
+
+class TagFeed(PostFeed):
+    scope = 'tag'
+
+
+class TagAtomFeed(AtomPostFeed):
+    scope = 'tag'
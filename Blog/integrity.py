@@ -0,0 +1,168 @@
+# Blog/integrity.py
+"""
+Offline scan for dangling media and post references.
+
+``scan`` lists ``MEDIA_ROOT`` once into a set and builds a per-site slug
+index, then streams posts through worker processes that parse each body
+and check its ``<img>`` sources, media links and post links against those
+two in-memory indexes. Image fields of posts, categories, tags and master
+categories are checked the same way. Whatever in the listing nothing
+refers to is reported as reclaimable.
+"""
+import collections
+import itertools
+import multiprocessing
+import os
+from urllib.parse import unquote , urljoin , urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import FileField
+
+from .analysis import analyze_html
+from .links import link_edges , post_url
+
+Problem = collections.namedtuple('Problem' , ['label' , 'pk' , 'source' , 'reference' , 'kind'])
+ScanResult = collections.namedtuple('ScanResult' , ['problems' , 'referenced' , 'unreferenced' , 'files' , 'posts'])
+
+# ckeditor_uploader's pillow backend writes "<name>_thumb.<ext>" next to each upload
+THUMBNAIL_SUFFIX = '_thumb'
+
+# Per-worker state, set once by the pool initializer
+_worker = {}
+
+
+def media_listing(root=None):
+    """Every file under ``root`` (``MEDIA_ROOT``) as a set of storage names"""
+    root = os.fspath(root or settings.MEDIA_ROOT)
+    files = set()
+    for directory , directories , names in os.walk(root):
+        directories[:] = [name for name in directories if not name.startswith('.')]
+        relative = os.path.relpath(directory , root)
+        prefix = '' if relative == '.' else relative.replace(os.sep , '/') + '/'
+        files.update(prefix + name for name in names if not name.startswith('.'))
+    return files
+
+
+def media_name(url , domain=None):
+    """Storage name for a media URL on ``domain`` (or relative), else ``None``"""
+    parts = urlsplit(url)
+    if parts.netloc and parts.hostname not in (domain , f'www.{domain}'):
+        return None
+    path = unquote(parts.path)
+    media_url = urlsplit(settings.MEDIA_URL).path
+    if not path.startswith(media_url):
+        return None
+    return path[len(media_url):] or None
+
+
+def thumbnail_name(name):
+    base , extension = os.path.splitext(name)
+    return f'{base}{THUMBNAIL_SUFFIX}{extension}'
+
+
+def image_field_names(model):
+    return [field.name for field in model._meta.get_fields() if isinstance(field , FileField)]
+
+
+def _init_worker(files , slugs , domains):
+    _worker.update(files=files , slugs=slugs , domains=domains)
+
+
+def check_posts(rows):
+    """
+    Check ``(pk, site_id, slug, content)`` rows against the worker's
+    indexes. Returns ``(rows checked, problems, referenced media names)``.
+    """
+    files , slugs , domains = _worker['files'] , _worker['slugs'] , _worker['domains']
+    problems , referenced = [] , set()
+    for pk , site_id , slug , content in rows:
+        domain = domains.get(site_id)
+        stats = analyze_html(content , domain)
+        base = post_url(domain or '' , slug)
+        urls = stats.image_sources + [href for href , _ in stats.internal_links]
+        for name in filter(None , (media_name(urljoin(base , url) , domain) for url in urls)):
+            referenced.add(name)
+            if name not in files:
+                problems.append(Problem('Blog.Post' , pk , 'content' , name , 'missing media'))
+        for target , _ in link_edges(slug , stats.internal_links):
+            if target not in slugs.get(site_id , ()):
+                problems.append(Problem('Blog.Post' , pk , 'content' , target , 'missing post'))
+    return len(rows) , problems , referenced
+
+
+def _field_references(files):
+    """Check the image fields of every model that has one"""
+    from .models import Category , MasterCategory , Post , Tag
+
+    problems , referenced = [] , set()
+    for model in (Post , Category , Tag , MasterCategory):
+        names = image_field_names(model)
+        for row in model.objects.values_list('pk' , *names).iterator():
+            for field , name in zip(names , row[1:]):
+                if not name:
+                    continue
+                referenced.add(name)
+                if name not in files:
+                    problems.append(Problem(model._meta.label , row[0] , field , name , 'missing media'))
+    return problems , referenced
+
+
+def _chunks(iterable , size):
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator , size)):
+        yield chunk
+
+
+def scan(processes=None , batch_size=200 , root=None):
+    """Check every post and image field; see the module docstring"""
+    from django.contrib.sites.models import Site
+    from .models import Post
+
+    files = media_listing(root)
+    slugs = collections.defaultdict(set)
+    for site_id , slug in Post.objects.values_list('site_id' , 'slug').iterator():
+        slugs[site_id].add(slug)
+    domains = dict(Site.objects.values_list('pk' , 'domain'))
+
+    problems , referenced = _field_references(files)
+    rows = _chunks(Post.objects.order_by('pk').values_list('pk' , 'site_id' , 'slug' , 'content').iterator(
+        chunk_size=batch_size
+    ) , batch_size)
+    initargs = (files , dict(slugs) , domains)
+
+    posts = 0
+
+    def collect(result):
+        nonlocal posts , referenced
+        posts += result[0]
+        problems.extend(result[1])
+        referenced |= result[2]
+
+    processes = processes or os.cpu_count() or 1
+    if processes > 1:
+        # Workers never query; don't let them inherit open connections
+        connections.close_all()
+        with multiprocessing.Pool(processes , _init_worker , initargs) as pool:
+            # Rows are read here, on this thread's connection, with a bounded
+            # number of chunks in flight
+            pending = collections.deque()
+            for chunk in rows:
+                pending.append(pool.apply_async(check_posts , (chunk ,)))
+                if len(pending) >= processes * 2:
+                    collect(pending.popleft().get())
+            while pending:
+                collect(pending.popleft().get())
+    else:
+        _init_worker(*initargs)
+        for chunk in rows:
+            collect(check_posts(chunk))
+
+    referenced |= {thumbnail_name(name) for name in referenced}
+    return ScanResult(
+        problems=sorted(problems) ,
+        referenced=referenced ,
+        unreferenced=sorted(files - referenced) ,
+        files=len(files) ,
+        posts=posts ,
+    )
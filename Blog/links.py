@@ -0,0 +1,210 @@
+# Blog/links.py
+"""
+The internal link graph between posts.
+
+Every full ``Post.save`` replaces the post's rows in ``PostLink`` with the
+internal links of its content that match the frontend's post URL
+(``BLOG_POST_URL``, ``https://{domain}/post/{slug}/`` by default), and
+re-points links elsewhere that name the post's slug. The reports below read
+only that table, never the HTML.
+"""
+import functools
+import re
+from collections import defaultdict
+from urllib.parse import urljoin , urlsplit
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count , Exists , OuterRef , Q
+
+from .analysis import analyze_html
+
+DEFAULT_POST_URL = 'https://{domain}/post/{slug}/'
+ANCHOR_TEXT_LENGTH = 255
+
+
+def post_url(domain , slug):
+    return getattr(settings , 'BLOG_POST_URL' , DEFAULT_POST_URL).format(domain=domain , slug=slug)
+
+
+@functools.lru_cache(maxsize=8)
+def _path_pattern(template):
+    before , _ , after = urlsplit(template).path.partition('{slug}')
+    return re.compile(f'^{re.escape(before)}(?P<slug>[-\\w]+){re.escape(after.rstrip("/"))}/?$')
+
+
+def slug_from_href(href , base_path='/'):
+    """The post slug an internal ``href`` points at, or ``None`` for any other page"""
+    path = urlsplit(urljoin(base_path , href)).path
+    match = _path_pattern(getattr(settings , 'BLOG_POST_URL' , DEFAULT_POST_URL)).match(path)
+    return match.group('slug') if match else None
+
+
+def link_edges(slug , internal_links):
+    """Distinct ``(target slug, anchor text)`` pairs for ``ContentStats.internal_links``"""
+    base_path = urlsplit(post_url('' , slug)).path
+    edges = {}
+    for href , anchor in internal_links:
+        target = slug_from_href(href , base_path)
+        if target is not None and target != slug:
+            edges.setdefault((target , anchor[:ANCHOR_TEXT_LENGTH]) , None)
+    return list(edges)
+
+
+def sync_post_links(post):
+    """Replace ``post``'s outgoing links and resolve links that name its slug"""
+    from .models import Post , PostLink
+
+    edges = link_edges(post.slug , post.content_stats().internal_links)
+    resolved = dict(Post.objects.filter(
+        site_id=post.site_id , slug__in={target for target , _ in edges}
+    ).values_list('slug' , 'pk')) if edges else {}
+
+    with transaction.atomic():
+        PostLink.objects.filter(source=post).delete()
+        PostLink.objects.bulk_create([
+            PostLink(source=post , target_id=resolved.get(target) , target_slug=target , anchor_text=anchor)
+            for target , anchor in edges
+        ])
+        # A new or renamed post fixes links to its slug and breaks links to its old one
+        PostLink.objects.filter(
+            source__site_id=post.site_id , target_slug=post.slug , target__isnull=True
+        ).update(target=post)
+        PostLink.objects.filter(target=post).exclude(target_slug=post.slug).update(target=None)
+
+
+def rebuild_link_graph(posts , batch_size=500):
+    """
+    Re-extract the links of ``posts`` (a ``Post`` queryset), e.g. after a
+    bulk import that skipped ``save()``. Targets are resolved against one
+    slug index per site. Returns the number of links written.
+    """
+    from .models import Post , PostLink
+
+    using = posts.db
+    domains = dict(posts.values_list('site_id' , 'site__domain').distinct())
+    slug_index = defaultdict(dict)
+    site_posts = Post.objects.using(using).filter(site_id__in=domains)
+    for site_id , slug , pk in site_posts.values_list('site_id' , 'slug' , 'pk'):
+        slug_index[site_id][slug] = pk
+
+    written = 0
+    rows = posts.order_by('pk').values_list('pk' , 'site_id' , 'slug' , 'content')
+    batch_ids , links = [] , []
+
+    def flush():
+        with transaction.atomic(using=using):
+            PostLink.objects.using(using).filter(source_id__in=batch_ids).delete()
+            PostLink.objects.using(using).bulk_create(links)
+        return len(links)
+
+    for pk , site_id , slug , content in rows.iterator(chunk_size=batch_size):
+        stats = analyze_html(content , domains[site_id])
+        batch_ids.append(pk)
+        links.extend(
+            PostLink(source_id=pk , target_id=slug_index[site_id].get(target) , target_slug=target ,
+                     anchor_text=anchor)
+            for target , anchor in link_edges(slug , stats.internal_links)
+        )
+        if len(batch_ids) >= batch_size:
+            written += flush()
+            batch_ids , links = [] , []
+    if batch_ids:
+        written += flush()
+    return written
+
+
+# Reports
+
+def _published_links(site=None):
+    from .models import PostLink
+
+    links = PostLink.objects.filter(source__status='published')
+    return links.filter(source__site=site) if site is not None else links
+
+
+def orphan_posts(site=None):
+    """Published posts no other published post links to"""
+    from .models import Post
+
+    posts = Post.objects.filter(status='published')
+    if site is not None:
+        posts = posts.filter(site=site)
+    return posts.exclude(Exists(_published_links().filter(target=OuterRef('pk'))))
+
+
+def broken_links(site=None):
+    """Links from published posts to a slug with no post, or to an unpublished post"""
+    return _published_links(site).filter(
+        Q(target__isnull=True) | ~Q(target__status='published')
+    ).select_related('source__site' , 'target')
+
+
+def most_linked(site=None):
+    """Published posts by the number of published posts linking to them"""
+    from .models import Post
+
+    posts = Post.objects.filter(status='published')
+    if site is not None:
+        posts = posts.filter(site=site)
+    return posts.annotate(
+        incoming=Count('incoming_links__source' , distinct=True ,
+                       filter=Q(incoming_links__source__status='published'))
+    ).filter(incoming__gt=0).order_by('-incoming' , 'pk')
+
+
+def link_scores(site , damping=0.85 , iterations=100 , tolerance=1e-8):
+    """
+    PageRank over the published posts of ``site``: ``{post id: score}``,
+    scores summing to 1. Uses NumPy when it is installed.
+    """
+    from .models import Post
+
+    ids = list(Post.objects.filter(site=site , status='published').order_by('pk').values_list('pk' , flat=True))
+    if not ids:
+        return {}
+    position = {pk: index for index , pk in enumerate(ids)}
+    edges = {
+        (position[source] , position[target])
+        for source , target in _published_links(site).filter(target__in=ids).values_list('source_id' , 'target_id')
+        if source != target
+    }
+    try:
+        import numpy
+    except ImportError:
+        return dict(zip(ids , _power_iteration(len(ids) , edges , damping , iterations , tolerance)))
+
+    count = len(ids)
+    sources = numpy.fromiter((source for source , _ in edges) , dtype=numpy.intp , count=len(edges))
+    targets = numpy.fromiter((target for _ , target in edges) , dtype=numpy.intp , count=len(edges))
+    out_degree = numpy.bincount(sources , minlength=count).astype(float)
+    dangling = out_degree == 0
+    weights = 1.0 / out_degree[sources]
+    scores = numpy.full(count , 1.0 / count)
+    for _ in range(iterations):
+        spread = numpy.bincount(targets , weights=scores[sources] * weights , minlength=count)
+        updated = (1 - damping) / count + damping * (spread + scores[dangling].sum() / count)
+        converged = numpy.abs(updated - scores).sum() < tolerance
+        scores = updated
+        if converged:
+            break
+    return dict(zip(ids , scores.tolist()))
+
+
+def _power_iteration(count , edges , damping , iterations , tolerance):
+    outgoing = defaultdict(list)
+    for source , target in edges:
+        outgoing[source].append(target)
+    scores = [1.0 / count] * count
+    for _ in range(iterations):
+        dangling = sum(scores[node] for node in range(count) if node not in outgoing)
+        updated = [(1 - damping) / count + damping * dangling / count] * count
+        for source , targets in outgoing.items():
+            share = damping * scores[source] / len(targets)
+            for target in targets:
+                updated[target] += share
+        converged = sum(abs(new - old) for new , old in zip(updated , scores)) < tolerance
+        scores = updated
+        if converged:
+            break
+    return scores
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client, override_settings
+
+from Blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Compare the sync DRF read endpoints with their native async variants in-process'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--cache', action='store_true', help='Let the async variants use their response cache')
+
+    def handle(self, *args, **options):
+        post = Post.objects.filter(status='published').only('slug').first()
+        if post is None:
+            raise CommandError('Need at least one published post to benchmark against.')
+
+        endpoints = [
+            ('posts', '/api/posts/', '/api/async/posts/'),
+            ('post detail', f'/api/post/{post.slug}/', f'/api/async/post/{post.slug}/'),
+            ('posts-latest', '/api/posts-latest/', '/api/async/posts-latest/'),
+            ('posts-popular', '/api/posts-popular/', '/api/async/posts-popular/'),
+        ]
+        cache_timeout = 60 if options['cache'] else 0
+        # The test clients send ``Host: testserver``
+        allowed_hosts = [*settings.ALLOWED_HOSTS, 'testserver']
+        with override_settings(ALLOWED_HOSTS=allowed_hosts, BLOG_ASYNC_CACHE_TIMEOUT=cache_timeout):
+            for name, sync_url, async_url in endpoints:
+                sync_rate = self.run_sync(sync_url, options['requests'], options['concurrency'])
+                async_rate = asyncio.run(self.run_async(async_url, options['requests'], options['concurrency']))
+                self.stdout.write(
+                    f'{name:<14} sync {sync_rate:8.1f} req/s   async {async_rate:8.1f} req/s   '
+                    f'({async_rate / sync_rate:.2f}x)'
+                )
+
+    def run_sync(self, url, total, concurrency):
+        client = Client()
+        self.check_response(url, client.get(url))
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(lambda _: client.get(url), range(total)))
+        return total / (time.perf_counter() - started)
+
+    async def run_async(self, url, total, concurrency):
+        client = AsyncClient()
+        self.check_response(url, await client.get(url))
+        limit = asyncio.Semaphore(concurrency)
+
+        async def fetch():
+            async with limit:
+                await client.get(url)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch() for _ in range(total)))
+        return total / (time.perf_counter() - started)
+
+    def check_response(self, url, response):
+        if response.status_code != 200:
+            raise CommandError(f'{url} answered {response.status_code}; refusing to benchmark an error page.')
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from Blog.integrity import scan
+
+
+class Command(BaseCommand):
+    help = (
+        'Scan all posts, categories and tags for missing media files and links to missing posts, '
+        'and list media files nothing refers to'
+    )
+
+    def add_arguments(self , parser):
+        parser.add_argument('--processes' , type=int , default=0 , help='Worker processes (default: one per CPU)')
+        parser.add_argument('--batch-size' , type=int , default=200 , help='Posts per worker task')
+        parser.add_argument('--unreferenced' , action='store_true' , help='Also list every unreferenced file')
+
+    def handle(self , *args , **options):
+        result = scan(processes=options['processes'] or None , batch_size=options['batch_size'])
+
+        for problem in result.problems:
+            self.stdout.write(f'{problem.label} #{problem.pk} {problem.source}: {problem.kind} {problem.reference}')
+        if options['unreferenced']:
+            for name in result.unreferenced:
+                self.stdout.write(f'unreferenced {name}')
+
+        summary = (
+            f'{result.posts} post(s) and {result.files} media file(s) checked: '
+            f'{len(result.problems)} dangling reference(s), {len(result.unreferenced)} unreferenced file(s)'
+        )
+        self.stdout.write(self.style.WARNING(summary) if result.problems else self.style.SUCCESS(summary))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from Nativeblog.db import describe_connection
+
+
+class Command(BaseCommand):
+    help = 'Connect to each configured database and report the settings it is running with'
+
+    def handle(self, *args, **options):
+        for alias in connections:
+            try:
+                report = describe_connection(connections[alias])
+            except Exception as exc:
+                raise CommandError(f'Database "{alias}" is unreachable: {exc}')
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'[{alias}]'))
+            for key, value in report.items():
+                self.stdout.write(f'  {key}: {value}')
+            if report['vendor'] == 'sqlite' and report.get('journal_mode') != 'wal':
+                self.stdout.write(self.style.WARNING('  WAL is not active; concurrent writers will block readers'))
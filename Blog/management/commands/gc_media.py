@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from Blog.media_gc import candidates , collect , quarantine_root , reference_index
+
+
+class Command(BaseCommand):
+    help = (
+        'Quarantine (or delete) uploaded media files that no post, category, tag, master category '
+        'or revision refers to and that are older than the grace period'
+    )
+
+    def add_arguments(self , parser):
+        parser.add_argument('--grace-days' , type=float , default=7 ,
+                            help='Leave files modified more recently than this alone')
+        parser.add_argument('--dry-run' , action='store_true' , help='Only list what would be collected')
+        parser.add_argument('--delete' , action='store_true' , help='Delete instead of moving to the quarantine')
+        parser.add_argument('--batch-size' , type=int , default=100)
+        parser.add_argument('--processes' , type=int , default=0 ,
+                            help='Worker processes for the content scan (default: one per CPU)')
+
+    def handle(self , *args , **options):
+        referenced = reference_index(processes=options['processes'] or None)
+        found = candidates(referenced , timedelta(days=options['grace_days']))
+        total = sum(candidate.size for candidate in found)
+
+        if options['dry_run'] or not found:
+            for candidate in found:
+                self.stdout.write(f'{candidate.name}\t{candidate.size}')
+            self.stdout.write(self.style.SUCCESS(
+                f'{len(found)} unreferenced file(s), {total} byte(s) could be reclaimed'
+            ))
+            return
+
+        done = 0
+
+        def report(batch):
+            nonlocal done
+            done += len(batch)
+            self.stdout.write(f'  {done}/{len(found)} file(s) processed')
+
+        reclaimed = collect(found , delete=options['delete'] , batch_size=options['batch_size'] , on_batch=report)
+        where = 'deleted' if options['delete'] else f'moved to {quarantine_root()}'
+        self.stdout.write(self.style.SUCCESS(f'{len(found)} file(s) {where}, {reclaimed} byte(s) reclaimed'))
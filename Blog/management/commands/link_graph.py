@@ -0,0 +1,46 @@
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand , CommandError
+
+from Blog.links import broken_links , link_scores , most_linked , orphan_posts , rebuild_link_graph
+from Blog.models import Post
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the internal link graph or report orphan posts, broken links, most linked posts and link scores'
+
+    def add_arguments(self , parser):
+        parser.add_argument('action' , choices=['rebuild' , 'orphans' , 'broken' , 'most-linked' , 'scores'])
+        parser.add_argument('--site' , help='Only this domain (required for scores)')
+        parser.add_argument('--limit' , type=int , default=50 , help='Rows to print (0 for all)')
+        parser.add_argument('--batch-size' , type=int , default=500)
+
+    def handle(self , *args , **options):
+        site = None
+        if options['site']:
+            site = Site.objects.filter(domain=options['site']).first()
+            if site is None:
+                raise CommandError(f'Site with domain "{options["site"]}" does not exist.')
+        limit = options['limit'] or None
+
+        if options['action'] == 'rebuild':
+            posts = Post.objects.filter(site=site) if site else Post.objects.all()
+            written = rebuild_link_graph(posts , batch_size=options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Stored {written} internal link(s)'))
+        elif options['action'] == 'orphans':
+            for post in orphan_posts(site).select_related('site').order_by('site' , 'slug')[:limit]:
+                self.stdout.write(f'{post.site.domain}\t{post.slug}')
+        elif options['action'] == 'broken':
+            for link in broken_links(site).order_by('source__site' , 'source__slug')[:limit]:
+                reason = 'unpublished' if link.target_id else 'missing'
+                self.stdout.write(f'{link.source.site.domain}\t{link.source.slug}\t-> {link.target_slug} ({reason})')
+        elif options['action'] == 'most-linked':
+            for post in most_linked(site).select_related('site')[:limit]:
+                self.stdout.write(f'{post.incoming}\t{post.site.domain}\t{post.slug}')
+        else:
+            if site is None:
+                raise CommandError('Link scores are computed per site; pass --site.')
+            scores = link_scores(site)
+            slugs = dict(Post.objects.filter(pk__in=scores).values_list('pk' , 'slug'))
+            ranked = sorted(scores.items() , key=lambda item: item[1] , reverse=True)
+            for post_id , score in ranked[:limit]:
+                self.stdout.write(f'{score:.5f}\t{slugs[post_id]}')
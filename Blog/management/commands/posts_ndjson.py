@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+import time
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from Blog.models import Post
+from Blog.transfer import CONFLICT_CHOICES, PostImporter, export_posts
+
+
+class Command(BaseCommand):
+    help = (
+        'Stream posts (with tags, categories, revisions and media paths) to or from an NDJSON file, '
+        'e.g. to move content between sites or databases. Media files are not copied.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['import', 'export'])
+        parser.add_argument('path', help='NDJSON file, or "-" for stdin/stdout')
+        parser.add_argument('--site', help='Export: only this domain. Import: load every post into this domain')
+        parser.add_argument('--database', default='default', help='Database alias to read from or write to')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--no-revisions', action='store_true', help='Leave revision history out')
+        parser.add_argument('--on-conflict', choices=CONFLICT_CHOICES, default='skip',
+                            help='What to do with a post whose slug is already taken on the target site')
+        parser.add_argument('--default-author', help='Username for posts whose author does not exist')
+        parser.add_argument('--checkpoint', help='JSON file recording progress; an existing one is resumed')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        site = None
+        if options['site']:
+            try:
+                site = Site.objects.using(using).get(domain=options['site'])
+            except Site.DoesNotExist:
+                raise CommandError(f'Site with domain "{options["site"]}" does not exist.')
+
+        if options['checkpoint'] and options['path'] == '-':
+            raise CommandError('Checkpoints need a file path, not "-".')
+        checkpoint = self.read_checkpoint(options['checkpoint'], options['action'])
+
+        started = time.monotonic()
+        if options['action'] == 'export':
+            self.export_ndjson(options, site, using, checkpoint)
+        else:
+            self.import_ndjson(options, site, using, checkpoint)
+        self.stderr.write(f'Finished in {time.monotonic() - started:.1f}s')
+
+    def read_checkpoint(self, path, action):
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as handle:
+            checkpoint = json.load(handle)
+        if checkpoint.get('action') != action:
+            raise CommandError(f'Checkpoint {path} belongs to an {checkpoint.get("action")}, not an {action}.')
+        return checkpoint
+
+    def write_checkpoint(self, path, state):
+        if not path:
+            return
+        temporary = f'{path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as handle:
+            json.dump(state, handle)
+        os.replace(temporary, path)
+
+    def clear_checkpoint(self, path):
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def _open(self, path, mode):
+        if path == '-':
+            return sys.stdin if mode == 'r' else sys.stdout
+        return open(path, mode, encoding='utf-8')
+
+    def export_ndjson(self, options, site, using, checkpoint):
+        queryset = Post.objects.using(using).all()
+        if site:
+            queryset = queryset.filter(site=site)
+        last_id = checkpoint['last_id'] if checkpoint else 0
+        queryset = queryset.filter(pk__gt=last_id)
+
+        # Resuming appends after the last post the checkpoint vouches for,
+        # dropping whatever was written past it before the interruption
+        handle = self._open(options['path'], 'a' if checkpoint else 'w')
+        if checkpoint:
+            handle.truncate(checkpoint['offset'])
+        written = checkpoint['written'] if checkpoint else 0
+        try:
+            for post_id in export_posts(queryset, handle, options['batch_size'], not options['no_revisions']):
+                written += 1
+                if options['checkpoint'] and written % options['batch_size'] == 0:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                    self.write_checkpoint(options['checkpoint'], {
+                        'action': 'export', 'last_id': post_id, 'written': written, 'offset': handle.tell()
+                    })
+        finally:
+            if handle is not sys.stdout:
+                handle.close()
+
+        self.clear_checkpoint(options['checkpoint'])
+        self.stderr.write(self.style.SUCCESS(f'Exported {written} post(s)'))
+
+    def import_ndjson(self, options, site, using, checkpoint):
+        default_author = None
+        if options['default_author']:
+            try:
+                default_author = User.objects.using(using).get(username=options['default_author'])
+            except User.DoesNotExist:
+                raise CommandError(f'User "{options["default_author"]}" does not exist.')
+
+        importer = PostImporter(
+            site=site,
+            on_conflict=options['on_conflict'],
+            default_author=default_author,
+            revisions=not options['no_revisions'],
+            using=using
+        )
+        done = 0
+        if checkpoint:
+            done = checkpoint['line']
+            importer.created, importer.updated, importer.skipped = checkpoint['counts']
+            importer.pending_related = checkpoint['pending_related']
+            importer.imported_sites = checkpoint['sites']
+
+        def save_progress(line):
+            self.write_checkpoint(options['checkpoint'], {
+                'action': 'import',
+                'line': line,
+                'counts': [importer.created, importer.updated, importer.skipped],
+                'pending_related': importer.pending_related,
+                'sites': importer.imported_sites,
+            })
+
+        handle = self._open(options['path'], 'r')
+        batch, line = [], 0
+        try:
+            for line, text in enumerate(handle, start=1):
+                if line <= done or not text.strip():
+                    continue
+                batch.append(json.loads(text))
+                if len(batch) >= options['batch_size']:
+                    self.import_batch(importer, batch, line)
+                    save_progress(line)
+                    batch = []
+            if batch:
+                self.import_batch(importer, batch, line)
+                save_progress(line)
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+
+        unresolved = importer.finish()
+        self.clear_checkpoint(options['checkpoint'])
+        if unresolved:
+            self.stderr.write(self.style.WARNING(f'{unresolved} related post link(s) pointed at missing posts'))
+        self.stderr.write(self.style.SUCCESS(
+            f'Created {importer.created}, updated {importer.updated}, skipped {importer.skipped} post(s)'
+        ))
+
+    def import_batch(self, importer, batch, line):
+        try:
+            importer.import_batch(batch)
+        except (KeyError, ValueError) as e:
+            raise CommandError(f'Batch ending at line {line} failed: {e}')
+        self.stderr.write(f'  {line} line(s) read, {importer.created} created')
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Blog.publishing import publish_due_posts
+
+
+class Command(BaseCommand):
+    help = 'Publish scheduled posts whose publish date has passed'
+
+    def add_arguments(self , parser):
+        parser.add_argument('--batch-size' , type=int , default=100 ,
+                            help='Posts published (and invalidated) per batch')
+        parser.add_argument('--loop' , action='store_true' ,
+                            help='Keep running and poll the due queue')
+        parser.add_argument('--interval' , type=int , default=60 ,
+                            help='Seconds between polls when --loop is set')
+
+    def handle(self , *args , **options):
+        while True:
+            published = publish_due_posts(batch_size=options['batch_size'])
+            if published or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Published {published} scheduled post(s)'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
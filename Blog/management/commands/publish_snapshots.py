@@ -0,0 +1,25 @@
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+
+from Blog.snapshots import SnapshotPublisher, snapshot_root
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the static JSON snapshots of every site (or one) and prune stale files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--site', help='Only rebuild this domain')
+        parser.add_argument('--root', help='Snapshot directory (defaults to BLOG_SNAPSHOT_ROOT)')
+
+    def handle(self, *args, **options):
+        sites = Site.objects.all()
+        if options['site']:
+            sites = sites.filter(domain=options['site'])
+            if not sites.exists():
+                raise CommandError(f'Site with domain "{options["site"]}" does not exist.')
+
+        root = options['root'] or snapshot_root()
+        for site in sites:
+            touched = SnapshotPublisher(site, root=root).rebuild()
+            self.stdout.write(f'{site.domain}: {len(touched)} snapshot(s) written or removed')
+        self.stdout.write(self.style.SUCCESS(f'Snapshots are in {root}'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from Blog.storage import recount
+
+
+class Command(BaseCommand):
+    help = 'Recompute the refcount of every content-addressed media blob from the posts, categories and tags'
+
+    def handle(self , *args , **options):
+        self.stdout.write(self.style.SUCCESS(f'Recounted {recount()} blob(s)'))
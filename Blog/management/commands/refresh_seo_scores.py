@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from Blog.models import Post
+
+STORED_FIELDS = [
+    'seo_score' , 'estimated_reading_time' , 'word_count' , 'character_count' ,
+    'internal_link_count' , 'external_link_count' , 'image_count' , 'rendered_content' , 'toc'
+]
+
+
+class Command(BaseCommand):
+    help = 'Recompute the rendered content, content statistics and SEO score of every post (or only those without them)'
+
+    def add_arguments(self , parser):
+        parser.add_argument('--missing' , action='store_true' ,
+                            help='Only refresh posts that have no stored score, statistics or rendered content yet')
+        parser.add_argument('--batch-size' , type=int , default=500)
+
+    def handle(self , *args , **options):
+        posts = Post.objects.select_related('site' , 'author').order_by('pk')
+        if options['missing']:
+            posts = posts.filter(Q(seo_score__isnull=True) | Q(word_count__isnull=True) | Q(rendered_content=''))
+
+        batch , updated = [] , 0
+        for post in posts.iterator(chunk_size=options['batch_size']):
+            post.render_content()
+            post.update_content_stats()
+            post.seo_score = post.get_seo_health()['score']
+            batch.append(post)
+            if len(batch) >= options['batch_size']:
+                updated += Post.objects.bulk_update(batch , STORED_FIELDS)
+                batch = []
+        if batch:
+            updated += Post.objects.bulk_update(batch , STORED_FIELDS)
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {updated} post(s)'))
@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a fresh worker does before serving its first request
+STARTUP_CODE = 'import django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns'
+SETUP_CODE = 'import django; django.setup()'
+
+
+def parse_importtime(output):
+    """``(module, self us, cumulative us)`` for each line ``-X importtime`` wrote"""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # The "self [us] | cumulative | imported package" header
+            continue
+        modules.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return modules
+
+
+class Command(BaseCommand):
+    help = (
+        'Start a fresh interpreter under -X importtime, set Django up and load the URLconf, '
+        'and report where the import time went'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=15, help='Rows per table')
+        parser.add_argument('--no-urls', action='store_true', help='Stop after django.setup()')
+        parser.add_argument(
+            '--budget', type=float, default=None,
+            help='Fail if imports take longer than this many milliseconds in total',
+        )
+
+    def handle(self, *args, **options):
+        environment = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', SETUP_CODE if options['no_urls'] else STARTUP_CODE],
+            cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True,
+        )
+        if result.returncode:
+            raise CommandError(f'Startup failed:\n{result.stderr[-2000:]}')
+
+        modules = parse_importtime(result.stderr)
+        total = sum(own for _, own, _ in modules)
+        packages = defaultdict(lambda: [0, 0])
+        for name, own, _ in modules:
+            package = packages[name.split('.')[0]]
+            package[0] += own
+            package[1] += 1
+
+        self.stdout.write(f'{len(modules)} modules imported in {total / 1000:.1f} ms\n')
+        self.stdout.write(f'{"package":<32} {"ms":>9} {"share":>7} {"modules":>8}')
+        ranked = sorted(packages.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (own, count) in ranked[:options['limit']]:
+            self.stdout.write(f'{name:<32} {own / 1000:9.1f} {own / max(total, 1):7.1%} {count:8}')
+
+        self.stdout.write(f'\n{"slowest modules (cumulative)":<48} {"ms":>9}')
+        for name, _, cumulative in sorted(modules, key=lambda module: module[2], reverse=True)[:options['limit']]:
+            self.stdout.write(f'{name:<48} {cumulative / 1000:9.1f}')
+
+        budget = options['budget']
+        if budget is not None:
+            if total / 1000 > budget:
+                raise CommandError(f'Imports took {total / 1000:.1f} ms, over the {budget:.0f} ms budget.')
+            self.stdout.write(self.style.SUCCESS(f'\nWithin the {budget:.0f} ms budget.'))
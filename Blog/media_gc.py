@@ -0,0 +1,125 @@
+# Blog/media_gc.py
+"""
+Garbage collection of media files nothing refers to any more.
+
+The reference index is every storage name in an image field of a post,
+category, tag or master category, in an ``<img>``/link of a post body (both
+from ``integrity.scan``), or in a stored revision, so restoring an old
+revision never finds its images gone. Only files under the image fields'
+``upload_to`` directories and ``CKEDITOR_UPLOAD_PATH`` are candidates, and
+only once they are older than the grace period, which also covers uploads
+whose post has not been saved yet. Candidates are moved to
+``BLOG_MEDIA_QUARANTINE`` (or deleted) in batches.
+"""
+import collections
+import os
+import shutil
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.utils import timezone
+
+from .analysis import analyze_html
+from .integrity import image_field_names , media_listing , media_name , scan , thumbnail_name
+from .links import post_url
+from .revisions import inserted_text
+
+Candidate = collections.namedtuple('Candidate' , ['name' , 'size' , 'modified'])
+
+
+def quarantine_root():
+    return Path(getattr(settings , 'BLOG_MEDIA_QUARANTINE' , Path(settings.BASE_DIR) / 'media-quarantine'))
+
+
+def managed_prefixes():
+    """Media directories the blog uploads into; nothing outside them is collected"""
+    from .models import Category , MasterCategory , Post , Tag
+
+    prefixes = {getattr(settings , 'CKEDITOR_UPLOAD_PATH' , 'uploads/')}
+    for model in (Post , Category , Tag , MasterCategory):
+        for name in image_field_names(model):
+            upload_to = model._meta.get_field(name).upload_to
+            if isinstance(upload_to , str):
+                prefixes.add(upload_to)
+    return tuple(sorted(prefix.rstrip('/') + '/' for prefix in prefixes if prefix))
+
+
+def revision_references(batch_size=500):
+    """Media names in revision snapshots and in the text revision deltas insert"""
+    from .models import PostRevision
+
+    referenced = set()
+    rows = PostRevision.objects.values_list(
+        'post__site__domain' , 'post__slug' , 'is_snapshot' , 'content' , 'content_delta'
+    ).order_by('pk')
+    for domain , slug , is_snapshot , content , delta in rows.iterator(chunk_size=batch_size):
+        text = content if is_snapshot else inserted_text(delta) if delta else ''
+        stats = analyze_html(text , domain)
+        base = post_url(domain , slug)
+        for url in stats.image_sources + [href for href , _ in stats.internal_links]:
+            name = media_name(urljoin(base , url) , domain)
+            if name:
+                referenced.add(name)
+    return referenced
+
+
+def reference_index(processes=None , batch_size=200):
+    """Every media name something refers to, thumbnails of referenced images included"""
+    referenced = scan(processes=processes , batch_size=batch_size).referenced | revision_references()
+    return referenced | {thumbnail_name(name) for name in referenced}
+
+
+def candidates(referenced , grace_period , root=None):
+    """Unreferenced managed files last modified before ``grace_period`` ago, oldest first"""
+    root = Path(root or settings.MEDIA_ROOT)
+    prefixes = managed_prefixes()
+    cutoff = time.time() - grace_period.total_seconds()
+    from .models import MediaBlob
+
+    # A blob something still counts a reference to is never a candidate
+    referenced = referenced | set(MediaBlob.objects.filter(refcount__gt=0).values_list('name' , flat=True))
+    found = []
+    for name in media_listing(root) - referenced:
+        if not name.startswith(prefixes):
+            continue
+        try:
+            stat = os.stat(root / name)
+        except FileNotFoundError:
+            continue
+        if stat.st_mtime < cutoff:
+            found.append(Candidate(name , stat.st_size , stat.st_mtime))
+    return sorted(found , key=lambda candidate: (candidate.modified , candidate.name))
+
+
+def collect(found , delete=False , root=None , batch_size=100 , on_batch=None):
+    """
+    Quarantine (or delete) the ``candidates`` in batches; ``on_batch`` is
+    called with each finished batch. Quarantined files keep their media
+    path under a per-run directory, so restoring one is a move back.
+    Returns the number of bytes reclaimed.
+    """
+    from .models import MediaBlob
+
+    root = Path(root or settings.MEDIA_ROOT)
+    target = quarantine_root() / timezone.now().strftime('%Y%m%d-%H%M%S')
+    reclaimed = 0
+    for start in range(0 , len(found) , batch_size):
+        batch = found[start:start + batch_size]
+        for candidate in batch:
+            path = root / candidate.name
+            try:
+                if delete:
+                    path.unlink()
+                else:
+                    destination = target / candidate.name
+                    destination.parent.mkdir(parents=True , exist_ok=True)
+                    shutil.move(path , destination)
+            except FileNotFoundError:
+                continue
+            reclaimed += candidate.size
+        MediaBlob.objects.filter(name__in=[candidate.name for candidate in batch]).delete()
+        if on_batch is not None:
+            on_batch(batch)
+    return reclaimed
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0005_alter_post_view_count'),
+        ('sites', '0002_alter_domain_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('status', 'scheduled')), fields=['published_at'], name='blog_post_scheduled_due_idx'),
+        ),
+    ]
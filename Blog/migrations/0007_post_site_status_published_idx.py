@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0006_post_scheduled_due_idx'),
+        ('sites', '0002_alter_domain_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['site', 'status', 'published_at'], name='blog_post_site_status_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0007_post_site_status_published_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postrevision',
+            name='content_delta',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='postrevision',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='postrevision',
+            name='is_snapshot',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name='postrevision',
+            name='content',
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddIndex(
+            model_name='postrevision',
+            index=models.Index(fields=['post', '-created_at'], name='blog_revision_post_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0008_postrevision_delta_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='seo_score',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Stored SEO health score, refreshed on save', null=True),
+        ),
+    ]
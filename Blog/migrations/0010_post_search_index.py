@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def create_search_index(apps , schema_editor):
+    from Blog.search import ensure_search_index
+    ensure_search_index(schema_editor.connection)
+
+
+def drop_search_index(apps , schema_editor):
+    from Blog.search import drop_search_index
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0009_post_seo_score'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index , drop_search_index) ,
+    ]
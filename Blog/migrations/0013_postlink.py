@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 23:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Blog', '0012_post_rendered_content'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_slug', models.SlugField(max_length=255)),
+                ('anchor_text', models.CharField(blank=True, max_length=255)),
+                ('source', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='outgoing_links', to='Blog.post')),
+                ('target', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='incoming_links', to='Blog.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['target_slug'], name='blog_postlink_target_slug_idx')],
+            },
+        ),
+    ]
@@ -7,8 +7,12 @@ from django.contrib.sites.models import Site
 from ckeditor_uploader.fields import RichTextUploadingField
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
+from .analysis import analyze_html , reading_time
+from .links import sync_post_links
+from .rendering import render_content
 from .seo import SEOHealthMixin
 from .services import BlogGenerator
+from .revisions import apply_delta , content_hash , make_delta
 
 
 class BaseModel(models.Model):
@@ -212,6 +216,19 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
     show_in_feed = models.BooleanField(default=True)
     estimated_reading_time = models.PositiveIntegerField(null=True , blank=True)
     view_count =models.CharField(max_length=200 , blank=True)
+    seo_score = models.PositiveSmallIntegerField(null=True , blank=True , editable=False ,
+                                                 help_text="Stored SEO health score, refreshed on save")
+
+    # Content statistics, refreshed on save from the plain text of `content`
+    word_count = models.PositiveIntegerField(null=True , blank=True , editable=False)
+    character_count = models.PositiveIntegerField(null=True , blank=True , editable=False)
+    internal_link_count = models.PositiveIntegerField(null=True , blank=True , editable=False)
+    external_link_count = models.PositiveIntegerField(null=True , blank=True , editable=False)
+    image_count = models.PositiveIntegerField(null=True , blank=True , editable=False)
+
+    # Sanitized, normalized `content` and its table of contents, rendered on save
+    rendered_content = models.TextField(blank=True , editable=False)
+    toc = models.JSONField(default=list , blank=True , editable=False)
 
     # Related Posts
     related_posts = models.ManyToManyField(
@@ -228,6 +245,15 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
             models.Index(fields=['slug']) ,
             models.Index(fields=['status']) ,
             models.Index(fields=['visibility']) ,
+            models.Index(
+                fields=['site' , 'status' , 'published_at'] ,
+                name='blog_post_site_status_pub_idx'
+            ) ,
+            models.Index(
+                fields=['published_at'] ,
+                name='blog_post_scheduled_due_idx' ,
+                condition=models.Q(status='scheduled')
+            ) ,
         ]
         unique_together = ['slug' , 'site']
 
@@ -239,6 +265,8 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
             raise ValidationError({'password': _('Password is required for password protected posts.')})
         if self.status == 'published' and not self.category:
             raise ValidationError({'category': _('Category is required for published posts.')})
+        if self.status == 'scheduled' and not self.published_at:
+            raise ValidationError({'published_at': _('Publish date is required for scheduled posts.')})
 
     def save(self , *args , **kwargs):
         # Generate slug if not provided
@@ -255,16 +283,46 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
         if self.status == 'published' and not self.published_at:
             self.published_at = timezone.now()
 
-        # Calculate reading time
-        if self.content and not self.estimated_reading_time:
-            word_count = len(self.content.split())
-            self.estimated_reading_time = round(word_count / 200) 
+        # Store the rendered HTML, content statistics and the SEO score so
+        # readers don't re-parse the HTML per request
+        if kwargs.get('update_fields') is None:
+            self.render_content()
+            self.update_content_stats()
+            self.seo_score = self.get_seo_health()['score']
 
         super().save(*args , **kwargs)
 
+        if kwargs.get('update_fields') is None:
+            sync_post_links(self)
+
     def get_absolute_url(self):
         return reverse('blog:post_detail' , kwargs={'slug': self.slug})
 
+    def render_content(self):
+        """Refresh ``rendered_content`` and ``toc`` from ``content``"""
+        rendered = render_content(self.content)
+        self.rendered_content = rendered.html
+        self.toc = rendered.toc
+
+    def content_stats(self):
+        """Plain-text statistics of ``content``, parsed once per content value"""
+        cached = self.__dict__.get('_content_stats')
+        if cached is None or cached[0] != self.content:
+            domain = self.site.domain if self.site_id else None
+            cached = (self.content , analyze_html(self.content , domain))
+            self._content_stats = cached
+        return cached[1]
+
+    def update_content_stats(self):
+        """Copy ``content_stats()`` into the stored columns and the reading time"""
+        stats = self.content_stats()
+        self.word_count = stats.word_count
+        self.character_count = stats.character_count
+        self.internal_link_count = stats.internal_link_count
+        self.external_link_count = stats.external_link_count
+        self.image_count = stats.image_count
+        self.estimated_reading_time = reading_time(stats.word_count)
+
     # def increment_view_count(self):
     #     self.view_count += 1
     #     self.save(update_fields=['view_count'])
@@ -289,6 +347,41 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
             published_at__lt=self.published_at
         ).order_by('-published_at').first()
 
+    def get_adjacent_posts(self):
+        """
+        Next and previous published posts on the same site in one query: two
+        indexed ``LIMIT 1`` seeks on (site, status, published_at) feed an
+        ``id IN`` lookup. Cached on the instance.
+        """
+        if hasattr(self , '_adjacent_posts'):
+            return self._adjacent_posts
+
+        adjacent = {'next': None , 'previous': None}
+        if self.pk and self.published_at:
+            published = self.__class__.objects.filter(site_id=self.site_id , status='published')
+            after = published.filter(
+                models.Q(published_at__gt=self.published_at) |
+                models.Q(published_at=self.published_at , id__gt=self.pk)
+            ).order_by('published_at' , 'id').values('id')[:1]
+            before = published.filter(
+                models.Q(published_at__lt=self.published_at) |
+                models.Q(published_at=self.published_at , id__lt=self.pk)
+            ).order_by('-published_at' , '-id').values('id')[:1]
+
+            rows = published.filter(
+                models.Q(id=models.Subquery(after)) | models.Q(id=models.Subquery(before))
+            ).order_by().values('id' , 'title' , 'slug' , 'published_at')
+            for row in rows:
+                is_next = (row['published_at'] , row['id']) > (self.published_at , self.pk)
+                adjacent['next' if is_next else 'previous'] = {
+                    'id': row['id'] ,
+                    'title': row['title'] ,
+                    'slug': row['slug']
+                }
+
+        self._adjacent_posts = adjacent
+        return adjacent
+
     def get_related_posts(self):
         """Get related posts based on tags and category"""
         related = self.related_posts.filter(status='published')
@@ -341,6 +434,41 @@ class Post(BaseModel, SeoMixin, SEOHealthMixin):
             return None , str(e)  # Return no post and error message
 
 
+class PostLink(models.Model):
+    """
+    One internal link from a post's content to a post URL, extracted on save.
+    ``target`` is resolved from ``target_slug`` on the source's site and is
+    ``None`` while the link is broken.
+    """
+    source = models.ForeignKey(Post , on_delete=models.CASCADE , related_name='outgoing_links')
+    target = models.ForeignKey(Post , null=True , blank=True , on_delete=models.SET_NULL ,
+                               related_name='incoming_links')
+    target_slug = models.SlugField(max_length=255)
+    anchor_text = models.CharField(max_length=255 , blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['target_slug'] , name='blog_postlink_target_slug_idx') ,
+        ]
+
+    def __str__(self):
+        return f'{self.source_id} -> {self.target_slug}'
+
+
+class MediaBlob(models.Model):
+    """
+    One file of the content-addressed media storage (``Blog.storage``), with
+    the number of image fields and post bodies that refer to it.
+    """
+    name = models.CharField(max_length=255 , unique=True)
+    size = models.PositiveBigIntegerField()
+    refcount = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
 class Comment(BaseModel):
     """Comment model for blog posts"""
     post = models.ForeignKey(Post , on_delete=models.CASCADE , related_name='comments')
@@ -373,17 +501,85 @@ class Comment(BaseModel):
 
 
 class PostRevision(BaseModel):
-    """Model to track post revisions"""
+    """
+    Model to track post revisions. Every ``SNAPSHOT_INTERVAL``-th revision of
+    a post stores the full content; the ones in between store a compressed
+    delta against the previous revision.
+    """
+    SNAPSHOT_INTERVAL = 10
+
     post = models.ForeignKey(Post , on_delete=models.CASCADE , related_name='revisions')
     title = models.CharField(max_length=200)
-    content = models.TextField()
+    content = models.TextField(blank=True)
     excerpt = models.TextField()
     author = models.ForeignKey(User , on_delete=models.CASCADE)
     revision_note = models.TextField(blank=True)
+    is_snapshot = models.BooleanField(default=True)
+    content_delta = models.BinaryField(null=True , blank=True)
+    content_hash = models.CharField(max_length=64 , blank=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['post' , '-created_at'] , name='blog_revision_post_created_idx') ,
+        ]
 
     def __str__(self):
         return f'Revision of {self.post.title} at {self.created_at}'
-    
\ No newline at end of file
+
+    @classmethod
+    def record(cls , post , author , revision_note=''):
+        """Store a revision of ``post``, or return ``None`` if nothing changed"""
+        digest = content_hash(post.title , post.content , post.excerpt)
+        latest = cls.objects.filter(post=post).order_by('-id').first()
+        if latest and (latest.content_hash or content_hash(
+                latest.title , latest.get_content() , latest.excerpt)) == digest:
+            return None
+
+        revision = cls(
+            post=post ,
+            title=post.title ,
+            excerpt=post.excerpt ,
+            author=author ,
+            revision_note=revision_note ,
+            content_hash=digest
+        )
+        since_snapshot = 0
+        if latest:
+            last_snapshot = cls.objects.filter(post=post , is_snapshot=True).order_by('-id').first()
+            since_snapshot = cls.objects.filter(
+                post=post ,
+                id__gt=last_snapshot.id if last_snapshot else 0
+            ).count()
+
+        delta = None
+        if latest and since_snapshot < cls.SNAPSHOT_INTERVAL - 1:
+            delta = make_delta(latest.get_content() , post.content)
+        # Fall back to a snapshot when the diff would not save anything
+        if delta is not None and len(delta) < len(post.content.encode('utf-8')):
+            revision.is_snapshot = False
+            revision.content_delta = delta
+        else:
+            revision.content = post.content
+        revision.save()
+        return revision
+
+    def get_content(self):
+        """Reconstruct the full content of this revision"""
+        if self.is_snapshot:
+            return self.content
+        if hasattr(self , '_content'):
+            return self._content
+
+        chain = PostRevision.objects.filter(post_id=self.post_id , id__lte=self.id)
+        base = chain.filter(is_snapshot=True).order_by('-id').values('id' , 'content').first()
+        content = base['content'] if base else ''
+        deltas = chain.filter(
+            is_snapshot=False ,
+            id__gt=base['id'] if base else 0
+        ).order_by('id').values_list('content_delta' , flat=True)
+        for delta in deltas.iterator():
+            content = apply_delta(content , delta)
+
+        self._content = content
+        return content
@@ -0,0 +1,198 @@
+# Blog/pagination.py
+import hashlib
+import math
+from collections import OrderedDict
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import DatabaseError , connections
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param , replace_query_param
+
+from .cache import acontent_version , content_version
+
+
+def count_key(queryset , version):
+    # Versioned like the cached payloads, so publishing or editing a post
+    # retires the counts along with them
+    return f'blog:count:{version}:' + hashlib.md5(str(queryset.query).encode()).hexdigest()
+
+
+def cached_count(queryset , timeout):
+    """``queryset.count()`` shared through the cache for ``timeout`` seconds"""
+    key = count_key(queryset , content_version())
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key , count , timeout)
+    return count
+
+
+def estimated_count(model , using='default'):
+    """
+    Row count from the planner statistics of ``model``'s table, or ``None``
+    when the backend has none (SQLite only has them after ``ANALYZE``).
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass' , [table])
+            elif connection.vendor == 'sqlite':
+                cursor.execute('SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1' , [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for large admin changelists: an unfiltered table is counted
+    from planner statistics once it is past ``estimate_threshold`` rows,
+    and filtered counts are cached for ``count_cache_timeout`` seconds.
+    """
+    estimate_threshold = 10000
+    count_cache_timeout = 60
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset , 'query'):
+            return super().count
+        if not queryset.query.where:
+            estimate = estimated_count(queryset.model , queryset.db)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate
+        return cached_count(queryset.order_by() , self.count_cache_timeout)
+
+
+class LookaheadPagination(PageNumberPagination):
+    """
+    Page number pagination that fetches ``page_size + 1`` rows instead of
+    running ``COUNT(*)`` up front. ``next`` comes from the extra row; the
+    exact count is free on the last page and otherwise taken from a cached
+    count (``count_cache_timeout`` seconds, ``None`` for an exact count).
+    """
+    count_cache_timeout = 300
+    template = None
+
+    def paginate_queryset(self , queryset , request , view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        self.count = None
+        page_number = request.query_params.get(self.page_query_param , 1)
+        if page_number in self.last_page_strings:
+            self.count = self.get_count(queryset)
+            page_number = max(math.ceil(self.count / page_size) , 1)
+        page_number = self._parse_page_number(page_number)
+
+        offset = (page_number - 1) * page_size
+        rows = self._take_page(list(queryset[offset:offset + page_size + 1]) , page_number , page_size)
+        if not rows and page_number > 1 and queryset.exists():
+            raise self._empty_page(page_number)
+
+        if self.has_next and self.count is None:
+            # A stale cached count must still cover the rows we have seen
+            self.count = max(self.get_count(queryset) , offset + len(rows) + 1)
+        return rows
+
+    async def apaginate_queryset(self , queryset , request):
+        """Async twin of ``paginate_queryset`` for native async views"""
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        self.count = None
+        page_number = request.query_params.get(self.page_query_param , 1)
+        if page_number in self.last_page_strings:
+            self.count = await self.aget_count(queryset)
+            page_number = max(math.ceil(self.count / page_size) , 1)
+        page_number = self._parse_page_number(page_number)
+
+        offset = (page_number - 1) * page_size
+        rows = [row async for row in queryset[offset:offset + page_size + 1]]
+        rows = self._take_page(rows , page_number , page_size)
+        if not rows and page_number > 1 and await queryset.aexists():
+            raise self._empty_page(page_number)
+
+        if self.has_next and self.count is None:
+            self.count = max(await self.aget_count(queryset) , offset + len(rows) + 1)
+        return rows
+
+    def _parse_page_number(self , page_number):
+        try:
+            page_number = int(page_number)
+            if page_number < 1:
+                raise ValueError
+        except (TypeError , ValueError):
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number , message='That page number is not an integer'
+            ))
+        return page_number
+
+    def _take_page(self , rows , page_number , page_size):
+        self.page_number = page_number
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        if not self.has_next:
+            self.count = (page_number - 1) * page_size + len(rows)
+        return rows
+
+    def _empty_page(self , page_number):
+        return NotFound(self.invalid_page_message.format(
+            page_number=page_number , message='That page contains no results'
+        ))
+
+    def get_count(self , queryset):
+        if self.count_cache_timeout is None:
+            return queryset.count()
+        return cached_count(queryset , self.count_cache_timeout)
+
+    async def aget_count(self , queryset):
+        if self.count_cache_timeout is None:
+            return await queryset.acount()
+        key = count_key(queryset , await acontent_version())
+        count = await cache.aget(key)
+        if count is None:
+            count = await queryset.acount()
+            await cache.aset(key , count , self.count_cache_timeout)
+        return count
+
+    def get_paginated_data(self , data):
+        return OrderedDict([
+            ('count' , self.count) ,
+            ('next' , self.get_next_link()) ,
+            ('previous' , self.get_previous_link()) ,
+            ('results' , data)
+        ])
+
+    def get_paginated_response(self , data):
+        return Response(self.get_paginated_data(data))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url , self.page_query_param , self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number - 1 == 1:
+            return remove_query_param(url , self.page_query_param)
+        return replace_query_param(url , self.page_query_param , self.page_number - 1)
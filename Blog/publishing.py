@@ -0,0 +1,57 @@
+# Blog/publishing.py
+from django.db import connections , transaction
+from django.utils import timezone
+
+from .models import Post
+from .signals import posts_published
+
+
+def due_posts(now=None):
+    """Scheduled posts whose publish date has passed, oldest first"""
+    now = now or timezone.now()
+    return Post.objects.filter(
+        status='scheduled' ,
+        published_at__lte=now
+    ).order_by('published_at')
+
+
+def publish_due_batch(now=None , batch_size=100):
+    """Publish up to ``batch_size`` due posts and return the ids this call published"""
+    now = now or timezone.now()
+    with transaction.atomic():
+        due = due_posts(now)
+        if connections[due.db].features.has_select_for_update_skip_locked:
+            # Concurrent workers take disjoint batches instead of racing for one
+            due = due.select_for_update(skip_locked=True)
+        post_ids = list(due.values_list('id' , flat=True)[:batch_size])
+        if not post_ids:
+            return []
+        # Re-check the status so a post published meanwhile is not flipped twice
+        Post.objects.filter(id__in=post_ids , status='scheduled').update(
+            status='published' ,
+            updated_at=now
+        )
+        # Announce only the rows this update changed, not everything selected
+        rows = list(Post.objects.filter(
+            id__in=post_ids , status='published' , updated_at=now
+        ).values_list('id' , 'site_id'))
+
+    post_ids = sorted(post_id for post_id , _ in rows)
+    if post_ids:
+        posts_published.send(
+            sender=Post ,
+            post_ids=post_ids ,
+            site_ids=sorted({site_id for _ , site_id in rows})
+        )
+    return post_ids
+
+
+def publish_due_posts(now=None , batch_size=100):
+    """Drain the due queue batch by batch, returning the number published"""
+    now = now or timezone.now()
+    total = 0
+    while True:
+        published = publish_due_batch(now , batch_size)
+        total += len(published)
+        if len(published) < batch_size:
+            return total
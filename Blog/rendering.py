@@ -0,0 +1,223 @@
+# Blog/rendering.py
+"""
+Save-time rendering of a post's CKEditor HTML.
+
+``render_content`` runs one pass over the HTML and:
+
+- keeps only allow-listed tags and attributes, drops ``on*`` handlers,
+  ``style`` and non-http(s)/mailto/tel URLs, and removes script/style
+  bodies entirely (other disallowed tags are unwrapped);
+- normalizes the markup: lower-case tags, quoted and escaped attributes,
+  void elements without end tags, stray end tags dropped, unclosed tags
+  closed;
+- makes images lazy (``loading``/``decoding``) and fills in ``width`` and
+  ``height`` from the file when it lives in the media storage;
+- gives h2-h4 headings unique ids and collects them into a table of
+  contents.
+
+The result is stored on the post, so API responses serve it as is.
+"""
+import html
+from collections import namedtuple
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.utils.text import slugify
+
+ALLOWED_TAGS = frozenset((
+    'a' , 'abbr' , 'b' , 'blockquote' , 'br' , 'caption' , 'cite' , 'code' , 'col' , 'colgroup' , 'dd' ,
+    'del' , 'div' , 'dl' , 'dt' , 'em' , 'figcaption' , 'figure' , 'h1' , 'h2' , 'h3' , 'h4' , 'h5' , 'h6' ,
+    'hr' , 'i' , 'iframe' , 'img' , 'ins' , 'kbd' , 'li' , 'mark' , 'ol' , 'p' , 'pre' , 's' , 'small' ,
+    'span' , 'strike' , 'strong' , 'sub' , 'sup' , 'table' , 'tbody' , 'td' , 'tfoot' , 'th' , 'thead' ,
+    'tr' , 'u' , 'ul'
+))
+ALLOWED_ATTRIBUTES = {
+    '*': frozenset(('class' , 'id' , 'title' , 'lang' , 'dir')) ,
+    'a': frozenset(('href' , 'rel' , 'target' , 'name')) ,
+    'img': frozenset(('src' , 'alt' , 'width' , 'height' , 'srcset' , 'sizes')) ,
+    'iframe': frozenset(('src' , 'width' , 'height' , 'allow' , 'allowfullscreen' , 'frameborder')) ,
+    'td': frozenset(('colspan' , 'rowspan')) ,
+    'th': frozenset(('colspan' , 'rowspan' , 'scope')) ,
+    'col': frozenset(('span' ,)) ,
+    'ol': frozenset(('start' , 'reversed' , 'type')) ,
+    'blockquote': frozenset(('cite' ,)) ,
+}
+URL_ATTRIBUTES = frozenset(('href' , 'src' , 'cite'))
+ALLOWED_SCHEMES = frozenset(('' , 'http' , 'https' , 'mailto' , 'tel'))
+# Embeds are only kept from these hosts
+ALLOWED_IFRAME_HOSTS = frozenset((
+    'www.youtube.com' , 'youtube.com' , 'www.youtube-nocookie.com' , 'player.vimeo.com'
+))
+# Removed with everything inside them, up to their end tag. ``embed`` is a
+# void element with no end tag or content, so it is simply left out of
+# ALLOWED_TAGS like any other disallowed tag.
+DROPPED_TAGS = frozenset(('script' , 'style' , 'template' , 'noscript' , 'object'))
+VOID_TAGS = frozenset(('br' , 'col' , 'hr' , 'img'))
+TOC_LEVELS = frozenset(('h2' , 'h3' , 'h4'))
+
+IMAGE_SIZE_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
+RenderedContent = namedtuple('RenderedContent' , ['html' , 'toc'])
+
+
+def is_safe_url(url):
+    parts = urlsplit(url.strip())
+    return parts.scheme.lower() in ALLOWED_SCHEMES and not any(ord(char) < 32 for char in url)
+
+
+def is_allowed_iframe(src):
+    return urlsplit(src).hostname in ALLOWED_IFRAME_HOSTS
+
+
+def image_size(src):
+    """``(width, height)`` of a media-storage image, or ``None`` when unknown"""
+    media_url = settings.MEDIA_URL
+    path = urlsplit(src).path
+    if not media_url or not path.startswith(media_url):
+        return None
+    name = path[len(media_url):]
+    key = f'blog:image-size:{name}'
+    size = cache.get(key)
+    if size is None:
+        from PIL import Image , UnidentifiedImageError
+        try:
+            with default_storage.open(name) as handle , Image.open(handle) as image:
+                size = image.size
+        except (OSError , UnidentifiedImageError , ValueError):
+            size = ()
+        cache.set(key , size , IMAGE_SIZE_CACHE_TIMEOUT)
+    return tuple(size) or None
+
+
+class _Renderer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out = []
+        self.open_tags = []
+        self.dropping = 0
+        self.dropped_iframes = 0
+        self.used_ids = set()
+        self.toc = []
+        # [tag, attributes, output index, text] of the heading being collected
+        self.heading = None
+
+    def clean_attributes(self , tag , attrs):
+        allowed = ALLOWED_ATTRIBUTES['*'] | ALLOWED_ATTRIBUTES.get(tag , frozenset())
+        cleaned = {}
+        for name , value in attrs:
+            if name not in allowed or name in cleaned:
+                continue
+            value = value or ''
+            if name in URL_ATTRIBUTES and not is_safe_url(value):
+                continue
+            cleaned[name] = value
+        return cleaned
+
+    def start_tag(self , tag , attributes):
+        rendered = ''.join(f' {name}="{html.escape(value)}"' for name , value in attributes.items())
+        return f'<{tag}{rendered}>'
+
+    def unique_id(self , text):
+        base = slugify(text)[:60].strip('-') or 'section'
+        candidate , number = base , 2
+        while candidate in self.used_ids:
+            candidate = f'{base}-{number}'
+            number += 1
+        self.used_ids.add(candidate)
+        return candidate
+
+    def handle_starttag(self , tag , attrs):
+        if tag in DROPPED_TAGS:
+            self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+
+        attributes = self.clean_attributes(tag , attrs)
+        if tag == 'img':
+            if 'src' not in attributes:
+                return
+            attributes.setdefault('alt' , '')
+            if 'width' not in attributes or 'height' not in attributes:
+                size = image_size(attributes['src'])
+                if size:
+                    attributes['width'] , attributes['height'] = str(size[0]) , str(size[1])
+            attributes['loading'] = 'lazy'
+            attributes['decoding'] = 'async'
+        elif tag == 'iframe':
+            if not is_allowed_iframe(attributes.get('src' , '')):
+                self.dropping += 1
+                self.dropped_iframes += 1
+                return
+            attributes['loading'] = 'lazy'
+        elif tag == 'a' and attributes.get('target') == '_blank':
+            attributes['rel'] = 'noopener noreferrer'
+
+        if tag in VOID_TAGS:
+            self.out.append(self.start_tag(tag , attributes))
+            return
+        if tag in TOC_LEVELS and self.heading is None:
+            # The id comes from the heading text, so the start tag is written on close
+            self.heading = [tag , attributes , len(self.out) , []]
+            self.out.append('')
+        else:
+            self.out.append(self.start_tag(tag , attributes))
+        self.open_tags.append(tag)
+
+    def handle_startendtag(self , tag , attrs):
+        # Self-closed: no end tag will come to stop a drop, so don't start one
+        if tag in DROPPED_TAGS:
+            return
+        if tag == 'iframe' and not is_allowed_iframe(self.clean_attributes(tag , attrs).get('src' , '')):
+            return
+        self.handle_starttag(tag , attrs)
+        if tag not in VOID_TAGS and self.open_tags and self.open_tags[-1] == tag:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self , tag):
+        if tag in DROPPED_TAGS or (tag == 'iframe' and self.dropped_iframes):
+            self.dropping = max(0 , self.dropping - 1)
+            if tag == 'iframe':
+                self.dropped_iframes -= 1
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Close anything left open inside this element first
+        while self.open_tags:
+            current = self.open_tags.pop()
+            self.close_tag(current)
+            if current == tag:
+                break
+
+    def close_tag(self , tag):
+        self.out.append(f'</{tag}>')
+        if self.heading is not None and self.heading[0] == tag:
+            tag , attributes , index , text = self.heading
+            self.heading = None
+            text = ' '.join(''.join(text).split())
+            attributes['id'] = self.unique_id(attributes.get('id') or text)
+            self.out[index] = self.start_tag(tag , attributes)
+            self.toc.append({'level': int(tag[1]) , 'id': attributes['id'] , 'text': text})
+
+    def handle_data(self , data):
+        if self.dropping:
+            return
+        if self.heading is not None:
+            self.heading[3].append(data)
+        self.out.append(html.escape(data , quote=False))
+
+    def finish(self):
+        while self.open_tags:
+            self.close_tag(self.open_tags.pop())
+        return ''.join(self.out)
+
+
+def render_content(content):
+    """Sanitized, normalized HTML of ``content`` and its table of contents"""
+    renderer = _Renderer()
+    renderer.feed(content or '')
+    renderer.close()
+    return RenderedContent(html=renderer.finish().strip() , toc=renderer.toc)
@@ -0,0 +1,62 @@
+# Blog/revisions.py
+import difflib
+import hashlib
+import json
+import re
+import zlib
+
+# Tags and words (with their trailing whitespace), so diffs of CKEditor HTML
+# stay small even when the whole document sits on a single line.
+TOKEN_PATTERN = re.compile(r'<[^>]*>\s*|[^<\s]+\s*|\s+|<')
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text or '')
+
+
+def content_hash(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or '').encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def make_delta(old , new):
+    """
+    Encode ``new`` as zlib-compressed JSON ops against ``old``: a positive int
+    copies that many old tokens, a negative int skips them, a string inserts.
+    """
+    old_tokens , new_tokens = tokenize(old) , tokenize(new)
+    ops = []
+    matcher = difflib.SequenceMatcher(None , old_tokens , new_tokens)
+    for tag , i1 , i2 , j1 , j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        if j2 > j1:
+            ops.append(''.join(new_tokens[j1:j2]))
+    return zlib.compress(json.dumps(ops , separators=(',' , ':')).encode('utf-8'))
+
+
+def apply_delta(old , delta):
+    """Rebuild the text encoded by ``make_delta`` from ``old``"""
+    old_tokens = tokenize(old)
+    position = 0
+    output = []
+    for op in json.loads(zlib.decompress(bytes(delta))):
+        if isinstance(op , str):
+            output.append(op)
+        elif op > 0:
+            output.append(''.join(old_tokens[position:position + op]))
+            position += op
+        else:
+            position -= op
+    return ''.join(output)
+
+
+def inserted_text(delta):
+    """The text a delta inserts, e.g. to find what it references without rebuilding it"""
+    return ''.join(op for op in json.loads(zlib.decompress(bytes(delta))) if isinstance(op , str))
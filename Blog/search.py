@@ -0,0 +1,122 @@
+# Blog/search.py
+"""
+Indexed full-text search over post title, excerpt and content.
+
+SQLite keeps an external-content FTS5 table in sync with triggers;
+PostgreSQL uses a GIN expression index on the same three columns. Other
+backends report ``is_supported() == False``, and ``search_posts`` falls
+back to an unindexed ``LIKE`` search there.
+"""
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = 'blog_post_fts'
+PG_INDEX = 'blog_post_search_idx'
+PG_VECTOR = (
+    "to_tsvector('simple', coalesce(title, '') || ' ' || "
+    "coalesce(excerpt, '') || ' ' || coalesce(content, ''))"
+)
+
+SQLITE_TRIGGERS = {
+    f'{FTS_TABLE}_ai': (
+        'AFTER INSERT ON "{table}" BEGIN '
+        'INSERT INTO {fts}(rowid, title, excerpt, content) VALUES (new.id, new.title, new.excerpt, new.content); '
+        'END'
+    ) ,
+    f'{FTS_TABLE}_ad': (
+        'AFTER DELETE ON "{table}" BEGIN '
+        "INSERT INTO {fts}({fts}, rowid, title, excerpt, content) "
+        "VALUES ('delete', old.id, old.title, old.excerpt, old.content); "
+        'END'
+    ) ,
+    f'{FTS_TABLE}_au': (
+        'AFTER UPDATE OF title, excerpt, content ON "{table}" BEGIN '
+        "INSERT INTO {fts}({fts}, rowid, title, excerpt, content) "
+        "VALUES ('delete', old.id, old.title, old.excerpt, old.content); "
+        'INSERT INTO {fts}(rowid, title, excerpt, content) VALUES (new.id, new.title, new.excerpt, new.content); '
+        'END'
+    ) ,
+}
+
+
+def _post_table():
+    from .models import Post
+    return Post._meta.db_table
+
+
+def is_supported(using='default'):
+    return connections[using].vendor in ('sqlite' , 'postgresql')
+
+
+def ensure_search_index(connection):
+    """
+    Create the search index if it is missing. SQLite drops triggers when a
+    migration rebuilds the posts table, so this also runs after every
+    ``migrate`` and re-indexes whenever it had to recreate them.
+    """
+    table = _post_table()
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS {PG_INDEX} ON "{table}" USING gin ({PG_VECTOR})')
+            return
+        if connection.vendor != 'sqlite':
+            return
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s" , [table])
+        existing = {name for name , in cursor.fetchall()}
+        if existing >= set(SQLITE_TRIGGERS):
+            return
+
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5('
+            f'title, excerpt, content, content="{table}", content_rowid="id")'
+        )
+        for name , body in SQLITE_TRIGGERS.items():
+            cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(f'CREATE TRIGGER {name} ' + body.format(table=table , fts=FTS_TABLE))
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def repair_search_index(sender , using='default' , **kwargs):
+    """``post_migrate`` receiver restoring SQLite triggers lost to a table rebuild"""
+    connection = connections[using]
+    if connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names():
+        ensure_search_index(connection)
+
+
+def drop_search_index(connection):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f'DROP INDEX IF EXISTS {PG_INDEX}')
+        elif connection.vendor == 'sqlite':
+            for name in SQLITE_TRIGGERS:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+def _fts_query(term):
+    # Every word must match, each as a quoted prefix so punctuation is inert
+    return ' '.join('"%s"*' % word.replace('"' , '""') for word in term.split())
+
+
+def search_posts(queryset , term):
+    """Restrict a ``Post`` queryset to rows matching ``term`` through the index"""
+    term = term.strip()
+    if not term:
+        return queryset
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s' , [_fts_query(term)])
+    elif vendor == 'postgresql':
+        matches = RawSQL(
+            f'SELECT id FROM "{_post_table()}" WHERE {PG_VECTOR} @@ websearch_to_tsquery(\'simple\', %s)' ,
+            [term]
+        )
+    else:
+        # No index on this backend: the same every-word match as an unindexed LIKE
+        condition = Q()
+        for word in term.split():
+            condition &= Q(title__icontains=word) | Q(excerpt__icontains=word) | Q(content__icontains=word)
+        return queryset.filter(condition)
+    return queryset.filter(id__in=matches)
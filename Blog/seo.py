@@ -1,6 +1,5 @@
 # Blog/seo.py
 from django.contrib.sitemaps import Sitemap
-from django.utils.html import strip_tags
 import re
 
 
@@ -40,6 +39,11 @@ def generate_schema_markup(post):
     }
 
 
+def seo_status(score):
+    """Bucket a 0-100 SEO score into the label shown in the admin"""
+    return 'Excellent' if score >= 90 else 'Good' if score >= 70 else 'Fair' if score >= 50 else 'Poor'
+
+
 class SEOHealthMixin:
     def get_seo_health(self):
         """Calculate SEO health score and get recommendations"""
@@ -48,8 +52,10 @@ class SEOHealthMixin:
         checks = []
         recommendations = []
 
+        stats = self.content_stats()
+
         # Content Length Check (20 points)
-        content_length = len(strip_tags(self.content))
+        content_length = stats.character_count
         if content_length >= 1500:
             score += 20
             checks.append(('Content Length' , 'Excellent' , 20))
@@ -93,7 +99,7 @@ class SEOHealthMixin:
         # Focus Keywords Check (15 points)
         if self.focus_keywords:
             keywords = [k.strip() for k in self.focus_keywords.split(',')]
-            content_text = strip_tags(self.content).lower()
+            content_text = stats.text.lower()
             title_text = self.title.lower()
 
             keyword_score = 0
@@ -151,8 +157,7 @@ class SEOHealthMixin:
         checks.append(('URL Optimization' , 'Good' if url_score > 5 else 'Poor' , url_score))
 
         # Internal Linking Check (15 points)
-        link_pattern = r'href=["\'](?!http)[^"\']*["\']'
-        internal_links = len(re.findall(link_pattern , self.content))
+        internal_links = stats.internal_link_count
         if internal_links >= 3:
             score += 15
             checks.append(('Internal Linking' , 'Excellent' , 15))
@@ -186,12 +191,10 @@ class SEOHealthMixin:
         if schema_score < 10:
             recommendations.append('Complete all schema markup fields for better search visibility')
 
-        health_status = 'Excellent' if score >= 90 else 'Good' if score >= 70 else 'Fair' if score >= 50 else 'Poor'
-
         return {
             'score': score ,
             'max_score': max_score ,
-            'status': health_status ,
+            'status': seo_status(score) ,
             'checks': checks ,
             'recommendations': recommendations
         }
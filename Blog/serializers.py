@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from django.core.exceptions import FieldDoesNotExist
 from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
 from .models import (
@@ -11,6 +12,94 @@ from .models import (
 )
 
 
+def _split_param(value):
+    return [name.strip() for name in (value or '').split(',') if name.strip()]
+
+
+class SparseFieldsetMixin:
+    """
+    Restrict a serializer to the fields named in ``?fields=`` (or a ``fields``
+    kwarg). Nested relations that are selected but not listed in ``?expand=``
+    collapse to primary keys; expanded relations are always included.
+    """
+
+    def __init__(self , *args , **kwargs):
+        fields = kwargs.pop('fields' , None)
+        expand = kwargs.pop('expand' , None)
+        super().__init__(*args , **kwargs)
+
+        request = self.context.get('request')
+        if fields is None and request is not None:
+            fields = _split_param(request.query_params.get('fields'))
+            expand = _split_param(request.query_params.get('expand'))
+        if not fields:
+            return
+
+        expand = set(expand or [])
+        selected = set(fields) | expand
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+            elif name not in expand and isinstance(self.fields[name] , serializers.BaseSerializer):
+                many = isinstance(self.fields[name] , serializers.ListSerializer)
+                self.fields[name] = serializers.PrimaryKeyRelatedField(read_only=True , many=many)
+
+
+def get_queryset_projection(serializer , prefix=''):
+    """
+    Work out the ``only()``/``select_related()``/``prefetch_related()`` arguments
+    needed to render ``serializer`` without touching unrequested columns.
+    Returns ``(only, select_related, prefetch_related)``; ``only`` is ``None``
+    when a level reads attributes we cannot see (method fields, properties).
+    """
+    if isinstance(serializer , serializers.ListSerializer):
+        serializer = serializer.child
+    model = serializer.Meta.model
+    only , select , prefetch = [] , [] , []
+    restrict = True
+
+    for field in serializer.fields.values():
+        if field.source == '*' or '.' in field.source:
+            restrict = False
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            # Properties need arbitrary columns; anything else is an annotation
+            if hasattr(model , field.source):
+                restrict = False
+            continue
+
+        path = prefix + field.source
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetch.append(path)
+            if isinstance(field , serializers.BaseSerializer):
+                _ , nested_select , nested_prefetch = get_queryset_projection(field , path + '__')
+                prefetch.extend(nested_select + nested_prefetch)
+            continue
+        only.append(path)
+        if model_field.many_to_one and isinstance(field , serializers.BaseSerializer):
+            select.append(path)
+            nested_only , nested_select , nested_prefetch = get_queryset_projection(field , path + '__')
+            if nested_only:
+                only.extend(nested_only)
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+
+    return (only if restrict else None) , select , prefetch
+
+
+def project_queryset(queryset , serializer):
+    """Apply the projection for ``serializer`` to ``queryset``"""
+    only , select , prefetch = get_queryset_projection(serializer)
+    if only is not None:
+        queryset = queryset.only(*only)
+    # select_related() without arguments would follow every non-null foreign key
+    if select:
+        queryset = queryset.select_related(*select)
+    return queryset.prefetch_related(*prefetch)
+
+
 class SiteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Site
@@ -28,7 +117,7 @@ class UserSerializer(serializers.ModelSerializer):
         return obj.get_full_name() or obj.username
 
 
-class MasterCategoryListSerializer(serializers.ModelSerializer):
+class MasterCategoryListSerializer(SparseFieldsetMixin , serializers.ModelSerializer):
     total_posts = serializers.IntegerField(read_only=True)
     active_categories_count = serializers.IntegerField(read_only=True)
 
@@ -53,7 +142,7 @@ class MasterCategoryDetailSerializer(MasterCategoryListSerializer):
         return CategoryListSerializer(categories , many=True).data
 
 
-class CategoryListSerializer(serializers.ModelSerializer):
+class CategoryListSerializer(SparseFieldsetMixin , serializers.ModelSerializer):
     master_category = MasterCategoryListSerializer(read_only=True)
     post_count = serializers.IntegerField(read_only=True)
     site = SiteSerializer(read_only=True)
@@ -88,7 +177,8 @@ class CategoryDetailSerializer(CategoryListSerializer):
         posts = obj.posts.filter(
             status='published' ,
             is_active=True
-        ).order_by('-published_at')[:5]
+        ).order_by('-published_at')
+        posts = project_queryset(posts , PostListSerializer())[:5]
         return PostListSerializer(posts , many=True).data
 
     def get_breadcrumbs(self , obj):
@@ -142,12 +232,19 @@ class PostRevisionSerializer(serializers.ModelSerializer):
     class Meta:
         model = PostRevision
         fields = [
-            'id' , 'title' , 'content' , 'excerpt' ,
-            'author' , 'revision_note' , 'created_at'
+            'id' , 'title' , 'author' , 'revision_note' ,
+            'is_snapshot' , 'created_at'
         ]
 
 
-class PostListSerializer(serializers.ModelSerializer):
+class PostRevisionDetailSerializer(PostRevisionSerializer):
+    content = serializers.CharField(source='get_content' , read_only=True)
+
+    class Meta(PostRevisionSerializer.Meta):
+        fields = PostRevisionSerializer.Meta.fields + ['content' , 'excerpt']
+
+
+class PostListSerializer(SparseFieldsetMixin , serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     category = CategoryListSerializer(read_only=True)
     tags = TagSerializer(many=True , read_only=True)
@@ -161,7 +258,7 @@ class PostListSerializer(serializers.ModelSerializer):
             'featured_image' , 'image_alt' , 'featured_video' ,
             'author' , 'category' , 'tags' , 'site' ,
             'status' , 'visibility' , 'is_featured' ,
-            'published_at' , 'estimated_reading_time' ,
+            'published_at' , 'estimated_reading_time' , 'word_count' ,
             'view_count' , 'comment_count' , 'created_at' ,
             'meta_title' , 'meta_description' , 'focus_keywords' ,
             'canonical_url' , 'robots'
@@ -169,6 +266,8 @@ class PostListSerializer(serializers.ModelSerializer):
 
 
 class PostDetailSerializer(PostListSerializer):
+    revisions_page_size = 20
+
     content = serializers.CharField()
     comments = serializers.SerializerMethodField()
     related_posts = serializers.SerializerMethodField()
@@ -196,29 +295,23 @@ class PostDetailSerializer(PostListSerializer):
         return PostListSerializer(related_posts , many=True).data
 
     def get_next_post(self , obj):
-        next_post = obj.next_post
-        if next_post:
-            return {
-                'id': next_post.id ,
-                'title': next_post.title ,
-                'slug': next_post.slug
-            }
-        return None
+        return obj.get_adjacent_posts()['next']
 
     def get_previous_post(self , obj):
-        previous_post = obj.previous_post
-        if previous_post:
-            return {
-                'id': previous_post.id ,
-                'title': previous_post.title ,
-                'slug': previous_post.slug
-            }
-        return None
+        return obj.get_adjacent_posts()['previous']
 
     def get_revisions(self , obj):
-        user = self.context.get('request').user
-        if user and user.is_staff:
-            revisions = obj.revisions.all()
+        request = self.context.get('request')
+        if request and request.user.is_staff:
+            try:
+                page = max(int(request.query_params.get('revisions_page' , 1)) , 1)
+            except ValueError:
+                page = 1
+            size = self.revisions_page_size
+            revisions = obj.revisions.select_related('author').only(
+                'id' , 'title' , 'revision_note' , 'is_snapshot' , 'created_at' ,
+                'post_id' , 'author'
+            )[(page - 1) * size:page * size]
             return PostRevisionSerializer(revisions , many=True).data
         return []
 
@@ -380,12 +473,17 @@ class PostListSlugSerializer(serializers.ModelSerializer):
     author = UserSlugSerializer(read_only=True)
     category = CategoryListSlugSerializer(read_only=True)
     tags = TagSlugSerializer(many=True, read_only=True)
+    # Rendered on save (see Blog.rendering); raw content only until backfilled
+    content = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
         fields = [
-            'id' , 'featured_image', 'image_alt' , 'slug' , 'title','excerpt','published_at', 'author', 'category', 'tags', 'content', 'estimated_reading_time', 'view_count',
+            'id' , 'featured_image', 'image_alt' , 'slug' , 'title','excerpt','published_at', 'author', 'category', 'tags', 'content', 'toc', 'estimated_reading_time', 'view_count',
             'meta_title', 'meta_description']
+
+    def get_content(self , obj):
+        return obj.rendered_content or obj.content
         
 # CategorySlugSerializer 
 class CategorySlugSerializer(serializers.ModelSerializer):
@@ -1,12 +1,19 @@
 # Blog/services.py
-import openai
 from django.conf import settings
 import json
 
 
+def _openai():
+    # Imported on first use: the client (and httpx, pydantic, ...) is only
+    # needed once something generates content, not by every process importing models
+    import openai
+
+    openai.api_key = settings.OPENAI_API_KEY
+    return openai
+
+
 class BlogGenerator:
     def __init__(self):
-        openai.api_key = settings.OPENAI_API_KEY
         self.model = "gpt-4-turbo-preview"  # or "gpt-3.5-turbo"
 
     def generate_blog_content(self , topic , keywords=None):
@@ -36,7 +43,7 @@ class BlogGenerator:
             prompt += f"\nPlease incorporate these keywords naturally: {', '.join(keywords)}"
 
         try:
-            response = openai.ChatCompletion.create(
+            response = _openai().ChatCompletion.create(
                 model=self.model ,
                 messages=[
                     {"role": "system" , "content": "You are an expert blog writer and SEO specialist."} ,
@@ -0,0 +1,6 @@
+# Blog/signals.py
+from django.dispatch import Signal
+
+# Sent once per batch of posts that went live, with ``post_ids`` and
+# ``site_ids`` so caches, sitemaps and feeds can be invalidated in one go.
+posts_published = Signal()
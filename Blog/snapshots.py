@@ -0,0 +1,278 @@
+# Blog/snapshots.py
+"""
+Static JSON snapshots of the headless frontend's read endpoints.
+
+For every site, ``BLOG_SNAPSHOT_ROOT/<domain>/`` mirrors:
+
+    posts-latest.json             posts-latest/?site_domain=<domain>
+    posts-popular.json            posts-popular/?site_domain=<domain>
+    category-slug/<slug>.json     category-slug/?site_domain=<domain>&category_slug=<slug>
+    post/<slug>.json              post/<slug>/ (published posts only)
+    manifest.json                 {path: {"sha256", "bytes", "source"}} for all of the above
+
+Payloads are rendered by the API views themselves, so they match the live
+endpoints byte for byte. Files are replaced atomically and rewritten only
+when their content changes, so a web server or CDN can serve the
+directory directly. The signal receivers at the bottom rebuild only the
+snapshots a saved post or category can affect.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.utils import timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads are serialized
+    fcntl = None
+
+_manifest_lock = threading.Lock()
+
+
+def is_enabled():
+    return settings.BLOG_SNAPSHOTS_ENABLED
+
+
+def snapshot_root():
+    return Path(settings.BLOG_SNAPSHOT_ROOT)
+
+
+def write_atomic(path , data):
+    """Replace ``path`` with ``data`` so readers see the old or the new file, never half of one"""
+    path.parent.mkdir(parents=True , exist_ok=True)
+    descriptor , temporary = tempfile.mkstemp(dir=path.parent , prefix=f'.{path.name}.' , suffix='.tmp')
+    try:
+        with os.fdopen(descriptor , 'wb') as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(temporary , 0o644)
+        os.replace(temporary , path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        raise
+
+
+class SnapshotPublisher:
+    """Renders and writes the snapshots of one site"""
+
+    def __init__(self , site , root=None):
+        from django.test import RequestFactory
+
+        self.site = site
+        self.directory = Path(root or snapshot_root()) / site.domain
+        base = urlsplit(settings.BLOG_SNAPSHOT_BASE_URL)
+        # Absolute media URLs in the payloads are built against this host
+        self.factory = RequestFactory(
+            HTTP_HOST=base.netloc ,
+            SERVER_PORT='443' if base.scheme == 'https' else '80' ,
+            **{'wsgi.url_scheme': base.scheme}
+        )
+        self.manifest_path = self.directory / 'manifest.json'
+
+    # Rendering
+
+    def render(self , view , path , params=None , **kwargs):
+        """Body of a 200 response from ``view``, or ``None`` for anything else"""
+        response = view(self.factory.get(path , params or {}) , **kwargs)
+        if response.status_code != 200:
+            return None
+        if hasattr(response , 'render'):
+            response.render()
+        return response.content
+
+    def render_latest(self):
+        from .api_views import PostsLatestDataView
+        return self.render(PostsLatestDataView.as_view() , '/api/posts-latest/' , {'site_domain': self.site.domain})
+
+    def render_popular(self):
+        from .api_views import PostsPopularDataView
+        return self.render(PostsPopularDataView.as_view() , '/api/posts-popular/' , {'site_domain': self.site.domain})
+
+    def render_category(self , slug):
+        from .api_views import CategorySlugDataView
+        return self.render(CategorySlugDataView.as_view() , '/api/category-slug/' , {
+            'site_domain': self.site.domain ,
+            'category_slug': slug
+        })
+
+    def render_post(self , slug):
+        from .api_views import PostDetailView
+        from .models import Post
+        view = PostDetailView.as_view(queryset=Post.objects.filter(site=self.site , status='published'))
+        return self.render(view , f'/api/post/{slug}/' , slug=slug)
+
+    # Writing
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Serialize manifest updates across threads and, where possible, processes"""
+        self.directory.mkdir(parents=True , exist_ok=True)
+        with _manifest_lock , open(self.directory / '.manifest.lock' , 'w') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock , fcntl.LOCK_EX)
+            yield
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path , encoding='utf-8') as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return {'files': {}}
+
+    def save_manifest(self , manifest):
+        manifest['generated_at'] = timezone.now().isoformat()
+        write_atomic(self.manifest_path , json.dumps(manifest , indent=1 , sort_keys=True).encode())
+
+    def apply(self , changes):
+        """
+        Write or delete snapshots: ``changes`` maps a relative path to
+        ``(body or None, source)``, where ``source`` names the row the file
+        was rendered from (``"post:12"``) so renames can find old files.
+        Unchanged bodies are left alone. Returns the paths touched.
+        """
+        touched = []
+        with self.locked():
+            manifest = self.load_manifest()
+            files = manifest['files']
+            for relative , (body , source) in changes.items():
+                path = self.directory / relative
+                if body is None:
+                    if files.pop(relative , None) is not None or path.exists():
+                        path.unlink(missing_ok=True)
+                        touched.append(relative)
+                    continue
+                digest = hashlib.sha256(body).hexdigest()
+                entry = {'sha256': digest , 'bytes': len(body) , 'source': source}
+                if files.get(relative) == entry and path.exists():
+                    continue
+                write_atomic(path , body)
+                files[relative] = entry
+                touched.append(relative)
+            if touched:
+                self.save_manifest(manifest)
+        return touched
+
+    def paths_from(self , source , files=None):
+        """Snapshot paths currently recorded for a source row (old slugs included)"""
+        files = self.load_manifest()['files'] if files is None else files
+        return [relative for relative , entry in files.items() if entry.get('source') == source]
+
+    def replace(self , source , relative , body , files=None):
+        """Changes writing ``relative`` for ``source`` and dropping its other paths"""
+        changes = {old: (None , None) for old in self.paths_from(source , files) if old != relative}
+        changes[relative] = (body , source)
+        return changes
+
+    # Dependent sets
+
+    def list_changes(self):
+        return {
+            'posts-latest.json': (self.render_latest() , 'latest') ,
+            'posts-popular.json': (self.render_popular() , 'popular') ,
+        }
+
+    def publish_posts(self , posts=() , removed_ids=()):
+        """Refresh the given posts (and drop removed ones) plus the site-wide lists"""
+        changes , files = {} , self.load_manifest()['files']
+        for post_id in removed_ids:
+            for relative in self.paths_from(f'post:{post_id}' , files):
+                changes[relative] = (None , None)
+        for post in posts:
+            changes.update(self.replace(
+                f'post:{post.pk}' , f'post/{post.slug}.json' , self.render_post(post.slug) , files
+            ))
+        changes.update(self.list_changes())
+        return self.apply(changes)
+
+    def publish_category(self , category_id , slug=None):
+        """Refresh one category; ``slug=None`` means it was deleted"""
+        source = f'category:{category_id}'
+        if slug is None:
+            return self.apply({relative: (None , None) for relative in self.paths_from(source)})
+        return self.apply(self.replace(source , f'category-slug/{slug}.json' , self.render_category(slug)))
+
+    def rebuild(self):
+        """Render everything for the site and delete snapshots nothing maps to any more"""
+        from .models import Category , Post
+
+        changes = {relative: (None , None) for relative in self.load_manifest()['files']}
+        posts = Post.objects.filter(site=self.site , status='published').values_list('pk' , 'slug')
+        for post_id , slug in posts.iterator():
+            changes[f'post/{slug}.json'] = (self.render_post(slug) , f'post:{post_id}')
+        categories = Category.objects.filter(site=self.site).values_list('pk' , 'slug')
+        for category_id , slug in categories.iterator():
+            changes[f'category-slug/{slug}.json'] = (self.render_category(slug) , f'category:{category_id}')
+        changes.update(self.list_changes())
+        return self.apply(changes)
+
+
+# Signal receivers. Publishing runs after the transaction commits so the
+# views read what was just saved.
+
+def _publish_post(site_id , post_id , deleted=False):
+    from .models import Post
+
+    def publish():
+        site = Site.objects.filter(pk=site_id).first()
+        if site is None:
+            return
+        publisher = SnapshotPublisher(site)
+        if deleted:
+            publisher.publish_posts(removed_ids=[post_id])
+        else:
+            publisher.publish_posts(Post.objects.filter(pk=post_id).only('pk' , 'slug'))
+
+    transaction.on_commit(publish)
+
+
+def post_saved(sender , instance , **kwargs):
+    if is_enabled():
+        _publish_post(instance.site_id , instance.pk)
+
+
+def post_deleted(sender , instance , **kwargs):
+    if is_enabled():
+        _publish_post(instance.site_id , instance.pk , deleted=True)
+
+
+def posts_published(sender , post_ids , site_ids , **kwargs):
+    if not is_enabled():
+        return
+    from .models import Post
+
+    def publish():
+        for site in Site.objects.filter(pk__in=site_ids):
+            posts = Post.objects.filter(pk__in=post_ids , site=site).only('pk' , 'slug')
+            SnapshotPublisher(site).publish_posts(posts)
+
+    transaction.on_commit(publish)
+
+
+def _publish_category(site_id , category_id , slug=None):
+    def publish():
+        site = Site.objects.filter(pk=site_id).first()
+        if site is not None:
+            SnapshotPublisher(site).publish_category(category_id , slug)
+
+    transaction.on_commit(publish)
+
+
+def category_saved(sender , instance , **kwargs):
+    if is_enabled():
+        _publish_category(instance.site_id , instance.pk , instance.slug)
+
+
+def category_deleted(sender , instance , **kwargs):
+    if is_enabled():
+        _publish_category(instance.site_id , instance.pk)
@@ -0,0 +1,224 @@
+# Blog/storage.py
+"""
+Content-addressed media storage.
+
+Every upload (image fields and CKEditor uploads alike) is hashed while it
+is written and stored once as ``BLOG_MEDIA_BLOB_PREFIX/<ab>/<sha256><ext>``;
+uploading the same bytes again returns the existing name. A blob's name
+never points at different bytes, so its URL can be cached for a year
+(see ``serve_media``). ``MediaBlob`` rows keep one refcount per blob,
+maintained by the receivers at the bottom.
+"""
+import collections
+import hashlib
+import os
+import re
+import tempfile
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.db.models import F
+from django.views.static import serve
+
+from .analysis import analyze_html
+
+DEFAULT_BLOB_PREFIX = 'uploads/blobs/'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# ckeditor_uploader saves "<name>_thumb<ext>" next to whatever name the upload got
+_blob_pattern = re.compile(r'^[0-9a-f]{2}/(?P<digest>[0-9a-f]{64})(?P<thumbnail>_thumb)?(?:\.[\w]+)?$')
+
+
+def blob_prefix():
+    return getattr(settings , 'BLOG_MEDIA_BLOB_PREFIX' , DEFAULT_BLOB_PREFIX).rstrip('/') + '/'
+
+
+def is_blob_name(name):
+    """Whether ``name`` is a content-addressed name (or the CKEditor thumbnail of one)"""
+    prefix = blob_prefix()
+    return name.startswith(prefix) and _blob_pattern.match(name[len(prefix):]) is not None
+
+
+def is_thumbnail_name(name):
+    prefix = blob_prefix()
+    match = _blob_pattern.match(name[len(prefix):]) if name.startswith(prefix) else None
+    return match is not None and match.group('thumbnail') is not None
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """``FileSystemStorage`` that names files after the SHA-256 of their content"""
+
+    def get_available_name(self , name , max_length=None):
+        # The final name is only known once the content is hashed in _save()
+        return name
+
+    def _save(self , name , content):
+        if is_thumbnail_name(name):
+            # Named after its original's blob, so as immutable as the original
+            if not self._touch(name):
+                temporary , _ , _ = self._spool(os.path.dirname(self.path(name)) , content)
+                self._publish(temporary , name)
+            return name
+
+        temporary , digest , size = self._spool(self.path(blob_prefix()) , content)
+        name = f'{blob_prefix()}{digest[:2]}/{digest}{os.path.splitext(name)[1].lower()}'
+        if self._touch(name):
+            os.unlink(temporary)
+        else:
+            self._publish(temporary , name)
+
+        from .models import MediaBlob
+        MediaBlob.objects.get_or_create(name=name , defaults={'size': size})
+        return name
+
+    def _touch(self , name):
+        """
+        Mark an existing blob as just uploaded; ``False`` if there is none.
+        ``gc_media`` goes by modification time, so without this a re-upload
+        of an old blob could be collected before the post using it is saved.
+        """
+        try:
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _spool(self , directory , content):
+        """Write ``content`` to a hidden temporary file, hashing it on the way"""
+        os.makedirs(directory , exist_ok=True)
+        descriptor , temporary = tempfile.mkstemp(dir=directory , prefix='.upload-')
+        digest , size = hashlib.sha256() , 0
+        try:
+            with os.fdopen(descriptor , 'wb') as handle:
+                if hasattr(content , 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    digest.update(chunk)
+                    size += len(chunk)
+                    handle.write(chunk)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return temporary , digest.hexdigest() , size
+
+    def _publish(self , temporary , name):
+        path = self.path(name)
+        try:
+            os.makedirs(os.path.dirname(path) , exist_ok=True)
+            os.chmod(temporary , self.file_permissions_mode or 0o644)
+            # Same name, same bytes: a concurrent upload of the same file is harmless
+            os.replace(temporary , path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+            raise
+
+
+def serve_media(request , path , document_root=None , show_indexes=False):
+    """``django.views.static.serve`` that marks blob URLs as immutable"""
+    response = serve(request , path , document_root=document_root , show_indexes=show_indexes)
+    if is_blob_name(path):
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+# Refcounts: one per image field or post body that names a blob
+
+def media_references(instance):
+    """Counter of the blob names ``instance`` refers to"""
+    from .integrity import image_field_names
+    from .models import Post
+
+    references = collections.Counter()
+    for field in image_field_names(type(instance)):
+        name = getattr(instance , field).name
+        if name and is_blob_name(name):
+            references[name] += 1
+    if isinstance(instance , Post):
+        domain = instance.site.domain if instance.site_id else None
+        stats = instance.content_stats()
+        references.update(_content_blobs(stats , domain))
+    return references
+
+
+def _content_blobs(stats , domain):
+    from .integrity import media_name
+
+    for url in stats.image_sources + [href for href , _ in stats.internal_links]:
+        name = media_name(url , domain)
+        if name and is_blob_name(name):
+            yield name
+
+
+def _stored_references(instance):
+    """``media_references`` of the row as it is in the database"""
+    from .integrity import image_field_names
+    from .models import Post
+
+    fields = image_field_names(type(instance))
+    is_post = isinstance(instance , Post)
+    row = type(instance)._base_manager.filter(pk=instance.pk).values(
+        *fields , *(('content' , 'site__domain') if is_post else ())
+    ).first()
+    references = collections.Counter()
+    if row is None:
+        return references
+    for field in fields:
+        if row[field] and is_blob_name(row[field]):
+            references[row[field]] += 1
+    if is_post:
+        references.update(_content_blobs(analyze_html(row['content'] , row['site__domain']) , row['site__domain']))
+    return references
+
+
+def adjust_refcounts(delta):
+    """Apply a ``{blob name: change}`` mapping, one UPDATE per distinct change"""
+    from .models import MediaBlob
+
+    by_change = collections.defaultdict(list)
+    for name , change in delta.items():
+        if change:
+            by_change[change].append(name)
+    for change , names in by_change.items():
+        MediaBlob.objects.filter(name__in=names).update(refcount=F('refcount') + change)
+
+
+def references_before_save(sender , instance , raw=False , update_fields=None , **kwargs):
+    if raw:
+        return
+    from .integrity import image_field_names
+
+    watched = set(image_field_names(sender)) | {'content'}
+    if update_fields is not None and not watched & set(update_fields):
+        return
+    instance._stored_media_references = _stored_references(instance) if instance.pk else collections.Counter()
+
+
+def references_after_save(sender , instance , raw=False , **kwargs):
+    previous = instance.__dict__.pop('_stored_media_references' , None)
+    if raw or previous is None:
+        return
+    current = media_references(instance)
+    adjust_refcounts({name: current[name] - previous[name] for name in current.keys() | previous.keys()})
+
+
+def references_after_delete(sender , instance , **kwargs):
+    adjust_refcounts({name: -count for name , count in media_references(instance).items()})
+
+
+def recount(using='default'):
+    """Recompute every refcount from scratch; returns the number of blobs"""
+    from .models import Category , MasterCategory , MediaBlob , Post , Tag
+
+    counts = collections.Counter()
+    for model in (Post , Category , Tag , MasterCategory):
+        queryset = model.objects.using(using).all()
+        if model is Post:
+            queryset = queryset.select_related('site')
+        for instance in queryset.iterator(chunk_size=200):
+            counts.update(media_references(instance))
+
+    blobs = list(MediaBlob.objects.using(using).all())
+    for blob in blobs:
+        blob.refcount = counts[blob.name]
+    MediaBlob.objects.using(using).bulk_update(blobs , ['refcount'] , batch_size=500)
+    return len(blobs)
@@ -0,0 +1,57 @@
+# Blog/streaming.py
+"""
+Helpers for streaming large serialized querysets without building the
+whole payload in memory. Rows are read in chunks through
+``QuerySet.iterator`` (a server-side cursor on PostgreSQL), serialized one
+chunk at a time and written out as either a JSON array or NDJSON.
+"""
+import itertools
+
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_sequence
+from rest_framework.renderers import JSONRenderer
+
+CONTENT_TYPES = {
+    'json': 'application/json' ,
+    'ndjson': 'application/x-ndjson' ,
+}
+_accepts_gzip = _lazy_re_compile(r'\bgzip\b')
+
+
+def serialized_rows(queryset , serializer_class , context=None , chunk_size=500):
+    """Yield one serialized dict per row, ``chunk_size`` rows per query batch"""
+    rows = queryset.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = list(itertools.islice(rows , chunk_size))
+        if not chunk:
+            return
+        yield from serializer_class(chunk , many=True , context=context).data
+
+
+def encode_rows(rows , output_format='json'):
+    """Encode dicts as a JSON array or as NDJSON, one element at a time"""
+    render = JSONRenderer().render
+    if output_format == 'ndjson':
+        for row in rows:
+            yield render(row) + b'\n'
+        return
+
+    yield b'['
+    for index , row in enumerate(rows):
+        yield (b',' if index else b'') + render(row)
+    yield b']'
+
+
+def streaming_response(request , chunks , output_format='json'):
+    """``StreamingHttpResponse`` for encoded chunks, gzipped when the client accepts it"""
+    gzip = _accepts_gzip.search(request.META.get('HTTP_ACCEPT_ENCODING' , ''))
+    response = StreamingHttpResponse(
+        compress_sequence(chunks) if gzip else chunks ,
+        content_type=CONTENT_TYPES[output_format]
+    )
+    if gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    patch_vary_headers(response , ('Accept-Encoding' ,))
+    return response
@@ -1,3 +1,1078 @@
-from django.test import TestCase
+import gzip
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlsplit
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser , User
+from django.contrib.sites.models import Site
+from django.core import checks
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import CommandError , call_command
+from django.db import connection , connections
+from django.http import HttpResponse
+from django.test import RequestFactory , SimpleTestCase , TestCase , override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+
+from Nativeblog import routers
+from Nativeblog.staticfiles import (
+    DEFAULT_CACHE_CONTROL , IMMUTABLE_CACHE_CONTROL , MINIMUM_COMPRESS_SIZE , CompressedManifestStaticFilesStorage ,
+    StaticFilesMiddleware , accepted_encodings
+)
+from Nativeblog.db import (
+    check_database_connections , check_database_settings , postgres_settings , profile_problems , sqlite_settings
+)
+
+from .analysis import analyze_html
+from .cache import content_version
+from .integrity import scan
+from .management.commands.startup_profile import parse_importtime
+from .links import broken_links , most_linked , orphan_posts , post_url
+from .media_gc import candidates
+from .models import Category , Comment , MasterCategory , MediaBlob , Post , PostLink , PostRevision , Tag
+from .pagination import cached_count
+from .publishing import due_posts , publish_due_batch , publish_due_posts
+from .rendering import render_content
+from .revisions import apply_delta , make_delta
+from .search import search_posts
+from .signals import posts_published
+
+
+# Admin pages render {% static %}; tests don't depend on a collectstatic manifest
+plain_static_files = override_settings(STORAGES={
+    **settings.STORAGES , 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'} ,
+})
+
+
+def create_posts(count=5 , domain='unplugwell.com'):
+    """A site with one author, category and tag, and ``count`` published posts"""
+    site = Site.objects.get_or_create(domain=domain , defaults={'name': domain})[0]
+    author = User.objects.get_or_create(username='author')[0]
+    master_category = MasterCategory.objects.get_or_create(name='Health' , slug='health')[0]
+    category = Category.objects.create(name=f'Sleep {domain}' , master_category=master_category , site=site)
+    tag = Tag.objects.create(name=f'Rest {domain}' , site=site)
+    posts = []
+    for index in range(count):
+        post = Post.objects.create(
+            title=f'Post {index}' , content='<p>hello world</p>' * (index + 1) , excerpt='Excerpt' ,
+            featured_image='blog/images/a.png' , image_alt='a' , site=site , author=author , category=category ,
+            status='published' ,
+        )
+        post.tags.add(tag)
+        posts.append(post)
+    return site , author , category , tag , posts
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def test_narrow_fields_read_only_their_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/categories/?fields=id,title,slug')
+
+        self.assertEqual(response.status_code , 200)
+        self.assertEqual(set(response.json()[0]) , {'id' , 'title' , 'slug'})
+        post_queries = [query['sql'] for query in queries.captured_queries if 'FROM "Blog_post"' in query['sql']]
+        self.assertEqual(len(post_queries) , 1)
+        # The site join is the domain filter; nothing is select_related
+        columns = post_queries[0].split(' FROM ')[0]
+        self.assertEqual(columns , 'SELECT "Blog_post"."id", "Blog_post"."title", "Blog_post"."slug"')
+
+    def test_expanded_relation_is_joined(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/categories/?fields=id,title&expand=category')
+
+        self.assertEqual(response.json()[0]['category']['id'] , self.category.id)
+        post_query = next(query['sql'] for query in queries.captured_queries if 'FROM "Blog_post"' in query['sql'])
+        self.assertIn('"Blog_category"' , post_query)
+        self.assertNotIn('"auth_user"' , post_query)
+
+    def test_unexpanded_relation_collapses_to_a_key(self):
+        response = self.client.get('/api/categories/?fields=id,category,tags')
+
+        self.assertEqual(response.json()[0]['category'] , self.category.id)
+        self.assertEqual(response.json()[0]['tags'] , [self.tag.id])
+
+
+class ScheduledPublishingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        now = timezone.now()
+        self.due = self.posts[:3]
+        Post.objects.filter(pk__in=[post.pk for post in self.due]).update(
+            status='scheduled' , published_at=now - timedelta(hours=1)
+        )
+        Post.objects.filter(pk=self.posts[3].pk).update(status='scheduled' , published_at=now + timedelta(days=1))
+
+    def test_due_posts_are_published_in_batches(self):
+        batches = []
+
+        def receiver(sender , post_ids , site_ids , **kwargs):
+            batches.append((sorted(post_ids) , site_ids))
+
+        posts_published.connect(receiver)
+        self.addCleanup(posts_published.disconnect , receiver)
+        call_command('publish_scheduled' , batch_size=2 , stdout=open(os.devnull , 'w'))
+
+        self.assertEqual([len(post_ids) for post_ids , _ in batches] , [2 , 1])
+        self.assertEqual(sorted(sum((post_ids for post_ids , _ in batches) , [])) , [post.pk for post in self.due])
+        self.assertEqual(batches[0][1] , [self.site.pk])
+        self.assertEqual(list(Post.objects.filter(status='scheduled').values_list('pk' , flat=True)) ,
+                         [self.posts[3].pk])
+
+    def test_posts_published_by_another_worker_are_not_announced(self):
+        batches = []
+
+        def receiver(sender , post_ids , site_ids , **kwargs):
+            batches.append(sorted(post_ids))
+
+        def stale_due_posts(now):
+            # Another worker publishes the first post between this one's select and update
+            post_ids = list(due_posts(now).values_list('id' , flat=True))
+            Post.objects.filter(pk=post_ids[0]).update(status='published' , updated_at=now - timedelta(seconds=1))
+            return Post.objects.filter(pk__in=post_ids).order_by('published_at')
+
+        posts_published.connect(receiver)
+        self.addCleanup(posts_published.disconnect , receiver)
+        with mock.patch('Blog.publishing.due_posts' , stale_due_posts):
+            published = publish_due_batch()
+
+        self.assertEqual(published , sorted(post.pk for post in self.due[1:]))
+        self.assertEqual(batches , [published])
+
+    def test_publishing_retires_cached_payloads_and_counts(self):
+        published = Post.objects.filter(status='published')
+        self.assertEqual(cached_count(published , 300) , 1)
+        version = content_version()
+
+        self.assertEqual(publish_due_posts() , 3)
+
+        self.assertGreater(content_version() , version)
+        self.assertEqual(cached_count(published , 300) , 4)
+
+
+class AdjacentPostTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        # Two posts share a publish date; the id breaks the tie
+        start = timezone.now() - timedelta(days=10)
+        for index , post in enumerate(self.posts):
+            Post.objects.filter(pk=post.pk).update(published_at=start + timedelta(days=min(index , 3)))
+        create_posts(2 , domain='other.com')
+
+    def test_next_and_previous_in_one_query(self):
+        post = Post.objects.get(pk=self.posts[2].pk)
+        with self.assertNumQueries(1):
+            adjacent = post.get_adjacent_posts()
+            post.get_adjacent_posts()
+
+        self.assertEqual(adjacent['previous']['id'] , self.posts[1].pk)
+        self.assertEqual(adjacent['next']['id'] , self.posts[3].pk)
+
+    def test_ties_on_published_at_are_ordered_by_id(self):
+        third , fourth = Post.objects.get(pk=self.posts[3].pk) , Post.objects.get(pk=self.posts[4].pk)
+
+        self.assertEqual(third.get_adjacent_posts()['next']['id'] , fourth.pk)
+        self.assertEqual(fourth.get_adjacent_posts()['previous']['id'] , third.pk)
+        self.assertIsNone(fourth.get_adjacent_posts()['next'])
+
+    def test_first_post_has_no_previous_and_other_sites_are_ignored(self):
+        adjacent = Post.objects.get(pk=self.posts[0].pk).get_adjacent_posts()
+
+        self.assertIsNone(adjacent['previous'])
+        self.assertEqual(adjacent['next']['id'] , self.posts[1].pk)
+
+    def test_drafts_are_skipped(self):
+        Post.objects.filter(pk=self.posts[2].pk).update(status='draft')
+
+        adjacent = Post.objects.get(pk=self.posts[1].pk).get_adjacent_posts()
+
+        self.assertEqual(adjacent['next']['id'] , self.posts[3].pk)
+
+
+class LookaheadPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site , self.author , self.category , self.tag , self.posts = create_posts(15)
+
+    def post_queries(self , url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        return response , [query['sql'] for query in queries.captured_queries if '"Blog_post"' in query['sql']]
+
+    def test_last_page_counts_from_the_rows_it_fetched(self):
+        response , queries = self.post_queries('/api/posts/?page=3')
+
+        self.assertEqual(response.json()['count'] , 15)
+        self.assertIsNone(response.json()['next'])
+        self.assertEqual(len(response.json()['results']) , 3)
+        self.assertFalse([sql for sql in queries if 'COUNT(' in sql])
+
+    def test_middle_page_count_is_cached(self):
+        response , queries = self.post_queries('/api/posts/?page=2')
+        self.assertEqual(response.json()['count'] , 15)
+        self.assertIn('page=3' , response.json()['next'])
+        self.assertEqual(len([sql for sql in queries if 'COUNT(' in sql]) , 1)
+
+        response , queries = self.post_queries('/api/posts/')
+        self.assertEqual(response.json()['count'] , 15)
+        self.assertFalse([sql for sql in queries if 'COUNT(' in sql or 'EXISTS' in sql or 'LIMIT 1' in sql])
+
+    def test_last_page_alias_and_out_of_range(self):
+        response = self.client.get('/api/posts/?page=last')
+        self.assertEqual(len(response.json()['results']) , 3)
+        self.assertEqual(self.client.get('/api/posts/?page=9').status_code , 404)
+
+    def test_no_data_in_a_single_query(self):
+        response , queries = self.post_queries('/api/posts/?site_domain=nowhere.example')
+
+        self.assertEqual(response.status_code , 404)
+        self.assertEqual(response.json() , {'message': 'No Available Data'})
+        self.assertEqual(len(queries) , 1)
+
+
+class RevisionStorageTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts(1)
+        self.post = self.posts[0]
+
+    def record_versions(self , count):
+        words = [f'word{index} ' for index in range(2000)]
+        versions = []
+        for index in range(count):
+            words[(index * 37) % len(words)] = f'edit{index} '
+            self.post.content = '<p>' + ''.join(words) + '</p>'
+            versions.append(self.post.content)
+            self.assertIsNotNone(PostRevision.record(self.post , self.author , f'edit {index}'))
+        return versions
+
+    def test_deltas_round_trip_between_snapshots(self):
+        versions = self.record_versions(23)
+        revisions = list(PostRevision.objects.filter(post=self.post).order_by('id'))
+
+        self.assertEqual([revision.is_snapshot for revision in revisions] ,
+                         [index % PostRevision.SNAPSHOT_INTERVAL == 0 for index in range(23)])
+        for revision , version in zip(revisions , versions):
+            self.assertEqual(PostRevision.objects.get(pk=revision.pk).get_content() , version)
+        stored = sum(len(revision.content) + len(revision.content_delta or b'') for revision in revisions)
+        self.assertLess(stored , sum(map(len , versions)) / 5)
+
+    def test_unchanged_content_is_not_recorded(self):
+        self.record_versions(1)
+        self.assertIsNone(PostRevision.record(self.post , self.author))
+
+    def test_delta_edge_cases(self):
+        for old , new in [('' , 'x') , ('<p>a b</p>' , '') , ('a < b' , 'a <b> c <') , ('<p>x</p>\n y' , '<p>y</p> \n y z')]:
+            self.assertEqual(apply_delta(old , make_delta(old , new)) , new)
+
+
+@plain_static_files
+class RevisionAdminTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts(2)
+        self.client.force_login(User.objects.create_superuser('admin' , 'admin@example.com' , 'password'))
+
+    def add_revisions(self , post , count):
+        for index in range(count):
+            post.content = f'<p>version {index}</p>'
+            PostRevision.record(post , self.author)
+
+    def changelist_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/Blog/postrevision/')
+        self.assertEqual(response.status_code , 200)
+        return len(queries.captured_queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        self.add_revisions(self.posts[0] , 2)
+        few = self.changelist_queries()
+        self.add_revisions(self.posts[1] , 12)
+
+        self.assertEqual(self.changelist_queries() , few)
+
+    def test_post_page_lists_only_the_latest_revisions(self):
+        self.add_revisions(self.posts[0] , 15)
+
+        response = self.client.get(f'/admin/Blog/post/{self.posts[0].pk}/change/')
+
+        formset = next(formset for formset in response.context['inline_admin_formsets']
+                       if formset.opts.model is PostRevision)
+        self.assertEqual(len(formset.formset.forms) , 10)
+        self.assertContains(response , f'?post__id__exact={self.posts[0].pk}')
+        self.assertEqual(self.client.get(f'/admin/Blog/postrevision/?post__id__exact={self.posts[0].pk}').status_code ,
+                         200)
+
+
+
+@plain_static_files
+class PostChangelistTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        self.client.force_login(User.objects.create_superuser('admin' , 'admin@example.com' , 'password'))
+
+    def changelist(self , query=''):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/admin/Blog/post/{query}')
+        self.assertEqual(response.status_code , 200)
+        return response , len(queries.captured_queries)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        few = self.changelist()[1]
+        create_posts(20 , domain='other.example')
+        Comment.objects.create(post=self.posts[0] , author_name='a' , author_email='a@example.com' , content='x')
+
+        response , queries = self.changelist()
+
+        self.assertEqual(queries , few)
+        self.assertEqual(len(response.context['cl'].result_list) , 25)
+
+    def test_search_uses_the_index(self):
+        self.posts[2].content = '<p>zebra crossing</p>'
+        self.posts[2].save()
+
+        response = self.changelist('?q=zebra')[0]
+
+        self.assertEqual(list(response.context['cl'].result_list) , [self.posts[2]])
+        self.assertEqual(list(search_posts(Post.objects.all() , 'zeb')) , [self.posts[2]])
+        self.posts[2].delete()
+        self.assertFalse(search_posts(Post.objects.all() , 'zeb').exists())
+
+    def test_search_without_an_index_falls_back_to_like(self):
+        self.posts[2].content = '<p>zebra crossing</p>'
+        self.posts[2].save()
+
+        with mock.patch.object(connections['default'] , 'vendor' , 'unindexed'):
+            self.assertEqual(list(search_posts(Post.objects.all() , 'crossing ZEBRA')) , [self.posts[2]])
+            self.assertFalse(search_posts(Post.objects.all() , 'zebra lion').exists())
+            response = self.changelist('?q=zebra')[0]
+
+        self.assertEqual(list(response.context['cl'].result_list) , [self.posts[2]])
+
+
+
+@plain_static_files
+class PublishedPostsFilterTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        empty = MasterCategory.objects.create(name='Empty' , slug='empty')
+        self.empty_category = Category.objects.create(name='Unused' , master_category=empty , site=self.site)
+        self.empty_tag = Tag.objects.create(name='Unused' , site=self.site)
+        self.client.force_login(User.objects.create_superuser('admin' , 'admin@example.com' , 'password'))
+
+    def test_filter_counts_each_row_once(self):
+        for model in ('mastercategory' , 'category' , 'tag'):
+            for value , expected in (('' , 2) , ('?has_posts=yes' , 1) , ('?has_posts=no' , 1)):
+                with self.subTest(model=model , value=value):
+                    response = self.client.get(f'/admin/Blog/{model}/{value}')
+                    self.assertEqual(response.context['cl'].result_count , expected)
+
+        response = self.client.get('/admin/Blog/category/?has_posts=no')
+        self.assertEqual(list(response.context['cl'].result_list) , [self.empty_category])
+
+    def test_master_category_totals(self):
+        changelist = self.client.get('/admin/Blog/mastercategory/').context['cl']
+
+        totals = {
+            master.slug: (changelist.model_admin.total_posts(master) , changelist.model_admin.active_categories_count(master))
+            for master in changelist.result_list
+        }
+        self.assertEqual(totals , {'health': (5 , 1) , 'empty': (0 , 1)})
+
+
+
+class PostTransferTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory , 'posts.ndjson')
+        self.checkpoint = os.path.join(self.directory , 'checkpoint.json')
+        self.other = Site.objects.create(domain='other.example' , name='Other')
+
+    def ndjson(self , *args):
+        call_command('posts_ndjson' , *args , '--batch-size' , '2' , stderr=io.StringIO())
+
+    def lines(self):
+        with open(self.path , encoding='utf-8') as handle:
+            return [json.loads(line) for line in handle]
+
+    def test_round_trip_into_another_site(self):
+        blob = MediaBlob.objects.create(name=f'uploads/blobs/ab/{"ab" * 32}.png' , size=1)
+        first , second = self.posts[0] , self.posts[1]
+        first.featured_image = blob.name
+        # A relative link, so it stays internal on the target site
+        first.content += f'<p><a href="{urlsplit(post_url(self.site.domain , second.slug)).path}">next</a></p>'
+        first.save()
+        first.related_posts.add(self.posts[3])
+        for index in range(3):
+            first.content += f'<p>edit {index}</p>'
+            first.save()
+            PostRevision.record(first , self.author)
+
+        self.ndjson('export' , self.path)
+        self.ndjson('import' , self.path , '--site' , self.other.domain)
+
+        imported = Post.objects.filter(site=self.other)
+        copy = imported.get(slug=first.slug)
+        self.assertEqual(imported.count() , 5)
+        self.assertEqual(copy.content , first.content)
+        self.assertEqual(list(copy.related_posts.values_list('slug' , flat=True)) , [self.posts[3].slug])
+        self.assertEqual([revision.get_content() for revision in copy.revisions.order_by('pk')] ,
+                         [revision.get_content() for revision in first.revisions.order_by('pk')])
+        # bulk_create skipped post_save; the importer redoes its bookkeeping
+        self.assertEqual(PostLink.objects.get(source=copy).target , imported.get(slug=second.slug))
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount , 2)
+
+        self.ndjson('import' , self.path , '--site' , self.other.domain)
+        self.assertEqual(imported.count() , 5)
+
+    def test_export_resume_drops_the_unfinished_tail(self):
+        self.ndjson('export' , self.path)
+        complete = self.lines()
+        with open(self.path , 'rb') as handle:
+            offset = len(b''.join(handle.readlines()[:2]))
+        with open(self.path , 'ab') as handle:
+            handle.write(b'{"half a record')
+        with open(self.checkpoint , 'w') as handle:
+            json.dump({'action': 'export' , 'last_id': self.posts[1].pk , 'written': 2 , 'offset': offset} , handle)
+
+        self.ndjson('export' , self.path , '--checkpoint' , self.checkpoint)
+
+        self.assertEqual(self.lines() , complete)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+
+
+class PostStreamTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def stream(self , query='' , **headers):
+        response = self.client.get(f'/api/all-posts/stream/{query}' , headers=headers)
+        self.assertTrue(response.streaming)
+        return response , b''.join(response.streaming_content)
+
+    def test_stream_matches_the_buffered_feed(self):
+        expected = {post['id']: post for post in self.client.get('/api/all-posts/').json()}
+
+        streamed = {post['id']: post for post in json.loads(self.stream()[1])}
+
+        self.assertEqual(streamed , expected)
+
+    def test_ndjson_is_compressed_on_request(self):
+        response , body = self.stream('?output=ndjson' , accept_encoding='gzip')
+
+        self.assertEqual(response['Content-Encoding'] , 'gzip')
+        self.assertEqual(len(gzip.decompress(body).splitlines()) , 5)
+
+    def test_since_returns_only_changed_posts(self):
+        since = self.stream()[0]['X-Sync-Until']
+        self.assertEqual(json.loads(self.stream(f'?since={since}')[1]) , [])
+
+        Post.objects.filter(pk=self.posts[2].pk).update(updated_at=timezone.now())
+
+        changed = json.loads(self.stream(f'?since={since}')[1])
+        self.assertEqual([post['id'] for post in changed] , [self.posts[2].pk])
+
+    def test_bad_parameters_are_rejected(self):
+        self.assertEqual(self.client.get('/api/all-posts/stream/?since=bad').status_code , 400)
+        self.assertEqual(self.client.get('/api/all-posts/stream/?output=xml').status_code , 400)
+
+
+
+class FeedTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        self.posts[1].show_in_feed = False
+        self.posts[1].save()
+        self.other_tag = Tag.objects.create(name='Other' , site=self.site)
+        self.posts[2].tags.add(self.other_tag)
+
+    def test_feeds_list_posts_shown_in_feeds(self):
+        rss = self.client.get('/api/feeds/unplugwell.com/rss/')
+        atom = self.client.get('/api/feeds/unplugwell.com/atom/')
+        category = self.client.get(f'/api/feeds/unplugwell.com/category/{self.category.slug}/rss/')
+        tag = self.client.get(f'/api/feeds/unplugwell.com/tag/{self.other_tag.slug}/atom/')
+
+        self.assertEqual(rss['Content-Type'] , 'application/rss+xml; charset=utf-8')
+        self.assertEqual(rss.content.count(b'<item>') , 4)
+        self.assertEqual(atom.content.count(b'<entry>') , 4)
+        self.assertEqual(category.content.count(b'<item>') , 4)
+        self.assertEqual(tag.content.count(b'<entry>') , 1)
+        self.assertEqual(self.client.get('/api/feeds/missing.example/rss/').status_code , 404)
+
+    def test_unchanged_feed_is_not_modified(self):
+        response = self.client.get('/api/feeds/unplugwell.com/rss/')
+
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get('/api/feeds/unplugwell.com/rss/' , headers={'if-none-match': response['ETag']})
+        self.assertEqual(cached.status_code , 304)
+        self.assertLessEqual(len(queries.captured_queries) , 1)
+        since = self.client.get('/api/feeds/unplugwell.com/rss/' , headers={'if-modified-since': response['Last-Modified']})
+        self.assertEqual(since.status_code , 304)
+
+    def test_editing_a_post_changes_only_its_feeds(self):
+        rss = self.client.get('/api/feeds/unplugwell.com/rss/')
+        tag = self.client.get(f'/api/feeds/unplugwell.com/tag/{self.other_tag.slug}/atom/')
+
+        self.posts[0].title = 'Changed'
+        self.posts[0].save()
+
+        response = self.client.get('/api/feeds/unplugwell.com/rss/' , headers={'if-none-match': rss['ETag']})
+        self.assertContains(response , 'Changed')
+        response = self.client.get(f'/api/feeds/unplugwell.com/tag/{self.other_tag.slug}/atom/' ,
+                                   headers={'if-none-match': tag['ETag']})
+        self.assertEqual(response.status_code , 304)
+
+
+
+class SnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.root = Path(tempfile.mkdtemp())
+        snapshots = override_settings(
+            BLOG_SNAPSHOTS_ENABLED=True , BLOG_SNAPSHOT_ROOT=self.root , BLOG_SNAPSHOT_BASE_URL='http://localhost:8000' ,
+            ALLOWED_HOSTS=['localhost' , 'testserver'] ,
+        )
+        snapshots.enable()
+        self.addCleanup(snapshots.disable)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site , self.author , self.category , self.tag , self.posts = create_posts()
+        self.directory = self.root / self.site.domain
+
+    def files(self , folder=''):
+        return sorted(str(path.relative_to(self.directory / folder)) for path in (self.directory / folder).rglob('*.json'))
+
+    def test_snapshots_match_the_live_api(self):
+        self.assertEqual(self.files() , [
+            f'category-slug/{self.category.slug}.json' , 'manifest.json' ,
+            *[f'post/{post.slug}.json' for post in self.posts] , 'posts-latest.json' , 'posts-popular.json' ,
+        ])
+        latest = self.client.get('/api/posts-latest/' , {'site_domain': self.site.domain} , HTTP_HOST='localhost:8000')
+        post = self.client.get(f'/api/post/{self.posts[0].slug}/' , HTTP_HOST='localhost:8000')
+        self.assertEqual((self.directory / 'posts-latest.json').read_bytes() , latest.content)
+        self.assertEqual((self.directory / f'post/{self.posts[0].slug}.json').read_bytes() , post.content)
+        manifest = json.loads((self.directory / 'manifest.json').read_text())
+        self.assertEqual(len(manifest['files']) , 8)
+
+    def test_changes_replace_and_remove_files(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.posts[0].slug = 'renamed'
+            self.posts[0].save()
+            self.posts[1].status = 'draft'
+            self.posts[1].save()
+            self.posts[2].delete()
+            self.category.slug = 'renamed-category'
+            self.category.save()
+
+        self.assertEqual(self.files('post') , [f'{self.posts[3].slug}.json' , f'{self.posts[4].slug}.json' , 'renamed.json'])
+        self.assertEqual(self.files('category-slug') , ['renamed-category.json'])
+
+        files = self.files()
+        call_command('publish_snapshots' , stdout=io.StringIO())
+        self.assertEqual(self.files() , files)
+
+
+
+class ContentStatsTests(TestCase):
+    def test_analyze_html(self):
+        stats = analyze_html(
+            '<p>Hello <b>wor</b>ld</p><p>two&amp;three</p><script>var x = 1;</script>'
+            '<a href="/x">in</a> <a href="https://unplugwell.com/y">in2</a> <a href="https://example.com">out</a>'
+            '<a href="mailto:a@example.com">m</a><img src="a.png"><img src="b.png"/>' ,
+            'unplugwell.com'
+        )
+
+        self.assertEqual(stats.word_count , 6)
+        self.assertNotIn('var x' , stats.text)
+        self.assertEqual(stats.internal_links , [('/x' , 'in') , ('https://unplugwell.com/y' , 'in2')])
+        self.assertEqual(stats.external_link_count , 1)
+        self.assertEqual(stats.image_sources , ['a.png' , 'b.png'])
+
+    def test_stats_are_stored_on_save_and_backfilled(self):
+        post = create_posts(1)[4][0]
+        post.content = '<p>' + 'word ' * 450 + '</p>'
+        post.save()
+        post.refresh_from_db()
+        self.assertEqual((post.word_count , post.estimated_reading_time) , (450 , 3))
+
+        Post.objects.update(word_count=None)
+        call_command('refresh_seo_scores' , '--missing' , stdout=io.StringIO())
+        post.refresh_from_db()
+        self.assertEqual(post.word_count , 450)
+
+
+
+class RenderedContentTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.post = create_posts(1)[4][0]
+
+    def test_api_serves_sanitized_html_and_toc(self):
+        self.post.content = (
+            '<h2>One</h2><p onclick="steal()">a<script>bad()</script></p><h2>One</h2><img src="/media/a.png">'
+        )
+        self.post.save()
+
+        data = self.client.get(f'/api/post/{self.post.slug}/').json()
+
+        self.assertEqual(data['content'] , (
+            '<h2 id="one">One</h2><p>a</p><h2 id="one-2">One</h2>'
+            '<img src="/media/a.png" alt="" loading="lazy" decoding="async">'
+        ))
+        self.assertEqual(data['toc'] , [
+            {'level': 2 , 'id': 'one' , 'text': 'One'} , {'level': 2 , 'id': 'one-2' , 'text': 'One'} ,
+        ])
+
+    def test_self_closed_and_void_dropped_tags_keep_what_follows(self):
+        cases = [
+            ('<p>a</p><embed src="x.swf"><p>after embed</p>' , '<p>a</p><p>after embed</p>') ,
+            ('<p>a</p><script/><p>b</p>' , '<p>a</p><p>b</p>') ,
+            ('<p>a</p><iframe src="https://evil.com/x"/><p>b</p>' , '<p>a</p><p>b</p>') ,
+            ('<object/><p>kept?</p>' , '<p>kept?</p>') ,
+            ('<p>a</p><script>bad()</script><object><p>inside</p></object><p>b</p>' , '<p>a</p><p>b</p>') ,
+        ]
+        for content , expected in cases:
+            with self.subTest(content=content):
+                self.assertEqual(render_content(content).html , expected)
+
+
+
+class LinkGraphTests(TestCase):
+    def setUp(self):
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def test_links_to_frontend_post_urls_become_edges(self):
+        first , second , third , fourth = self.posts[:4]
+        first.content = (
+            f'<p><a href="https://unplugwell.com/post/{second.slug}/">one <b>link</b></a> '
+            f'<a href="/post/{third.slug}">two</a> <a href="../{fourth.slug}/">relative</a> '
+            f'<a href="/post/ghost/">ghost</a> <a href="/category/sleep/">category</a> '
+            f'<a href="/{fourth.slug}/">not a post URL</a> <a href="https://example.com/post/x/">external</a></p>'
+        )
+        first.save()
+
+        self.assertEqual(sorted(PostLink.objects.filter(source=first).values_list('target_slug' , 'target_id' , 'anchor_text')) , sorted([
+            (second.slug , second.pk , 'one link') , (third.slug , third.pk , 'two') ,
+            (fourth.slug , fourth.pk , 'relative') , ('ghost' , None , 'ghost') ,
+        ]))
+        self.assertEqual([link.target_slug for link in broken_links(self.site)] , ['ghost'])
+
+        ghost = Post.objects.create(
+            title='Ghost' , slug='ghost' , content='x' , excerpt='e' , site=self.site , author=self.author ,
+            category=self.category , status='published' ,
+        )
+        self.assertEqual(PostLink.objects.get(target_slug='ghost').target , ghost)
+        self.assertEqual(most_linked(self.site)[0].incoming , 1)
+        self.assertIn(self.posts[4] , orphan_posts(self.site))
+
+    def test_rebuild_command(self):
+        self.posts[0].content = f'<a href="/post/{self.posts[1].slug}/">x</a>'
+        self.posts[0].save()
+        PostLink.objects.all().delete()
+
+        call_command('link_graph' , 'rebuild' , stdout=io.StringIO())
+
+        self.assertEqual(PostLink.objects.get().target , self.posts[1])
+
+
+
+def write_media(root , names):
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True , exist_ok=True)
+        path.write_bytes(b'xx')
+
+
+class MediaIntegrityTests(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        write_media(self.root , [
+            'blog/images/a.png' , 'uploads/2025/x.png' , 'uploads/2025/x_thumb.png' , 'uploads/old.png' ,
+            'categories/icons/c.png' ,
+        ])
+        media = override_settings(MEDIA_ROOT=str(self.root))
+        media.enable()
+        self.addCleanup(media.disable)
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def test_scan_reports_dangling_references_and_unused_files(self):
+        Post.objects.filter(pk=self.posts[0].pk).update(featured_image='blog/images/a.png' , content=(
+            '<img src="/media/uploads/2025/x.png"><img src="https://unplugwell.com/media/gone.png">'
+            f'<a href="/post/{self.posts[1].slug}/">ok</a><a href="/post/missing/">x</a>'
+            '<a href="/media/uploads/doc.pdf">d</a>'
+        ))
+
+        result = scan(processes=1 , batch_size=2)
+
+        self.assertEqual((result.posts , result.files) , (5 , 5))
+        self.assertEqual(sorted((problem.pk , problem.reference , problem.kind) for problem in result.problems) , [
+            (self.posts[0].pk , 'gone.png' , 'missing media') , (self.posts[0].pk , 'missing' , 'missing post') ,
+            (self.posts[0].pk , 'uploads/doc.pdf' , 'missing media') ,
+        ])
+        # A thumbnail is in use while its upload is
+        self.assertEqual(sorted(result.unreferenced) , ['categories/icons/c.png' , 'uploads/old.png'])
+        out = io.StringIO()
+        call_command('check_media' , '--processes' , '1' , stdout=out)
+        self.assertIn('3 dangling reference(s), 2 unreferenced file(s)' , out.getvalue())
+
+
+
+class MediaGarbageCollectionTests(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.quarantine = Path(tempfile.mkdtemp())
+        write_media(self.root , [
+            'blog/images/a.png' , 'blog/images/old.png' , 'blog/images/new.png' , 'uploads/x.png' ,
+            'uploads/x_thumb.png' , 'uploads/rev.png' , 'uploads/gone.png' , 'uploads/gone_thumb.png' ,
+            'other/keep.txt' ,
+        ])
+        month_ago = time.time() - 30 * 86400
+        for path in self.root.rglob('*'):
+            if path.is_file() and path.name != 'new.png':
+                os.utime(path , (month_ago , month_ago))
+        media = override_settings(MEDIA_ROOT=str(self.root) , BLOG_MEDIA_QUARANTINE=self.quarantine)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def files(self , root):
+        return sorted(str(path.relative_to(root)) for path in root.rglob('*') if path.is_file())
+
+    def test_unreferenced_old_uploads_are_quarantined(self):
+        post = self.posts[0]
+        post.content = '<img src="/media/uploads/rev.png">'
+        post.save()
+        PostRevision.record(post , self.author)
+        post.content = '<p>a</p><img src="/media/uploads/rev.png"><p>b</p>'
+        post.save()
+        PostRevision.record(post , self.author)
+        post.content = '<img src="/media/uploads/x.png">'
+        post.featured_image = 'blog/images/a.png'
+        post.save()
+
+        call_command('gc_media' , '--dry-run' , '--processes' , '1' , stdout=io.StringIO())
+        self.assertEqual(self.files(self.quarantine) , [])
+
+        call_command('gc_media' , '--processes' , '1' , stdout=io.StringIO())
+
+        # Referenced by a revision, a thumbnail of a live upload, too new, or outside the upload directories
+        self.assertEqual(self.files(self.root) , [
+            'blog/images/a.png' , 'blog/images/new.png' , 'other/keep.txt' , 'uploads/rev.png' , 'uploads/x.png' ,
+            'uploads/x_thumb.png' ,
+        ])
+        self.assertEqual(sorted(name.split('/' , 1)[1] for name in self.files(self.quarantine)) , [
+            'blog/images/old.png' , 'uploads/gone.png' , 'uploads/gone_thumb.png' ,
+        ])
+
+
+
+class ContentAddressedStorageTests(TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        media = override_settings(MEDIA_ROOT=str(self.root))
+        media.enable()
+        self.addCleanup(media.disable)
+        self.site , self.author , self.category , self.tag , self.posts = create_posts(2)
+
+    def test_same_bytes_share_one_counted_blob(self):
+        first , second = self.posts
+        first.featured_image.save('logo.PNG' , ContentFile(b'png bytes'))
+        second.featured_image.save('cropped-logo.png' , ContentFile(b'png bytes'))
+
+        blob = MediaBlob.objects.get()
+        self.assertEqual(first.featured_image.name , second.featured_image.name)
+        self.assertEqual((blob.name , blob.refcount) , (first.featured_image.name , 2))
+        second.delete()
+        blob.refresh_from_db()
+        self.assertEqual(blob.refcount , 1)
+
+    def test_reupload_restarts_the_grace_period(self):
+        name = default_storage.save('old.png' , ContentFile(b'old bytes'))
+        thumbnail = default_storage.save(name.replace('.png' , '_thumb.png') , ContentFile(b'thumb'))
+        month_ago = time.time() - 30 * 86400
+        for path in (name , thumbnail):
+            os.utime(default_storage.path(path) , (month_ago , month_ago))
+        self.assertEqual({candidate.name for candidate in candidates(set() , timedelta(days=7))} , {name , thumbnail})
+
+        # Uploaded again, e.g. in a post that hasn't been saved yet
+        self.assertEqual(default_storage.save('again.png' , ContentFile(b'old bytes')) , name)
+        self.assertEqual(default_storage.save(thumbnail , ContentFile(b'thumb')) , thumbnail)
+
+        self.assertEqual(candidates(set() , timedelta(days=7)) , [])
+
+
+class DatabaseProfileCheckTests(TestCase):
+    def ids(self , problems):
+        return {problem.id for problem in problems}
+
+    def test_checks_run_on_every_start(self):
+        self.assertIn(check_database_settings , checks.registry.registry.get_checks())
+        self.assertIn(check_database_connections , checks.registry.registry.get_checks(include_deployment_checks=True))
+        self.assertEqual(check_database_settings() , [])
+
+    def test_sqlite_profile_is_clean(self):
+        self.assertEqual(profile_problems('default' , sqlite_settings(settings.BASE_DIR , {})) , [])
+
+    def test_sqlite_without_wal_warns(self):
+        config = sqlite_settings(settings.BASE_DIR , {})
+        config['OPTIONS'] = {}
+        self.assertEqual(self.ids(profile_problems('default' , config)) , {'nativeblog.W001'})
+
+    def test_pool_with_persistent_connections_is_an_error(self):
+        config = postgres_settings({'DB_POOL_MAX_SIZE': '5'})
+        self.assertNotIn('nativeblog.E001' , self.ids(profile_problems('default' , config)))
+
+        config['CONN_MAX_AGE'] = 60
+        self.assertIn('nativeblog.E001' , self.ids(profile_problems('default' , config)))
+
+    def test_persistent_connections_without_health_checks_warn(self):
+        config = dict(postgres_settings({}) , CONN_HEALTH_CHECKS=False)
+        self.assertEqual(self.ids(profile_problems('default' , config)) , {'nativeblog.W002'})
+
+    def test_live_check_connects(self):
+        self.assertEqual(check_database_connections(databases=['default']) , [])
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTests(TestCase):
+    """Routing decisions only; the replica alias mirrors the test database"""
+
+    def setUp(self):
+        self.add_replica({**connections['default'].settings_dict})
+        routers._down_until.clear()
+        routers._lag.clear()
+        self.factory = RequestFactory()
+
+    def add_replica(self , config):
+        if 'replica' in connections.settings:
+            self.remove_replica()
+        connections.settings['replica'] = config
+        self.addCleanup(self.remove_replica)
+        # Added after the class was set up, so allow it by hand
+        databases = mock.patch.object(type(self) , 'databases' , {'default' , 'replica'})
+        databases.start()
+        self.addCleanup(databases.stop)
+
+    def remove_replica(self):
+        if 'replica' in connections.settings:
+            connections['replica'].close()
+            del connections['replica']
+            del connections.settings['replica']
+
+    def read_alias(self , request , user=None):
+        request.user = user or AnonymousUser()
+        seen = {}
+
+        def view(request):
+            seen['alias'] = Post.objects.all().db
+            return HttpResponse()
+
+        response = routers.ReplicaRoutingMiddleware(view)(request)
+        return seen['alias'] , response
+
+    def test_anonymous_reads_use_the_replica(self):
+        self.assertEqual(self.read_alias(self.factory.get('/api/blog/posts/'))[0] , 'replica')
+        # Outside a request everything stays on the primary
+        self.assertEqual(Post.objects.all().db , 'default')
+
+    def test_writes_pin_the_client_to_the_primary(self):
+        alias , response = self.read_alias(self.factory.post('/api/message/message/'))
+        self.assertEqual(alias , 'default')
+        self.assertIn(routers.PIN_COOKIE , response.cookies)
+
+        request = self.factory.get('/api/blog/posts/')
+        request.COOKIES[routers.PIN_COOKIE] = '1'
+        self.assertEqual(self.read_alias(request)[0] , 'default')
+
+    def test_staff_and_admin_read_the_primary(self):
+        staff = User(username='staff' , is_staff=True)
+        self.assertEqual(self.read_alias(self.factory.get('/api/blog/posts/') , staff)[0] , 'default')
+        self.assertEqual(self.read_alias(self.factory.get('/admin/'))[0] , 'default')
+
+    def test_lagging_replica_falls_back_to_the_primary(self):
+        with mock.patch.object(routers , 'replica_lag' , return_value=60.0) as replica_lag:
+            self.assertEqual(self.read_alias(self.factory.get('/api/blog/posts/'))[0] , 'default')
+            # The measurement is reused until it's REPLICA_LAG_CHECK_SECONDS old
+            self.read_alias(self.factory.get('/api/blog/posts/'))
+        self.assertEqual(replica_lag.call_count , 1)
+
+        routers._lag.clear()
+        with override_settings(REPLICA_MAX_LAG_SECONDS=120):
+            with mock.patch.object(routers , 'replica_lag' , return_value=60.0):
+                self.assertEqual(self.read_alias(self.factory.get('/api/blog/posts/'))[0] , 'replica')
+
+    def test_sqlite_replica_lags_once_the_primary_changes(self):
+        directory = tempfile.mkdtemp()
+        replica_path = os.path.join(directory , 'replica.sqlite3')
+        primary_path = os.path.join(directory , 'primary.sqlite3')
+        for path , modified in ((replica_path , 1000) , (primary_path , 900)):
+            open(path , 'w').close()
+            os.utime(path , (modified , modified))
+        self.add_replica({**connections['default'].settings_dict , 'NAME': replica_path})
+        primary = {**connections['default'].settings_dict , 'NAME': primary_path}
+
+        with mock.patch.dict(connections['default'].settings_dict , primary):
+            self.assertEqual(routers.replica_lag('replica') , 0)
+            os.utime(primary_path , (1100 , 1100))
+            self.assertGreater(routers.replica_lag('replica') , 60)
+
+    def test_unreachable_replica_falls_back_to_the_primary(self):
+        missing = os.path.join(tempfile.mkdtemp() , 'missing' , 'replica.sqlite3')
+        self.add_replica({**connections['default'].settings_dict , 'NAME': missing})
+
+        self.assertEqual(self.read_alias(self.factory.get('/api/blog/posts/'))[0] , 'default')
+        self.assertIn('replica' , routers._down_until)
+
+
+class AsyncReadEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site , self.author , self.category , self.tag , self.posts = create_posts()
+
+    def test_async_endpoints_match_the_sync_ones(self):
+        paths = [
+            'posts/' , 'posts/?page=2&page_size=2' , f'post/{self.posts[1].slug}/' , 'post/missing/' ,
+            'posts-latest/' , 'posts-popular/' , 'posts/?site_domain=other.example' , 'posts/?page=9' ,
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                expected = self.client.get(f'/api/{path}')
+                response = self.client.get(f'/api/async/{path}')
+
+                self.assertEqual(response.status_code , expected.status_code)
+                # Pagination links point back at the endpoint that was called
+                self.assertEqual(response.content.replace(b'/api/async/' , b'/api/') , expected.content)
+
+
+class StaticFilesTests(SimpleTestCase):
+    css = b'body { color: #333; background: white; }\n' * 20
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        files = {'css/app.css': self.css , 'css/tiny.css': b'a{}' , 'img/logo.png': b'\x89PNG' * 100}
+        for name , content in files.items():
+            (self.root / name).parent.mkdir(parents=True , exist_ok=True)
+            (self.root / name).write_bytes(content)
+        static_root = override_settings(STATIC_ROOT=str(self.root))
+        static_root.enable()
+        self.addCleanup(static_root.disable)
+
+        # What collectstatic does once the files are copied
+        storage = CompressedManifestStaticFilesStorage(location=str(self.root))
+        list(storage.post_process({name: (storage , name) for name in files}))
+        self.hashed = storage.stored_name('css/app.css')
+        # brotli isn't a requirement; stand in for the sibling it would write
+        (self.root / f'{self.hashed}.br').write_bytes(b'brotli')
+
+    def get(self , path , **headers):
+        fallback = HttpResponse('application')
+        response = StaticFilesMiddleware(lambda request: fallback)(RequestFactory().get(path , headers=headers))
+        if response is fallback:
+            return None
+        self.addCleanup(response.close)
+        return response
+
+    def test_accepted_encodings(self):
+        self.assertEqual(accepted_encodings('gzip;q=0, br') , {'br'})
+        self.assertEqual(accepted_encodings('GZIP ; q=0.5, identity') , {'gzip' , 'identity'})
+        self.assertEqual(accepted_encodings('*') , {'br' , 'gzip'})
+        self.assertEqual(accepted_encodings('br;q=0, *') , {'gzip'})
+        self.assertEqual(accepted_encodings(None) , set())
+
+    def test_post_process_writes_gzip_siblings_above_the_minimum_size(self):
+        self.assertLess(len(b'a{}') , MINIMUM_COMPRESS_SIZE)
+        for name in (self.hashed , 'css/app.css'):
+            self.assertEqual(gzip.decompress((self.root / f'{name}.gz').read_bytes()) , self.css)
+        self.assertFalse(list(self.root.glob('css/tiny*.gz')))
+        self.assertFalse(list(self.root.glob('img/*.gz')))
+
+    def test_smallest_accepted_sibling_is_served(self):
+        for accept , coding in (('gzip, br' , 'br') , ('*' , 'br') , ('gzip' , 'gzip') , ('br;q=0, *' , 'gzip') , ('' , None)):
+            with self.subTest(accept=accept):
+                response = self.get(f'/static/{self.hashed}' , accept_encoding=accept)
+
+                self.assertEqual(response.get('Content-Encoding') , coding)
+                self.assertEqual(response['Vary'] , 'Accept-Encoding')
+                self.assertEqual(response['Content-Type'] , 'text/css')
+        body = b''.join(self.get(f'/static/{self.hashed}').streaming_content)
+        self.assertEqual(body , self.css)
+
+    def test_only_hashed_names_are_immutable(self):
+        self.assertEqual(self.get(f'/static/{self.hashed}')['Cache-Control'] , IMMUTABLE_CACHE_CONTROL)
+        plain = self.get('/static/img/logo.png')
+        self.assertEqual(plain['Cache-Control'] , DEFAULT_CACHE_CONTROL)
+        self.assertNotIn('Vary' , plain)
+
+    def test_unmodified_file_is_not_modified(self):
+        modified = http_date((self.root / self.hashed).stat().st_mtime)
+
+        response = self.get(f'/static/{self.hashed}' , if_modified_since=modified)
+
+        self.assertEqual(response.status_code , 304)
+
+    def test_traversal_and_missing_files_fall_through(self):
+        self.assertIsNone(self.get('/static/../../etc/passwd'))
+        self.assertIsNone(self.get('/static/css/missing.css'))
+        self.assertIsNone(self.get('/media/css/app.css'))
+
+
+class StartupTests(TestCase):
+    def test_heavy_modules_are_not_imported_at_startup(self):
+        code = (
+            'import sys, django; django.setup(); '
+            'from django.urls import get_resolver; get_resolver().url_patterns; import Blog.models; '
+            'print(" ".join(name for name in ("openai", "drf_yasg.views") if name in sys.modules))'
+        )
+        result = subprocess.run(
+            [sys.executable , '-c' , code] , cwd=settings.BASE_DIR , capture_output=True , text=True ,
+            env={**os.environ , 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE} ,
+        )
+
+        self.assertEqual(result.returncode , 0 , result.stderr)
+        self.assertEqual(result.stdout.strip() , '')
+
+    @plain_static_files
+    def test_api_docs_are_still_served(self):
+        self.assertContains(self.client.get('/swagger/') , 'swagger-ui')
+        self.assertContains(self.client.get('/redoc/') , 'redoc')
+        schema = self.client.get('/swagger/?format=openapi')
+        self.assertEqual(schema.status_code , 200)
+        self.assertIn('/api/posts/' , schema.json()['paths'])
+
+    def test_parse_importtime(self):
+        output = (
+            'import time: self [us] | cumulative | imported package\n'
+            'import time:       120 |        120 |   encodings.utf_8\n'
+            'some other stderr line\n'
+            'import time:      3000 |       4000 | django.db\n'
+        )
+        self.assertEqual(parse_importtime(output) , [('encodings.utf_8' , 120 , 120) , ('django.db' , 3000 , 4000)])
+
+    def test_startup_profile_reports_packages_and_budget(self):
+        out = io.StringIO()
+        call_command('startup_profile' , '--limit' , '3' , '--budget' , '60000' , stdout=out)
+
+        report = out.getvalue()
+        self.assertRegex(report , r'^\d+ modules imported in [\d.]+ ms')
+        self.assertIn('slowest modules (cumulative)' , report)
+        self.assertIn('django' , report)
+        self.assertIn('Within the 60000 ms budget.' , report)
+        with self.assertRaisesMessage(CommandError , 'over the 1 ms budget'):
+            call_command('startup_profile' , '--no-urls' , '--budget' , '1' , stdout=io.StringIO())
@@ -0,0 +1,419 @@
+# Blog/transfer.py
+"""
+NDJSON export/import of posts for moving content between sites or databases.
+
+Each line is one post with its site, category (and master category), tags,
+author, related post slugs, media paths and, optionally, its revision
+history. Related rows are referenced by natural keys (domain, slug, tag
+name, username) so a file can be loaded into any site of any database.
+Media files themselves are not copied; ``featured_image`` and the content
+keep their storage-relative paths.
+"""
+import json
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models , transaction
+from django.db.models import Prefetch
+from django.utils.text import slugify
+
+from .cache import bump_content_version
+from .links import rebuild_link_graph
+from .models import Category , MasterCategory , Post , PostRevision , Tag
+from .revisions import apply_delta , content_hash , make_delta
+from .storage import recount
+
+FORMAT_VERSION = 1
+CONFLICT_CHOICES = ('skip' , 'update' , 'rename')
+
+# Foreign keys and timestamps are written separately as natural keys
+_SKIPPED_FIELDS = {'id' , 'site' , 'author' , 'category' , 'created_at' , 'updated_at'}
+POST_FIELDS = [
+    field for field in Post._meta.concrete_fields
+    if field.name not in _SKIPPED_FIELDS
+]
+
+
+def _dump(record):
+    return json.dumps(record , cls=DjangoJSONEncoder , ensure_ascii=False , separators=(',' , ':')) + '\n'
+
+
+def _revision_history(revisions):
+    """Full content of each revision, decoded in one pass over the chain"""
+    content = ''
+    for revision in revisions:
+        content = revision.content if revision.is_snapshot else apply_delta(content , revision.content_delta)
+        yield {
+            'title': revision.title ,
+            'content': content ,
+            'excerpt': revision.excerpt ,
+            'author': revision.author.username ,
+            'revision_note': revision.revision_note ,
+            'created_at': revision.created_at ,
+        }
+
+
+def export_posts(queryset , handle , chunk_size=500 , revisions=True):
+    """
+    Write ``queryset`` to ``handle`` as NDJSON in primary key order; yields
+    the id of every post written so callers can checkpoint.
+    """
+    queryset = queryset.order_by('pk').select_related(
+        'site' , 'author' , 'category__site' , 'category__master_category'
+    ).prefetch_related(
+        'tags' ,
+        Prefetch('related_posts' , queryset=Post.objects.only('id' , 'slug'))
+    )
+    if revisions:
+        queryset = queryset.prefetch_related(
+            Prefetch('revisions' , queryset=PostRevision.objects.select_related('author').order_by('id'))
+        )
+
+    for post in queryset.iterator(chunk_size=chunk_size):
+        category = post.category
+        record = {
+            'format': FORMAT_VERSION ,
+            'site': post.site.domain ,
+            'author': post.author.username ,
+            'category': {
+                'slug': category.slug ,
+                'name': category.name ,
+                'master_category': {
+                    'slug': category.master_category.slug ,
+                    'name': category.master_category.name
+                } ,
+            } ,
+            'tags': [{'name': tag.name , 'slug': tag.slug} for tag in post.tags.all()] ,
+            'related_posts': [related.slug for related in post.related_posts.all()] ,
+            'created_at': post.created_at ,
+            'updated_at': post.updated_at ,
+            'fields': {field.attname: field.value_from_object(post) for field in POST_FIELDS} ,
+        }
+        # File fields hold a FieldFile; keep the storage-relative path
+        for field in POST_FIELDS:
+            if isinstance(field , models.FileField):
+                record['fields'][field.attname] = record['fields'][field.attname].name or ''
+        if revisions:
+            record['revisions'] = list(_revision_history(post.revisions.all()))
+        handle.write(_dump(record))
+        yield post.pk
+
+
+class PostImporter:
+    """
+    Load exported posts in batches. Each batch is one transaction: posts and
+    revisions are bulk-inserted, categories and tags are created on demand,
+    and slugs already taken on the target site are skipped, updated in
+    place or renamed according to ``on_conflict``.
+    """
+
+    def __init__(self , site=None , on_conflict='skip' , default_author=None , revisions=True , using='default'):
+        if on_conflict not in CONFLICT_CHOICES:
+            raise ValueError(f'on_conflict must be one of {", ".join(CONFLICT_CHOICES)}')
+        self.site = site
+        self.on_conflict = on_conflict
+        self.default_author = default_author
+        self.revisions = revisions
+        self.using = using
+        self.created = self.updated = self.skipped = 0
+
+        self._sites = {}
+        self._users = {}
+        self._master_categories = {}
+        self._categories = {}
+        self._tags = {}
+        # (post id, site id, related slugs) still waiting for their targets
+        self._related = []
+        # Sites that received posts, whose link graphs are rebuilt by finish()
+        self._imported_sites = set()
+
+    # Natural key lookups, cached for the whole import
+
+    def _site_id(self , domain):
+        if self.site is not None:
+            return self.site.pk
+        if domain not in self._sites:
+            try:
+                self._sites[domain] = Site.objects.using(self.using).get(domain=domain).pk
+            except Site.DoesNotExist:
+                raise ValueError(f'Site "{domain}" does not exist; pass a target site to import into.')
+        return self._sites[domain]
+
+    def _user_id(self , username):
+        if username not in self._users:
+            user_id = User.objects.using(self.using).filter(username=username).values_list('pk' , flat=True).first()
+            if user_id is None:
+                if self.default_author is None:
+                    raise ValueError(f'User "{username}" does not exist; pass a default author.')
+                user_id = self.default_author.pk
+            self._users[username] = user_id
+        return self._users[username]
+
+    def _master_category_id(self , data):
+        slug = data['slug']
+        if slug not in self._master_categories:
+            master , _ = MasterCategory.objects.using(self.using).get_or_create(
+                slug=slug , defaults={'name': data['name']}
+            )
+            self._master_categories[slug] = master.pk
+        return self._master_categories[slug]
+
+    def _category_id(self , data , site_id):
+        key = (site_id , data['slug'])
+        if key not in self._categories:
+            category = Category.objects.using(self.using).filter(site_id=site_id , slug=data['slug']).first()
+            if category is None:
+                category = Category(
+                    site_id=site_id ,
+                    slug=data['slug'] ,
+                    name=data['name'] ,
+                    master_category_id=self._master_category_id(data['master_category'])
+                )
+                category.save(using=self.using)
+            self._categories[key] = category.pk
+        return self._categories[key]
+
+    def _resolve_tags(self , records):
+        """Map (site id, tag name) to tag ids, bulk-creating missing tags"""
+        wanted = {
+            (record['site_id'] , tag['name']): tag['slug']
+            for record in records for tag in record['tags']
+        }
+        missing = [key for key in wanted if key not in self._tags]
+        if not missing:
+            return
+        names_by_site = {}
+        for site_id , name in missing:
+            names_by_site.setdefault(site_id , set()).add(name)
+
+        def load():
+            for site_id , names in names_by_site.items():
+                rows = Tag.objects.using(self.using).filter(site_id=site_id , name__in=names).values_list('pk' , 'name')
+                for pk , name in rows:
+                    self._tags[(site_id , name)] = pk
+
+        load()
+        new_tags = [
+            Tag(site_id=site_id , name=name , slug=wanted[(site_id , name)] or slugify(name))
+            for site_id , name in missing if (site_id , name) not in self._tags
+        ]
+        if new_tags:
+            Tag.objects.using(self.using).bulk_create(new_tags , ignore_conflicts=True)
+            load()
+
+    def _free_slug(self , site_id , slug , taken):
+        """First ``slug-N`` not used on the site or earlier in this batch"""
+        used = set(Post.objects.using(self.using).filter(
+            site_id=site_id , slug__startswith=f'{slug}-'
+        ).values_list('slug' , flat=True)) | taken
+        number = 2
+        while f'{slug}-{number}' in used:
+            number += 1
+        return f'{slug}-{number}'
+
+    # Batches
+
+    def _prepare(self , record):
+        site_id = self._site_id(record['site'])
+        fields = {}
+        for field in POST_FIELDS:
+            if field.attname in record['fields']:
+                fields[field.attname] = field.to_python(record['fields'][field.attname])
+        return {
+            'site_id': site_id ,
+            'fields': fields ,
+            'author_id': self._user_id(record['author']) ,
+            'category_id': self._category_id(record['category'] , site_id) ,
+            'tags': record.get('tags' , []) ,
+            'related_posts': record.get('related_posts' , []) ,
+            'created_at': models.DateTimeField().to_python(record.get('created_at')) ,
+            'updated_at': models.DateTimeField().to_python(record.get('updated_at')) ,
+            'revisions': record.get('revisions' , []) if self.revisions else [] ,
+        }
+
+    def import_batch(self , records):
+        """Import one batch of decoded NDJSON records atomically"""
+        with transaction.atomic(using=self.using):
+            prepared = [self._prepare(record) for record in records]
+            self._resolve_tags(prepared)
+
+            existing = {}
+            for site_id in {item['site_id'] for item in prepared}:
+                slugs = [item['fields']['slug'] for item in prepared if item['site_id'] == site_id]
+                for post_id , slug in Post.objects.using(self.using).filter(
+                        site_id=site_id , slug__in=slugs).values_list('pk' , 'slug'):
+                    existing[(site_id , slug)] = post_id
+
+            new_items , updated_items , taken = [] , [] , set()
+            for item in prepared:
+                key = (item['site_id'] , item['fields']['slug'])
+                if key in existing or key in taken:
+                    if self.on_conflict == 'skip' or (self.on_conflict == 'update' and key in taken):
+                        self.skipped += 1
+                        continue
+                    if self.on_conflict == 'update':
+                        item['pk'] = existing[key]
+                        updated_items.append(item)
+                        continue
+                    item['fields']['slug'] = self._free_slug(item['site_id'] , item['fields']['slug'] , {
+                        slug for site_id , slug in taken if site_id == item['site_id']
+                    })
+                    key = (item['site_id'] , item['fields']['slug'])
+                taken.add(key)
+                new_items.append(item)
+
+            self._create(new_items)
+            self._update(updated_items)
+            self._imported_sites.update(item['site_id'] for item in new_items + updated_items)
+            self._link_tags(new_items + updated_items)
+            self._add_revisions(new_items + updated_items)
+            for item in new_items + updated_items:
+                if item['related_posts']:
+                    self._related.append((item['pk'] , item['site_id'] , item['related_posts']))
+            self._link_related()
+
+    def _build(self , item):
+        post = Post(
+            site_id=item['site_id'] ,
+            author_id=item['author_id'] ,
+            category_id=item['category_id'] ,
+            **item['fields']
+        )
+        if item.get('pk'):
+            post.pk = item['pk']
+        return post
+
+    def _restore_timestamps(self , posts , items):
+        # bulk_create stamps auto_now(_add) fields; put the exported ones back
+        for post , item in zip(posts , items):
+            post.created_at = item['created_at'] or post.created_at
+            post.updated_at = item['updated_at'] or post.updated_at
+        Post.objects.using(self.using).bulk_update(posts , ['created_at' , 'updated_at'])
+
+    def _create(self , items):
+        if not items:
+            return
+        posts = Post.objects.using(self.using).bulk_create([self._build(item) for item in items])
+        for post , item in zip(posts , items):
+            item['pk'] = post.pk
+        self._restore_timestamps(posts , items)
+        self.created += len(posts)
+
+    def _update(self , items):
+        if not items:
+            return
+        posts = [self._build(item) for item in items]
+        Post.objects.using(self.using).bulk_update(
+            posts , [field.attname for field in POST_FIELDS] + ['author_id' , 'category_id']
+        )
+        self._restore_timestamps(posts , items)
+        # The file is authoritative for tags and history of updated posts
+        post_ids = [item['pk'] for item in items]
+        Post.tags.through.objects.using(self.using).filter(post_id__in=post_ids).delete()
+        Post.related_posts.through.objects.using(self.using).filter(from_post_id__in=post_ids).delete()
+        if self.revisions:
+            PostRevision.objects.using(self.using).filter(post_id__in=post_ids).delete()
+        self.updated += len(posts)
+
+    def _link_tags(self , items):
+        through = Post.tags.through
+        links = [
+            through(post_id=item['pk'] , tag_id=self._tags[(item['site_id'] , tag['name'])])
+            for item in items for tag in item['tags']
+            if (item['site_id'] , tag['name']) in self._tags
+        ]
+        through.objects.using(self.using).bulk_create(links , ignore_conflicts=True)
+
+    def _add_revisions(self , items):
+        """Re-encode each imported history as snapshots plus deltas"""
+        revisions , stamps = [] , []
+        for item in items:
+            previous = None
+            for index , data in enumerate(item['revisions']):
+                revision = PostRevision(
+                    post_id=item['pk'] ,
+                    title=data['title'] ,
+                    excerpt=data['excerpt'] ,
+                    author_id=self._user_id(data['author']) ,
+                    revision_note=data.get('revision_note' , '') ,
+                    content_hash=content_hash(data['title'] , data['content'] , data['excerpt'])
+                )
+                delta = None
+                if previous is not None and index % PostRevision.SNAPSHOT_INTERVAL:
+                    delta = make_delta(previous , data['content'])
+                if delta is not None and len(delta) < len(data['content'].encode('utf-8')):
+                    revision.is_snapshot = False
+                    revision.content_delta = delta
+                else:
+                    revision.content = data['content']
+                previous = data['content']
+                revisions.append(revision)
+                stamps.append(models.DateTimeField().to_python(data.get('created_at')))
+        if not revisions:
+            return
+        revisions = PostRevision.objects.using(self.using).bulk_create(revisions)
+        for revision , stamp in zip(revisions , stamps):
+            revision.created_at = stamp or revision.created_at
+        PostRevision.objects.using(self.using).bulk_update(revisions , ['created_at'])
+
+    def _link_related(self):
+        """
+        Link pending related posts whose targets exist by now; forward
+        references to posts later in the file stay pending.
+        """
+        if not self._related:
+            return
+        ids = {}
+        for site_id in {site_id for _ , site_id , _ in self._related}:
+            slugs = {slug for _ , sid , related in self._related if sid == site_id for slug in related}
+            rows = Post.objects.using(self.using).filter(site_id=site_id , slug__in=slugs).values_list('pk' , 'slug')
+            for pk , slug in rows:
+                ids[(site_id , slug)] = pk
+
+        through = Post.related_posts.through
+        links , pending = [] , []
+        for post_id , site_id , related in self._related:
+            missing = []
+            for slug in related:
+                if (site_id , slug) in ids:
+                    links.append(through(from_post_id=post_id , to_post_id=ids[(site_id , slug)]))
+                else:
+                    missing.append(slug)
+            if missing:
+                pending.append((post_id , site_id , missing))
+        through.objects.using(self.using).bulk_create(links , ignore_conflicts=True)
+        self._related = pending
+
+    @property
+    def imported_sites(self):
+        """Ids of the sites posts were written to, kept in checkpoints"""
+        return sorted(self._imported_sites)
+
+    @imported_sites.setter
+    def imported_sites(self , site_ids):
+        self._imported_sites = set(site_ids)
+
+    @property
+    def pending_related(self):
+        """Unresolved related-post links, kept in checkpoints"""
+        return [list(entry) for entry in self._related]
+
+    @pending_related.setter
+    def pending_related(self , entries):
+        self._related = [tuple(entry) for entry in entries]
+
+    def finish(self):
+        """
+        Drop related links that never resolved and redo what ``post_save``
+        would have: the link graph of every site that received posts (links
+        already there may point at the new slugs), the media refcounts and
+        the cached API payloads.
+        """
+        unresolved = sum(len(related) for _ , _ , related in self._related)
+        self._related = []
+        if self._imported_sites:
+            rebuild_link_graph(Post.objects.using(self.using).filter(site_id__in=self._imported_sites))
+            recount(using=self.using)
+        bump_content_version()
+        return unresolved
@@ -13,9 +13,13 @@ from .api_views import (
     PostCategoryDataView,
     CategorySlugDataView,
     UnplugPublishedPostsWPView,
-    PostCreateView
-    
+    UnplugPublishedPostsWPStreamView,
+    PostCreateView,
+    PostRevisionDetailView
+
 )
+from . import async_views
+from .feeds import AtomPostFeed , CategoryAtomFeed , CategoryFeed , PostFeed , TagAtomFeed , TagFeed
 from .views import (
     PostList ,
     generate_content ,
@@ -47,5 +51,21 @@ urlpatterns = [
     path('posts-category/', PostCategoryDataView.as_view(), name='category-posts-list'),
     path('category-slug/', CategorySlugDataView.as_view(), name='category-posts-slug'),
     path('all-posts/', UnplugPublishedPostsWPView.as_view(), name='published-posts-list'),
+    path('all-posts/stream/', UnplugPublishedPostsWPStreamView.as_view(), name='published-posts-stream'),
     path('posts/create/', PostCreateView.as_view(), name='post-create'),
+    path('revisions/<int:pk>/', PostRevisionDetailView.as_view(), name='post-revision-detail'),
+
+    # RSS/Atom feeds
+    path('feeds/<str:domain>/rss/', PostFeed(), name='site-feed-rss'),
+    path('feeds/<str:domain>/atom/', AtomPostFeed(), name='site-feed-atom'),
+    path('feeds/<str:domain>/category/<slug:slug>/rss/', CategoryFeed(), name='category-feed-rss'),
+    path('feeds/<str:domain>/category/<slug:slug>/atom/', CategoryAtomFeed(), name='category-feed-atom'),
+    path('feeds/<str:domain>/tag/<slug:slug>/rss/', TagFeed(), name='tag-feed-rss'),
+    path('feeds/<str:domain>/tag/<slug:slug>/atom/', TagAtomFeed(), name='tag-feed-atom'),
+
+    # Native async variants of the public read endpoints
+    path('async/posts/', async_views.published_posts, name='async-published-posts-list'),
+    path('async/post/<slug:slug>/', async_views.post_detail, name='async-post-slug'),
+    path('async/posts-latest/', async_views.latest_posts, name='async-latest-posts-list'),
+    path('async/posts-popular/', async_views.popular_posts, name='async-popular-posts-list'),
 ]
\ No newline at end of file
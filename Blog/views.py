@@ -10,9 +10,10 @@ from django.views.decorators.http import condition
 import json
 
 from .models import Post , Category , Tag
+from .rendering import render_content
 from .seo import generate_schema_markup
 from .services import BlogGenerator
-from .serializers import CategoryListSerializer
+from .serializers import CategoryListSerializer , project_queryset
 from django.contrib.sites.models import Site
 from rest_framework.generics import ListAPIView
 from rest_framework.filters import SearchFilter
@@ -120,11 +121,11 @@ def preview_generated_content(request):
                     'error': 'Content is required'
                 })
 
-            # Format content for preview
+            # Preview exactly what the post will serve once saved
             preview_html = f"""
             <div class="preview-content">
                 <div class="preview-body">
-                    {content}
+                    {render_content(content).html}
                 </div>
             </div>
             """
@@ -205,7 +206,7 @@ class CategoryListView(ListAPIView):
             raise ValidationError({
                 'site': 'please provide a site parameter in the query string'
             })
-        return queryset
+        return project_queryset(queryset , self.get_serializer())
     
 # class CategoryViewSet(ListAPIView):
 #     queryset = Category.objects.all()
@@ -0,0 +1,179 @@
+"""
+Environment-driven database profiles.
+
+``DB_ENGINE=sqlite`` (default) tunes SQLite for concurrent readers and a
+writer: WAL journal, ``synchronous=NORMAL``, memory-mapped I/O and a busy
+timeout, with writes taking the lock up front (``BEGIN IMMEDIATE``).
+``DB_ENGINE=postgres`` uses persistent connections with health checks, or
+psycopg's connection pool when ``DB_POOL_MAX_SIZE`` is set
+(needs ``psycopg[pool]``, which is not in requirements.txt).
+"""
+import os
+
+
+def _int(env, name, default):
+    return int(env.get(name, default))
+
+
+def sqlite_settings(base_dir, env):
+    busy_timeout = _int(env, 'DB_BUSY_TIMEOUT', 5)
+    pragmas = [
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        f"PRAGMA mmap_size={_int(env, 'DB_MMAP_SIZE', 128 * 1024 * 1024)}",
+        f'PRAGMA busy_timeout={busy_timeout * 1000}',
+    ]
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': env.get('DB_NAME') or base_dir / 'db.sqlite3',
+        'CONN_MAX_AGE': _int(env, 'DB_CONN_MAX_AGE', 60),
+        'OPTIONS': {
+            'timeout': busy_timeout,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(pragmas),
+        },
+    }
+
+
+def postgres_settings(env):
+    config = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': env.get('DB_NAME', 'nativeblog'),
+        'USER': env.get('DB_USER', ''),
+        'PASSWORD': env.get('DB_PASSWORD', ''),
+        'HOST': env.get('DB_HOST', ''),
+        'PORT': env.get('DB_PORT', ''),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+    if env.get('DB_POOL_MAX_SIZE'):
+        # Django's pool replaces persistent connections, which must stay off
+        config['CONN_MAX_AGE'] = 0
+        config['OPTIONS']['pool'] = {
+            'min_size': _int(env, 'DB_POOL_MIN_SIZE', 2),
+            'max_size': _int(env, 'DB_POOL_MAX_SIZE', 10),
+            'timeout': _int(env, 'DB_POOL_TIMEOUT', 10),
+        }
+    else:
+        config['CONN_MAX_AGE'] = _int(env, 'DB_CONN_MAX_AGE', 60)
+    return config
+
+
+def database_settings(base_dir, env=os.environ):
+    engine = env.get('DB_ENGINE', 'sqlite')
+    if engine == 'postgres':
+        return postgres_settings(env)
+    if engine == 'sqlite':
+        return sqlite_settings(base_dir, env)
+    raise ValueError(f'Unknown DB_ENGINE "{engine}", expected "sqlite" or "postgres"')
+
+
+def replica_settings(primary, env=os.environ):
+    """
+    Replica aliases derived from the primary profile: ``DB_REPLICAS`` is a
+    comma-separated list of SQLite files, or of hosts for Postgres. Under
+    test, replicas mirror ``default``.
+    """
+    replicas = {}
+    targets = [target.strip() for target in env.get('DB_REPLICAS', '').split(',') if target.strip()]
+    for index, target in enumerate(targets, start=1):
+        config = dict(primary, OPTIONS=dict(primary['OPTIONS']), TEST={'MIRROR': 'default'})
+        if primary['ENGINE'].endswith('sqlite3'):
+            config['NAME'] = target
+        else:
+            config['HOST'] = target
+        replicas[f'replica{index}'] = config
+    return replicas
+
+
+def describe_connection(connection):
+    """Report the settings a live connection is actually running with"""
+    report = {
+        'alias': connection.alias,
+        'vendor': connection.vendor,
+        'name': str(connection.settings_dict['NAME']),
+        'conn_max_age': connection.settings_dict.get('CONN_MAX_AGE'),
+        'conn_health_checks': connection.settings_dict.get('CONN_HEALTH_CHECKS'),
+    }
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for pragma in ('journal_mode', 'synchronous', 'mmap_size', 'busy_timeout'):
+                cursor.execute(f'PRAGMA {pragma}')
+                # In-memory databases have no mmap_size
+                row = cursor.fetchone()
+                report[pragma] = row[0] if row else None
+            report['transaction_mode'] = connection.transaction_mode
+        elif connection.vendor == 'postgresql':
+            cursor.execute('SHOW server_version')
+            report['server_version'] = cursor.fetchone()[0]
+            report['pool'] = connection.settings_dict['OPTIONS'].get('pool', False)
+    return report
+
+
+def profile_problems(alias, config):
+    """Check messages for one ``DATABASES`` entry; see ``check_database_settings``"""
+    from django.core.checks import Error, Warning
+
+    problems = []
+    options = config.get('OPTIONS', {})
+    if options.get('pool'):
+        if config.get('CONN_MAX_AGE'):
+            problems.append(Error(
+                f'Database "{alias}" uses a connection pool with CONN_MAX_AGE={config["CONN_MAX_AGE"]}.',
+                hint='Pooling replaces persistent connections; set CONN_MAX_AGE to 0.',
+                id='nativeblog.E001',
+            ))
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            problems.append(Error(
+                f'Database "{alias}" sets DB_POOL_MAX_SIZE but psycopg_pool is not installed.',
+                hint='Install psycopg[pool] or unset DB_POOL_MAX_SIZE.',
+                id='nativeblog.E002',
+            ))
+    if config['ENGINE'].endswith('sqlite3'):
+        if 'journal_mode=wal' not in options.get('init_command', '').lower():
+            problems.append(Warning(
+                f'SQLite database "{alias}" does not switch to WAL on connect.',
+                hint='Writers will block readers; use the profile from Nativeblog/db.py.',
+                id='nativeblog.W001',
+            ))
+    elif config.get('CONN_MAX_AGE') and not config.get('CONN_HEALTH_CHECKS'):
+        problems.append(Warning(
+            f'Database "{alias}" keeps connections open without CONN_HEALTH_CHECKS.',
+            hint='A connection dropped by the server fails the next request that reuses it.',
+            id='nativeblog.W002',
+        ))
+    return problems
+
+
+def check_database_settings(app_configs=None, **kwargs):
+    """System check: profile mistakes that would otherwise only show once a connection is opened"""
+    from django.conf import settings
+
+    return [problem for alias, config in settings.DATABASES.items() for problem in profile_problems(alias, config)]
+
+
+def check_database_connections(app_configs=None, databases=None, **kwargs):
+    """
+    System check for the ``database`` tag (``migrate``, ``check --database``):
+    connect and compare what the server reports with the profile.
+    """
+    from django.core.checks import Error, Warning
+    from django.db import connections
+
+    problems = []
+    for alias in databases or ():
+        connection = connections[alias]
+        try:
+            report = describe_connection(connection)
+        except Exception as exc:
+            problems.append(Error(f'Database "{alias}" is unreachable: {exc}', id='nativeblog.E003'))
+            continue
+        if connection.vendor == 'sqlite' and not connection.is_in_memory_db() and report['journal_mode'] != 'wal':
+            problems.append(Warning(
+                f'SQLite database "{alias}" is running with journal_mode={report["journal_mode"]}, not WAL.',
+                hint='The file system may not support WAL (e.g. a network share).',
+                id='nativeblog.W003',
+            ))
+    return problems
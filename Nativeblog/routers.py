@@ -0,0 +1,160 @@
+"""
+Primary/replica database routing.
+
+Reads go to a replica only inside a request that ``ReplicaRoutingMiddleware``
+marked as a public, read-only one; everything else (writes, admin and staff
+traffic, management commands, background threads) stays on ``default``.
+Clients that just wrote are pinned to the primary for
+``REPLICA_PIN_SECONDS`` so replica lag never hides their own changes. That
+only holds while replicas are less than the pin behind, so a replica whose
+lag exceeds ``REPLICA_MAX_LAG_SECONDS`` (the pin by default) is skipped, as
+is one that cannot be reached (for ``REPLICA_RETRY_SECONDS``). With no
+usable replica, reads fall back to the primary.
+"""
+import contextvars
+import os
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+PIN_COOKIE = 'db_pin_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+EXCLUDED_PATHS = ('/admin/', '/ckeditor/', '/api-auth/')
+
+_use_replica = contextvars.ContextVar('use_replica', default=False)
+_down_until = {}
+# alias -> (lag in seconds, monotonic time it was measured)
+_lag = {}
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def max_lag():
+    return getattr(settings, 'REPLICA_MAX_LAG_SECONDS', getattr(settings, 'REPLICA_PIN_SECONDS', 10))
+
+
+def _sqlite_lag(replica):
+    """Seconds since the replica file was synced, if the primary changed after that"""
+    primary = connections['default']
+    if replica.is_in_memory_db() or replica.settings_dict['NAME'] == primary.settings_dict['NAME']:
+        return 0.0
+    primary_name = str(primary.settings_dict['NAME'])
+    modified = max(
+        (os.path.getmtime(path) for path in (primary_name, primary_name + '-wal') if os.path.exists(path)),
+        default=0,
+    )
+    synced = os.path.getmtime(replica.settings_dict['NAME'])
+    return 0.0 if synced >= modified else max(time.time() - synced, 0.0)
+
+
+def replica_lag(alias):
+    """How far ``alias`` is behind the primary in seconds; ``0`` when it is caught up"""
+    connection = connections[alias]
+    if connection.vendor == 'sqlite':
+        return _sqlite_lag(connection)
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+                'ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END'
+            )
+            lag = cursor.fetchone()[0]
+        # NULL when the server isn't replaying WAL, i.e. it is a primary itself
+        return float(lag or 0)
+    return 0.0
+
+
+def cached_replica_lag(alias, now):
+    """``replica_lag`` measured at most every ``REPLICA_LAG_CHECK_SECONDS``"""
+    lag, measured = _lag.get(alias, (None, 0))
+    if lag is None or now - measured >= getattr(settings, 'REPLICA_LAG_CHECK_SECONDS', 5):
+        lag = replica_lag(alias)
+        _lag[alias] = (lag, now)
+    return lag
+
+
+def choose_replica():
+    """A reachable replica that is within the lag limit, or ``None`` to fall back to the primary"""
+    now = time.monotonic()
+    candidates = [alias for alias in replica_aliases() if _down_until.get(alias, 0) <= now]
+    random.shuffle(candidates)
+    for alias in candidates:
+        try:
+            connections[alias].ensure_connection()
+            lag = cached_replica_lag(alias, now)
+        except (DatabaseError, OSError):
+            _down_until[alias] = now + getattr(settings, 'REPLICA_RETRY_SECONDS', 30)
+            continue
+        if lag <= max_lag():
+            return alias
+    return None
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get():
+            return choose_replica() or 'default'
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive their schema from the primary
+        return db not in replica_aliases()
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def use_replica(self, request):
+        if not replica_aliases() or request.method not in SAFE_METHODS:
+            return False
+        if request.path.startswith(EXCLUDED_PATHS) or PIN_COOKIE in request.COOKIES:
+            return False
+        user = getattr(request, 'user', None)
+        return not (user and user.is_staff)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _use_replica.set(self.use_replica(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        return self.pin_after_write(request, response)
+
+    async def __acall__(self, request):
+        # Resolving request.user may query the session, so do it off the event loop
+        use_replica = await sync_to_async(self.use_replica)(request)
+        token = _use_replica.set(use_replica)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _use_replica.reset(token)
+        return self.pin_after_write(request, response)
+
+    def pin_after_write(self, request, response):
+        if request.method not in SAFE_METHODS and replica_aliases():
+            response.set_cookie(
+                PIN_COOKIE, '1',
+                max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 10),
+                httponly=True, samesite='Lax'
+            )
+        return response
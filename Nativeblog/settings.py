@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from pathlib import Path
 import os
 
+from .db import database_settings, replica_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -39,7 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'Nativeblog.staticfiles.StaticFilesConfig',
     'django.contrib.sites',
     'django.contrib.sitemaps',
     'robots',
@@ -185,10 +187,12 @@ JAZZMIN_UI_TWEAKS = {
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'Nativeblog.staticfiles.StaticFilesMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'Nativeblog.routers.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -223,6 +227,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_THROTTLE_RATES': {
+        'message': '30/min',
+        'subscription': '60/min',
+    },
 }
 
 # CORS settings for Next.js frontend
@@ -233,12 +241,53 @@ CORS_ALLOWED_ORIGINS = [
 CORS_ALLOW_CREDENTIALS = True
 
 # Database
+# Profile is picked from the environment (DB_ENGINE=sqlite|postgres), see Nativeblog/db.py
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_settings(BASE_DIR),
 }
+# Public read-only requests can be served from replicas (DB_REPLICAS), see Nativeblog/routers.py
+DATABASES.update(replica_settings(DATABASES['default']))
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['Nativeblog.routers.PrimaryReplicaRouter']
+REPLICA_PIN_SECONDS = 10  # reads stay on the primary this long after a client writes
+REPLICA_RETRY_SECONDS = 30  # an unreachable replica is skipped this long
+REPLICA_MAX_LAG_SECONDS = REPLICA_PIN_SECONDS  # replicas further behind are skipped
+REPLICA_LAG_CHECK_SECONDS = 5  # lag is measured at most this often per replica
+
+# Subscription ingest: POSTs are grouped into one bulk insert per batch
+SUBSCRIPTION_BATCH_SIZE = 500
+SUBSCRIPTION_BATCH_DELAY = 0.01  # seconds the first request waits for others to join
+
+# Write-behind spool (WRITE_BEHIND_ENABLED=1, off by default): contact-form and
+# subscription POSTs are acknowledged once they reach this WAL-mode side
+# database and batch-inserted by a flusher thread (or `manage.py flush_spool`).
+# While it is on, both endpoints answer 202 Accepted with the validated payload
+# and no `id`, since the row doesn't exist yet.
+WRITE_BEHIND_ENABLED = os.environ.get('WRITE_BEHIND_ENABLED', '') == '1'
+WRITE_BEHIND_AUTOFLUSH = True
+WRITE_BEHIND_FLUSH_INTERVAL = 2  # seconds
+WRITE_BEHIND_SPOOL_PATH = BASE_DIR / 'spool.sqlite3'
+
+# Seconds the async read endpoints (api/async/...) cache a rendered response;
+# any post change retires it sooner. 0 turns the cache off.
+BLOG_ASYNC_CACHE_TIMEOUT = 60
+
+# Public URL of a post on the frontend. Feed item links use it, and links in
+# post content that match its path are indexed in the link graph (PostLink);
+# run `manage.py link_graph rebuild` after changing it.
+BLOG_POST_URL = 'https://{domain}/post/{slug}/'
+
+# Static JSON snapshots of posts-latest/, posts-popular/, category-slug/ and
+# post/<slug>/ per site, refreshed on publish/edit for the web server or CDN
+# to serve directly (`manage.py publish_snapshots` rebuilds them all).
+# Absolute media URLs inside them are built against BLOG_SNAPSHOT_BASE_URL.
+BLOG_SNAPSHOTS_ENABLED = os.environ.get('BLOG_SNAPSHOTS_ENABLED', '') == '1'
+BLOG_SNAPSHOT_ROOT = BASE_DIR / 'snapshots'
+BLOG_SNAPSHOT_BASE_URL = os.environ.get('BLOG_SNAPSHOT_BASE_URL', 'http://localhost:8000')
+
+# Where `manage.py gc_media` moves unreferenced uploads (kept outside
+# MEDIA_ROOT so they are no longer served)
+BLOG_MEDIA_QUARANTINE = BASE_DIR / 'media-quarantine'
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -275,6 +324,8 @@ USE_TZ = True
 
 
 STATIC_URL = 'static/'
+# Build output, not kept in git: every deploy runs `manage.py collectstatic
+# --noinput` before starting the app, which needs the manifest it writes.
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [
     BASE_DIR / "Blog" / "static",
@@ -282,6 +333,17 @@ STATICFILES_DIRS = [
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# Uploads are stored once per distinct content under
+# BLOG_MEDIA_BLOB_PREFIX/<ab>/<sha256><ext>; those URLs never change content
+# and are served with a year-long immutable Cache-Control.
+# collectstatic writes hashed names plus .gz/.br siblings (.br needs the
+# optional brotli package); see Nativeblog/staticfiles.py.
+STORAGES = {
+    'default': {'BACKEND': 'Blog.storage.ContentAddressedStorage'},
+    'staticfiles': {'BACKEND': 'Nativeblog.staticfiles.CompressedManifestStaticFilesStorage'},
+}
+BLOG_MEDIA_BLOB_PREFIX = 'uploads/blobs/'
 CKEDITOR_UPLOAD_PATH = "uploads/"
 CKEDITOR_IMAGE_BACKEND = "pillow"
 
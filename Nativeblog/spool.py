@@ -0,0 +1,126 @@
+"""
+Write-behind spool for public form POSTs.
+
+Validated payloads are appended to a WAL-mode side SQLite database and
+acknowledged straight away; a flusher later hands them to the handler
+registered for their kind, which batch-inserts them into the main
+database. Delivery is at-least-once: a crash between the insert and the
+spool delete replays that batch.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Claimed rows whose flusher died are retried after this many seconds
+CLAIM_TIMEOUT = 300
+
+_handlers = {}
+_local = threading.local()
+_flusher_lock = threading.Lock()
+_flusher = None
+
+
+def register_handler(kind, handler):
+    """``handler(payloads)`` must persist a list of payload dicts"""
+    _handlers[kind] = handler
+
+
+def is_enabled():
+    return getattr(settings, 'WRITE_BEHIND_ENABLED', False)
+
+
+def _connection():
+    connection = getattr(_local, 'connection', None)
+    if connection is None:
+        connection = sqlite3.connect(str(settings.WRITE_BEHIND_SPOOL_PATH), timeout=30, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS spool ('
+            'id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL, '
+            'created_at REAL NOT NULL, claim TEXT, claimed_at REAL)'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS spool_kind_id ON spool (kind, id)')
+        _local.connection = connection
+    return connection
+
+
+def append(kind, payload):
+    """Durably queue ``payload`` for ``kind`` and make sure a flusher runs"""
+    _connection().execute(
+        'INSERT INTO spool (kind, payload, created_at) VALUES (?, ?, ?)',
+        (kind, json.dumps(payload), time.time())
+    )
+    if getattr(settings, 'WRITE_BEHIND_AUTOFLUSH', True):
+        ensure_flusher()
+
+
+def pending(kind=None):
+    if kind is None:
+        return _connection().execute('SELECT COUNT(*) FROM spool').fetchone()[0]
+    return _connection().execute('SELECT COUNT(*) FROM spool WHERE kind = ?', (kind,)).fetchone()[0]
+
+
+def flush_kind(kind, batch_size=500):
+    """Move one batch of ``kind`` into the database; returns the batch size"""
+    connection = _connection()
+    claim = uuid.uuid4().hex
+    now = time.time()
+    connection.execute(
+        'UPDATE spool SET claim = ?, claimed_at = ? WHERE id IN ('
+        'SELECT id FROM spool WHERE kind = ? AND (claim IS NULL OR claimed_at < ?) ORDER BY id LIMIT ?)',
+        (claim, now, kind, now - CLAIM_TIMEOUT, batch_size)
+    )
+    rows = connection.execute('SELECT payload FROM spool WHERE claim = ? ORDER BY id', (claim,)).fetchall()
+    if not rows:
+        return 0
+
+    try:
+        _handlers[kind]([json.loads(payload) for payload, in rows])
+    except Exception:
+        connection.execute('UPDATE spool SET claim = NULL, claimed_at = NULL WHERE claim = ?', (claim,))
+        raise
+    connection.execute('DELETE FROM spool WHERE claim = ?', (claim,))
+    return len(rows)
+
+
+def flush(batch_size=500):
+    """Drain every registered kind; returns the number of rows written"""
+    total = 0
+    for kind in list(_handlers):
+        while True:
+            written = flush_kind(kind, batch_size)
+            total += written
+            if written < batch_size:
+                break
+    return total
+
+
+def _run_flusher():
+    interval = getattr(settings, 'WRITE_BEHIND_FLUSH_INTERVAL', 2)
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except Exception:
+            logger.exception('Write-behind flush failed; rows stay spooled for the next run')
+        finally:
+            close_old_connections()
+
+
+def ensure_flusher():
+    global _flusher
+    if _flusher is not None and _flusher.is_alive():
+        return
+    with _flusher_lock:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_run_flusher, name='write-behind-flusher', daemon=True)
+            _flusher.start()
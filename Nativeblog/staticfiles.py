@@ -0,0 +1,203 @@
+"""
+Static files pipeline.
+
+``collectstatic`` copies every asset once under its content-hashed name
+(``ManifestStaticFilesStorage``) and writes a ``.gz`` sibling, plus a
+``.br`` one when the ``brotli`` package is installed, next to each
+compressible file. ``StaticFilesMiddleware`` serves ``STATIC_ROOT`` ahead
+of the rest of the stack, picking the smallest sibling the client accepts;
+hashed names never change content, so they are cached for a year.
+``STATIC_ROOT`` is produced by ``collectstatic`` at deploy time.
+"""
+import gzip
+import mimetypes
+import os
+import posixpath
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.contrib.staticfiles.apps import StaticFilesConfig as BaseStaticFilesConfig
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.core.exceptions import MiddlewareNotUsed, SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Unhashed names may change on the next deploy
+DEFAULT_CACHE_CONTROL = 'public, max-age=60'
+
+COMPRESSIBLE_EXTENSIONS = frozenset((
+    '.css', '.js', '.mjs', '.json', '.svg', '.html', '.htm', '.txt', '.xml', '.eot', '.ttf', '.otf', '.ico',
+))
+# Compressing files this small only adds a lookup
+MINIMUM_COMPRESS_SIZE = 256
+
+# Siblings in order of preference; the extension is the Content-Encoding's
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Shipped by the vendored apps but never requested by any page of this site
+PRUNED_PATTERNS = [
+    # Source maps, only fetched by browser developer tools
+    '*.map',
+    # Release notes and licences of the bundled editors and UIs
+    '*.md',
+    'ckeditor/ckeditor/samples/*',
+    'ckeditor/ckeditor/plugins/*/tests/*',
+    'ckeditor/ckeditor/bender-runner.config.json',
+    'ckeditor/ckeditor/build-config.js',
+    # The pre-2.0 ReDoc bundle, only used by drf-yasg's legacy renderer
+    'drf-yasg/redoc-old/*',
+    # Assets of DRF's coreapi documentation views, which aren't routed
+    'rest_framework/docs/*',
+]
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def unused_theme_patterns():
+    """Ignore patterns for the Jazzmin bootswatch themes the admin can't switch to"""
+    from jazzmin.settings import THEMES
+
+    tweaks = getattr(settings, 'JAZZMIN_UI_TWEAKS', {})
+    if getattr(settings, 'JAZZMIN_SETTINGS', {}).get('show_ui_builder'):
+        return []
+    used = {tweaks.get('theme') or 'default', tweaks.get('dark_mode_theme') or 'default'}
+    return [f'vendor/bootswatch/{theme}/*' for theme in sorted(set(THEMES) - used)]
+
+
+class StaticFilesConfig(BaseStaticFilesConfig):
+    """``django.contrib.staticfiles`` that leaves ``PRUNED_PATTERNS`` out of ``collectstatic``"""
+
+    def ready(self):
+        super().ready()
+        self.ignore_patterns = [*self.ignore_patterns, *PRUNED_PATTERNS, *unused_theme_patterns()]
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """``ManifestStaticFilesStorage`` that also writes compressed siblings"""
+
+    # Source maps are pruned, so the comments naming them are left alone
+    # rather than failing the build on a missing file
+    patterns = tuple(
+        (extension, tuple(
+            pattern for pattern in entries
+            if 'sourceMappingURL' not in (pattern[0] if isinstance(pattern, tuple) else pattern)
+        ))
+        for extension, entries in ManifestStaticFilesStorage.patterns
+    )
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        for name in sorted({*paths, *self.hashed_files.values()}):
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS and self.exists(name):
+                self.compress(name)
+
+    def compress(self, name):
+        """Write ``name.gz`` (and ``name.br``) unless it doesn't make the file smaller"""
+        with self.open(name) as original:
+            content = original.read()
+        if len(content) < MINIMUM_COMPRESS_SIZE:
+            return
+        brotli = _brotli()
+        compressed = {'.gz': gzip.compress(content, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            compressed['.br'] = brotli.compress(content)
+        for extension, data in compressed.items():
+            if self.exists(name + extension):
+                self.delete(name + extension)
+            if len(data) < len(content) * 0.95:
+                self._save(name + extension, ContentFile(data))
+
+
+def accepted_encodings(header):
+    """
+    Content codings an ``Accept-Encoding`` header allows (``q=0`` excluded).
+    ``*`` stands for every coding in ``ENCODINGS`` not excluded by name.
+    """
+    accepted, rejected = set(), set()
+    for item in (header or '').split(','):
+        coding, _, parameters = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = parameters.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) == 0:
+                    rejected.add(coding)
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    if '*' in accepted:
+        accepted.discard('*')
+        accepted.update(coding for coding, _ in ENCODINGS if coding not in rejected)
+    return accepted
+
+
+class StaticFilesMiddleware:
+    """
+    Serve ``STATIC_ROOT`` before sessions, auth and URL resolution run.
+    Works under both WSGI and ASGI; anything it can't find falls through to
+    the rest of the stack.
+    """
+
+    def __init__(self, get_response):
+        if not settings.STATIC_ROOT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.root = os.fspath(settings.STATIC_ROOT)
+        self.prefix = '/' + urlsplit(settings.STATIC_URL).path.strip('/') + '/'
+        self.immutable = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix):
+            response = self.serve(request, request.path_info[len(self.prefix):])
+            if response is not None:
+                return response
+        return self.get_response(request)
+
+    def serve(self, request, name):
+        name = posixpath.normpath(name).lstrip('/')
+        try:
+            path = safe_join(self.root, name)
+        except SuspiciousFileOperation:
+            return None
+        if not os.path.isfile(path):
+            return None
+
+        content_type, encoding = mimetypes.guess_type(name)
+        accepted = accepted_encodings(request.headers.get('Accept-Encoding'))
+        has_siblings = False
+        served, coding = path, encoding
+        for candidate, extension in ENCODINGS:
+            if not os.path.isfile(path + extension):
+                continue
+            has_siblings = True
+            if candidate in accepted and coding is None:
+                served, coding = path + extension, candidate
+
+        stat = os.stat(served)
+        if not was_modified_since(request.headers.get('If-Modified-Since'), stat.st_mtime):
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(open(served, 'rb'), content_type=content_type or 'application/octet-stream')
+            del response['Content-Disposition']
+            if coding:
+                response['Content-Encoding'] = coding
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL if name in self.immutable else DEFAULT_CACHE_CONTROL
+        if has_siblings:
+            response['Vary'] = 'Accept-Encoding'
+        return response
@@ -0,0 +1,28 @@
+from collections.abc import Mapping
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SiteRateThrottle(SimpleRateThrottle):
+    """
+    Limits POSTs per target site (the ``site`` field of the payload) using
+    the rate configured for the view's ``throttle_scope``. Payloads without
+    a site (or that aren't an object at all) are limited per client address.
+    """
+
+    def __init__(self):
+        # The scope is only known once the view is, see allow_request()
+        pass
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, 'throttle_scope', None)
+        if not self.scope or request.method != 'POST':
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request, view):
+        site = request.data.get('site') if isinstance(request.data, Mapping) else None
+        ident = site if site else f'ip:{self.get_ident(request)}'
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
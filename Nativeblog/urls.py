@@ -1,28 +1,51 @@
+import functools
+
 from django.contrib import admin
 from django.urls import path , include
 from django.contrib.sitemaps.views import sitemap
 from Blog.seo import BlogSitemap
+from Blog.storage import serve_media
 from django.conf import settings
 from django.conf.urls.static import static
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 from Blog.views import (PostList, generate_content, preview_generated_content, regenerate_section, CategoryListView)
 from Blog.api_views import (PostViewFilter, UnplugPublishedPostsView, PostDetailView, PostsLatestDataView, PostsPopularDataView)
 
 # Swagger documentation setup
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Blog API" ,
-        default_version='v1' ,
-        description="API for Blog application" ,
-        terms_of_service="https://www.yourapp.com/terms/" ,
-        contact=openapi.Contact(email="contact@yourapp.com") ,
-        license=openapi.License(name="Your License") ,
-    ) ,
-    public=True ,
-    permission_classes=(permissions.AllowAny ,) ,
-)
+@functools.lru_cache(maxsize=None)
+def schema_view():
+    # drf_yasg and the schema generator are only imported once the docs are
+    # first requested, not by every worker and management command
+    from drf_yasg.views import get_schema_view
+    from drf_yasg import openapi
+
+    return get_schema_view(
+        openapi.Info(
+            title="Blog API" ,
+            default_version='v1' ,
+            description="API for Blog application" ,
+            terms_of_service="https://www.yourapp.com/terms/" ,
+            contact=openapi.Contact(email="contact@yourapp.com") ,
+            license=openapi.License(name="Your License") ,
+        ) ,
+        public=True ,
+        permission_classes=(permissions.AllowAny ,) ,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def schema_ui(renderer):
+    return schema_view().with_ui(renderer , cache_timeout=0)
+
+
+def lazy_schema_ui(renderer):
+    @csrf_exempt
+    def view(request , *args , **kwargs):
+        return schema_ui(renderer)(request , *args , **kwargs)
+
+    return view
+
 
 sitemaps = {
     'blog': BlogSitemap ,
@@ -40,8 +63,8 @@ urlpatterns = [
                   path('api-auth/' , include('rest_framework.urls')) ,  # DRF authentication URLs
 
                   # Swagger documentation URLs
-                  path('swagger/' , schema_view.with_ui('swagger' , cache_timeout=0) , name='schema-swagger-ui') ,
-                  path('redoc/' , schema_view.with_ui('redoc' , cache_timeout=0) , name='schema-redoc') ,
+                  path('swagger/' , lazy_schema_ui('swagger') , name='schema-swagger-ui') ,
+                  path('redoc/' , lazy_schema_ui('redoc') , name='schema-redoc') ,
 
                   # Original URLs
                   path('' , include('Blog.urls')) ,  # Your regular blog URLs
@@ -61,4 +84,4 @@ urlpatterns = [
                 #     path('post/<slug:slug>/', PostDetailView.as_view(), name='post-slug'),
                 #     path('posts-latest/', PostsLatestDataView.as_view(), name='latest-posts-list'),
                 #     path('posts-popular/', PostsPopularDataView.as_view(), name='popular-posts-list'),
-              ] + static(settings.MEDIA_URL , document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+              ] + static(settings.MEDIA_URL , view=serve_media , document_root=settings.MEDIA_ROOT)
\ No newline at end of file
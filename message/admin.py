@@ -3,6 +3,7 @@ from .models import Message
 
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
-    list_display = ('id', 'site', 'name', 'email', 'subject')
+    list_display = ('id', 'site', 'name', 'email', 'subject', 'created_at')
     search_fields = ('name', 'email', 'subject')
     list_filter = ('site',)
+    list_select_related = ('site',)
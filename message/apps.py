@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MessageConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'message'
+
+    def ready(self):
+        from Nativeblog import spool
+        from .ingest import write_messages
+        spool.register_handler('message', write_messages)
@@ -0,0 +1,18 @@
+from django.utils.dateparse import parse_datetime
+
+from .models import Message
+
+
+def write_messages(payloads):
+    """Spool handler: insert a batch of validated contact-form payloads"""
+    Message.objects.bulk_create([
+        Message(
+            site_id=payload['site'],
+            name=payload['name'],
+            email=payload['email'],
+            subject=payload.get('subject'),
+            message=payload.get('message'),
+            created_at=parse_datetime(payload['created_at']),
+        )
+        for payload in payloads
+    ], batch_size=500)
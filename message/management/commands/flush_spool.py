@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from Nativeblog import spool
+
+
+class Command(BaseCommand):
+    help = 'Write spooled contact-form messages and subscriptions to the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--loop', action='store_true', help='Keep flushing until interrupted')
+        parser.add_argument('--interval', type=float, default=2)
+
+    def handle(self, *args, **options):
+        while True:
+            written = spool.flush(options['batch_size'])
+            if written or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(f'Flushed {written} spooled row(s), {spool.pending()} pending'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
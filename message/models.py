@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from django.contrib.sites.models import Site
 # Create your models here.
 
@@ -7,4 +8,11 @@ class Message(models.Model):
     name = models.CharField(max_length=200)
     email = models.EmailField()
     subject = models.CharField(max_length=200, null=True, blank=True)
-    message = models.TextField(null=True, blank=True)
\ No newline at end of file
+    message = models.TextField(null=True, blank=True)
+    # Not auto_now_add: spooled messages keep the time they were received
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['site', 'id'], name='message_site_id_idx'),
+        ]
@@ -4,4 +4,5 @@ from .models import Message
 class MessageSerializer(serializers.ModelSerializer):
     class Meta:
         model = Message
-        fields = ['id', 'site', 'name', 'email', 'subject', 'message']
+        fields = ['id', 'site', 'name', 'email', 'subject', 'message', 'created_at']
+        read_only_fields = ['created_at']
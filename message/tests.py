@@ -1,3 +1,125 @@
-from django.test import TestCase
+import os
+import tempfile
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from subscription.models import Subscription
+from .models import Message
+
+
+@override_settings(WRITE_BEHIND_ENABLED=False)
+class MessageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+        self.other = Site.objects.create(domain='other.example', name='Other')
+        Message.objects.bulk_create(
+            [Message(site=self.site, name='n', email='a@example.com', message=f'm{index}') for index in range(120)]
+            + [Message(site=self.other, name='n', email='b@example.com', message='other')]
+        )
+        self.staff = User.objects.create(username='staff', is_staff=True)
+
+    def test_contact_endpoint_is_write_only(self):
+        self.assertEqual(self.client.get('/api/message/message/').status_code, 405)
+
+        response = self.client.post('/api/message/message/', {'site': self.site.id, 'name': 'x', 'email': 'x@example.com'})
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Message.objects.count(), 122)
+
+    def test_inbox_is_staff_only(self):
+        self.assertEqual(self.client.get('/api/message/messages/').status_code, 403)
+        self.assertEqual(self.client.get('/api/message/messages/export/').status_code, 403)
+
+    def test_inbox_pages_by_cursor_newest_first(self):
+        self.client.force_login(self.staff)
+
+        first = self.client.get(f'/api/message/messages/?site={self.site.id}').json()
+        second = self.client.get(first['next']).json()
+
+        self.assertEqual(len(first['results']), 50)
+        self.assertEqual(first['results'][0]['message'], 'm119')
+        self.assertEqual(second['results'][0]['message'], 'm69')
+        self.assertNotIn('count', first)
+
+    def test_export_streams_every_message(self):
+        self.client.force_login(self.staff)
+
+        response = self.client.get('/api/message/messages/export/')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(lines[0], 'id,site_id,name,email,subject,message,created_at')
+        self.assertEqual(len(lines), 122)
+        site_lines = b''.join(
+            self.client.get(f'/api/message/messages/export/?site={self.other.id}').streaming_content
+        ).splitlines()
+        self.assertEqual(len(site_lines), 2)
+
+    def test_export_rejects_an_invalid_site(self):
+        self.client.force_login(self.staff)
+
+        response = self.client.get('/api/message/messages/export/?site=abc')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('site', response.json())
+
+
+@override_settings(WRITE_BEHIND_ENABLED=False)
+class ThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+
+    def post(self, data, **extra):
+        return self.client.post('/api/message/message/', data, content_type='application/json', **extra)
+
+    def test_non_object_body_is_a_validation_error(self):
+        self.assertEqual(self.post([]).status_code, 400)
+        self.assertEqual(self.post('"text"').status_code, 400)
+
+    def test_posts_are_limited_per_site(self):
+        payload = {'site': self.site.id, 'name': 'x', 'email': 'x@example.com'}
+        codes = [self.post(payload, REMOTE_ADDR=f'10.0.0.{index}').status_code for index in range(31)]
+
+        self.assertEqual(codes.count(201), 30)
+        self.assertEqual(codes[-1], 429)
+
+    def test_posts_without_a_site_are_limited_per_address(self):
+        codes = [self.post([], REMOTE_ADDR='10.0.0.1').status_code for _ in range(31)]
+
+        self.assertEqual(codes[-1], 429)
+        self.assertEqual(self.post([], REMOTE_ADDR='10.0.0.2').status_code, 400)
+
+
+class WriteBehindTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+        spool_path = os.path.join(tempfile.mkdtemp(), 'spool.sqlite3')
+        settings = override_settings(
+            WRITE_BEHIND_ENABLED=True, WRITE_BEHIND_AUTOFLUSH=False, WRITE_BEHIND_SPOOL_PATH=spool_path
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_posts_are_accepted_then_flushed(self):
+        response = self.client.post('/api/message/message/', {'site': self.site.id, 'name': 'x', 'email': 'x@example.com'})
+        self.assertEqual(response.status_code, 202)
+        self.assertNotIn('id', response.json())
+        for email in ('A@example.com', 'a@example.com'):
+            response = self.client.post('/api/subscription/subscribe-create/', {'site': self.site.id, 'email': email})
+            self.assertEqual(response.status_code, 202)
+        self.assertFalse(Message.objects.exists())
+
+        call_command('flush_spool', stdout=open(os.devnull, 'w'))
+
+        self.assertEqual(Message.objects.count(), 1)
+        self.assertEqual(list(Subscription.objects.values_list('email', flat=True)), ['a@example.com'])
+
+        call_command('flush_spool', stdout=open(os.devnull, 'w'))
+        self.assertEqual(Message.objects.count(), 1)
@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import MessageCreateView
+from .views import MessageCreateView, MessageInboxView, MessageExportView
 
 urlpatterns = [
     path('message/', MessageCreateView.as_view(), name='message-create'),
+    path('messages/', MessageInboxView.as_view(), name='message-inbox'),
+    path('messages/export/', MessageExportView.as_view(), name='message-export'),
 ]
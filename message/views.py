@@ -1,10 +1,80 @@
+import csv
+
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
-from rest_framework import generics
+from django_filters.rest_framework import DjangoFilterBackend
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
+from rest_framework.views import APIView
 from .models import Message
 from .serializers import MessageSerializer
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from Nativeblog import spool
+from Nativeblog.throttling import SiteRateThrottle
 
-class MessageCreateView(generics.ListCreateAPIView):
+class MessageCreateView(generics.CreateAPIView):
     permission_classes = [AllowAny]
+    throttle_classes = [SiteRateThrottle]
+    throttle_scope = 'message'
+    queryset = Message.objects.all()
+    serializer_class = MessageSerializer
+
+    def create(self, request, *args, **kwargs):
+        if not spool.is_enabled():
+            return super().create(request, *args, **kwargs)
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        payload = dict(serializer.validated_data, site=serializer.validated_data['site'].id)
+        payload['created_at'] = timezone.now().isoformat()
+        spool.append('message', payload)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class MessageCursorPagination(CursorPagination):
+    # Keyset pagination on the primary key: every page is an indexed range scan
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = '-id'
+
+
+class MessageInboxView(generics.ListAPIView):
+    """Staff inbox, optionally filtered with ?site=<id>"""
+    permission_classes = [IsAdminUser]
     queryset = Message.objects.all()
     serializer_class = MessageSerializer
+    pagination_class = MessageCursorPagination
+    # The cursor owns the ordering, so OrderingFilter must stay out
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['site']
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+class MessageExportView(APIView):
+    """Stream every message (optionally ?site=<id>) as CSV"""
+    permission_classes = [IsAdminUser]
+    fields = ['id', 'site_id', 'name', 'email', 'subject', 'message', 'created_at']
+    # Same ?site filter as the inbox; an invalid value is a 400
+    filterset_fields = ['site']
+
+    def get(self, request, *args, **kwargs):
+        queryset = DjangoFilterBackend().filter_queryset(request, Message.objects.order_by('id'), self)
+
+        writer = csv.writer(_Echo())
+        rows = queryset.values_list(*self.fields).iterator(chunk_size=2000)
+
+        def stream():
+            yield writer.writerow(self.fields)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="messages.csv"'
+        return response
@@ -1,5 +0,0 @@
-﻿/*
-Copyright (c) 2003-2023, CKSource Holding sp. z o.o. All rights reserved.
-For licensing, see LICENSE.md or https://ckeditor.com/legal/ckeditor-oss-license/
-*/
-CKEDITOR.lang['sr-latn']={"application":"Uređivač bogatog teksta","editor":"Uređivač ","editorPanel":"Bogati uređivač panel","common":{"editorHelp":"Za pomoć pritisnite ALT 0","browseServer":"Pretraži na serveru","url":"URL","protocol":"Protokol","upload":"Pošalji","uploadSubmit":"Pošalji na server","image":"Slika","form":"Formular","checkbox":"Polje za potvrdu","radio":"Radio-dugme","textField":"Tekstualno polje","textarea":"Zona teksta","hiddenField":"Skriveno polje","button":"Dugme","select":"Padajuća lista","imageButton":"Dugme sa slikom","notSet":"<nije postavljeno> ","id":"Id","name":"Naziv","langDir":"Smer pisanja","langDirLtr":"S leva na desno (LTR)","langDirRtl":"S desna na levo (RTL)","langCode":"Kôd jezika","longDescr":"Detaljan opis URL","cssClass":"CSS klase","advisoryTitle":"Advisory naslov","cssStyle":"Stil","ok":"OK","cancel":"Otkaži","close":"Zatvori","preview":"Izgled stranice","resize":"Promena veličine","generalTab":"Opšti","advancedTab":"Dalje opcije","validateNumberFailed":"Ova vrednost nije broj.","confirmNewPage":"Nesačuvane promene ovog sadržaja će biti izgubljene. Jeste li sigurni da želita da učitate novu stranu?","confirmCancel":"Neka podešavanja su promenjena.Sigurno želite zatvoriti prozor?","options":"Podešavanja","target":"Cilj","targetNew":"Novi prozor (_blank)","targetTop":"Prozor na vrhu stranice(_top)","targetSelf":"Isti prozor (_self)","targetParent":"Matični prozor (_parent)","langDirLTR":"S leva na desno (LTR)","langDirRTL":"S desna na levo (RTL)","styles":"Stil","cssClasses":"CSS klase","width":"Širina","height":"Visina","align":"Ravnanje","left":"Levo","right":"Desno","center":"Sredina","justify":"Obostrano ravnanje","alignLeft":"Levo ravnanje","alignRight":"Desno ravnanje","alignCenter":"Centralno ravnanje","alignTop":"Vrh","alignMiddle":"Sredina","alignBottom":"Dole","alignNone":"Ništa","invalidValue":"Nevažeća vrednost.","invalidHeight":"U polje visina mogu se upisati samo brojevi.","invalidWidth":"U polje širina mogu se upisati samo brojevi.","invalidLength":"U \"%1\" polju data vrednos treba da bude pozitivan broj, sa validnom mernom jedinicom ili bez (%2).","invalidCssLength":"Za \"%1\" data vrednost mora biti pozitivan broj, moguće označiti sa validnim CSS vrednosću (px, %, in, cm, mm, em, ex, pt, or pc).","invalidHtmlLength":"Za \"%1\" data vrednost mora biti potitivan broj, moguće označiti sa validnim HTML vrednošću (px or %).","invalidInlineStyle":"Vrednost u inline styleu mora da sadrži barem jedan rekord u formatu \"name : value\", razdeljeni sa tačkazapetom.","cssLengthTooltip":"Odredite broj u pixeima ili u validnim CSS vrednostima (px, %, in, cm, mm, em, ex, pt, or pc).","unavailable":"%1<span class=\"cke_accessibility\">, unavailable</span>","keyboard":{"8":"Backspace","13":"Enter","16":"Shift","17":"Ctrl","18":"Alt","32":"Space","35":"End","36":"Home","46":"Delete","112":"F1","113":"F2","114":"F3","115":"F4","116":"F5","117":"F6","118":"F7","119":"F8","120":"F9","121":"F10","122":"F11","123":"F12","124":"F13","125":"F14","126":"F15","127":"F16","128":"F17","129":"F18","130":"F19","131":"F20","132":"F21","133":"F22","134":"F23","135":"F24","224":"Command"},"keyboardShortcut":"Taster za prečicu","optionDefault":"Оsnovni"},"versionCheck":{"notificationMessage":"This CKEditor %current version is not secure. Consider <a target=\"_blank\" href=\"%link\">upgrading to the latest one</a>, %latest.","consoleMessage":"This CKEditor %current version is not secure. Consider upgrading to the latest one, %latest: %link","aboutDialogInsecureMessage":"This CKEditor %current version is not secure.<br>Consider upgrading to the latest one, %latest:<br><a target=\"_blank\" href=\"%link\">%link</a>","aboutDialogUpgradeMessage":"Consider upgrading to the latest editor version, %latest:<br><a target=\"_blank\" href=\"%link\">%link</a>"},"about":{"copy":"Copyright &copy; $1. Sva prava zadržana.","dlgTitle":"O CKEditor 4","moreInfo":"Za informacije o licenci posetite našu web stranicu:"},"basicstyles":{"bold":"Podebljano","italic":"Kurziv","strike":"Precrtano","subscript":"Indeks","superscript":"Stepen","underline":"Podvučeno"},"bidi":{"ltr":"Pravac teksta sa leva na desno","rtl":"Pravac teksta sa desna na levo"},"blockquote":{"toolbar":"Blok citat"},"notification":{"closed":"Obaveštenje zatvoreno"},"toolbar":{"toolbarCollapse":"Zatvori alatnu traku","toolbarExpand":"Otvori alatnu traku","toolbarGroups":{"document":"Dokument","clipboard":"Clipboard/Vrati","editing":"Uredi","forms":"Obrasci","basicstyles":"Osnovni stilovi","paragraph":"Pasus","links":"Linkovi","insert":"Dodaj","styles":"Stilovi","colors":"Boje","tools":"Alatke"},"toolbars":"Uredjivač alatne trake"},"clipboard":{"copy":"Kopiraj","copyError":"Sigurnosna podešavanja Vašeg pretraživača ne dozvoljavaju operacije automatskog kopiranja teksta. Molimo Vas da koristite prečicu sa tastature (Ctrl/Cmd+C).","cut":"Iseci","cutError":"Sigurnosna podešavanja Vašeg pretraživača ne dozvoljavaju operacije automatskog isecanja teksta. Molimo Vas da koristite prečicu sa tastature (Ctrl/Cmd+X).","paste":"Zalepi","pasteNotification":"\"Pritisnite taster %1 za lepljenje. Vaš pretraživač ne dozvoljava lepljenje iz alatne trake ili menia.","pasteArea":"Prostor za lepljenje","pasteMsg":"Nalepite sadržaj u sledeći prostor i pritisnite taster OK.","fileFormatNotSupportedNotification":"Formati datoteke ${formats} nisu podržani.","fileWithoutFormatNotSupportedNotification":"Format datoteke nije podržan."},"colorbutton":{"auto":"Automatski","bgColorTitle":"Boja pozadine","colors":{"000":"Crno","800000":"Bordo","8B4513":"Braon","2F4F4F":"Tamno tirkizno","008080":"Tirkizno","000080":"Kraljevsko plavo","4B0082":"Indigo plavo","696969":"Sivo","B22222":"Cigla crveno","A52A2A":"Bakarno","DAA520":"Zlatno žuto","006400":"Tamno zeleno","40E0D0":"Tirkizno","0000CD":"Plavo","800080":"Ljubičasto","808080":"Sivo","F00":"Crveno","FF8C00":"Tamno narandžasto","FFD700":"Zlatno","008000":"Zeleno","0FF":"Cian","00F":"Plavo","EE82EE":"Roze","A9A9A9":"Tamno sivo","FFA07A":"Losos","FFA500":"Narandžasto","FFFF00":"Žuto","00FF00":"Neon zeleno","AFEEEE":"Svetlo tirkizno","ADD8E6":"Svetlo plavo","DDA0DD":"Svetlo ljubičasto","D3D3D3":"Svetlo sivo","FFF0F5":"Lavande","FAEBD7":"Prljavo belo","FFFFE0":"Svetlo žuto","F0FFF0":"Мentа","F0FFFF":"Azurno plavo","F0F8FF":"Svetlo plavo","E6E6FA":"Lavanda","FFF":"Belo","1ABC9C":"Tamno cian","2ECC71":"Smaragdno","3498DB":"Sjajno plavo","9B59B6":"Аmetist","4E5F70":"Sivkasto plavo","F1C40F":"Svetlo žuto","16A085":"Tamno cian","27AE60":"Tamno smaragdno","2980B9":"Tamno plavo","8E44AD":"Tamno ljubočasto","2C3E50":"Svetlo plavo","F39C12":"Narandžasto","E67E22":"Šargarepa","E74C3C":"Svetlo bakarno","ECF0F1":"Sjajno strebrno","95A5A6":"Svetlo sivkasto cian","DDD":"Svetlo sivo","D35400":"Bundeva","C0392B":"Tamno crveno","BDC3C7":"Srebrno","7F8C8D":"Sivkasto cian","999":"Tamno siv"},"more":"Više boja...","panelTitle":"Boje","textColorTitle":"Boja teksta"},"colordialog":{"clear":"Brisanje","highlight":"Isticanje","options":"Vrste boja","selected":"Odabrano","title":"Odaberite boju"},"templates":{"button":"Obrasci","emptyListMsg":"(Nema definisanih obrazaca)","insertOption":"Zameni trenutni sadržaj.","options":"Opcije šablona.","selectPromptMsg":"Molimo Vas da odaberete obrazac koji će se otvoriti u uredjivaču<br />(trenutni sadržaj će se izgubiti):","title":"Dostupni obrasci"},"contextmenu":{"options":"Opcije menija"},"copyformatting":{"label":"Kopiranje formatiranja","notification":{"copied":"Kopirano formatiranje","applied":"Formatiranje primenjeno","canceled":"Formatiranje prekinuto","failed":"Formatiranje nije uspelo. Ne možete primenjivati stilove pre nego što ih kopirate."}},"div":{"IdInputLabel":"Id","advisoryTitleInputLabel":"Savet","cssClassInputLabel":"CSS klase","edit":"DIV uredjivač","inlineStyleInputLabel":"Inline Stil","langDirLTRLabel":"S leva na desno (LTR)","langDirLabel":"Smer jezika","langDirRTLLabel":"S desna na levo (RTL)","languageCodeInputLabel":"Kod jezika","remove":"Ukloni Div","styleSelectLabel":"Stil","title":"Kreiranje DIV spremišta","toolbar":"Kreiranje DIV spremišta"},"elementspath":{"eleLabel":"Put do elemenata","eleTitle":"%1 element"},"exportpdf":{"documentReady":"Document is ready!","error":"Error occurred.","processingDocument":"Processing PDF document...","toolbar":"Export to PDF"},"filetools":{"loadError":"Došlo je do greške pri čitanju datoteke.","networkError":"Tokom postavljanja datoteke došlo je do mrežne greške","httpError404":"Tokom postavljanja datoteke došlo je do HTTP greške (404: Datoteka nije pronadjena).","httpError403":"Tokom postavljanja datoteke došlo je do HTTP greške (403: Zabranjena).","httpError":"Tokom postavljanja datoteke došlo je do HTTP greške (status greške: %1).","noUrlError":"URL adresa za postavljanje nije navedena.","responseError":"Neispravan odgovor servera."},"find":{"find":"Pretraga","findOptions":"Podešavanja","findWhat":"Pronadji:","matchCase":"Razlikuj mala i velika slova","matchCyclic":"Pretraga u ciklusima","matchWord":"Uporedi cele reci","notFoundMsg":"Traženi tekst nije pronađen.","replace":"Zamena","replaceAll":"Zameni sve","replaceSuccessMsg":"%1 occurrence(s) replaced.","replaceWith":"Zameni sa:","title":"Pretraži i zameni"},"font":{"fontSize":{"label":"Veličina ","voiceLabel":"Veličina slova","panelTitle":"Veličina slova"},"label":"Font","panelTitle":"Naziv fonta","voiceLabel":"Font"},"fakeobjects":{"anchor":"Sidro","hiddenfield":"Skriveno polje","iframe":"IFrame","unknown":"Nepoznat objekat"},"forms":{"button":{"title":"Osobine tastera","text":"Tekst (vrednost)","type":"Tip","typeBtn":"Taster","typeSbm":"Poslati","typeRst":"Reset"},"checkboxAndRadio":{"checkboxTitle":"Osobine polja za potvrdu","radioTitle":"Osobine radio-tastera","value":"Vrednost","selected":"Odabran","required":"Obavezno"},"form":{"title":"Osobine obrazca","menu":"Osobine obrazca","action":"Referenca obrade podataka","method":"Metoda slanja podataka","encoding":"Kodiranje"},"hidden":{"title":"Osobine skrivenog polja","name":"Naziv","value":"Vrednost"},"select":{"title":"Osobine padjuće liste","selectInfo":"Osnovne karakteristike","opAvail":"Dostupne opcije","value":"Vrednost","size":"Veličina","lines":"red","chkMulti":"dozvoli višestruku selekciju","required":"Obavezno","opText":"Tekst","opValue":"Vrednost","btnAdd":"Dodaj","btnModify":"Izmeni","btnUp":"Gore","btnDown":"Dole","btnSetValue":"Podesi kao podrazumevanu vrednost","btnDelete":"Obriši"},"textarea":{"title":"Osobine zone teksta","cols":"Broj karaktera u redu","rows":"Broj redova"},"textfield":{"title":"Osobine tekstualnog polja","name":"Naziv","value":"Vrednost","charWidth":"Broj prikazanih karaktera","maxChars":"Maksimalno karaktera","required":"Obavezno","type":"Tip","typeText":"Tekst","typePass":"Lozinka","typeEmail":"Email","typeSearch":"Pretraži","typeTel":"Broj telefona","typeUrl":"URL"}},"format":{"label":"Format","panelTitle":"Format pasusa","tag_address":"Adresa","tag_div":"Normalno (DIV)","tag_h1":"Naslov 1","tag_h2":"Naslov 2","tag_h3":"Naslov 3","tag_h4":"Naslov 4","tag_h5":"Naslov 5","tag_h6":"Naslov 6","tag_p":"Normalno","tag_pre":"Formatirano"},"horizontalrule":{"toolbar":"Unesi horizontalnu liniju"},"iframe":{"border":"Prikaži granicu okvira","noUrl":"Unesite iframe URL","scrolling":"Uključi pomerajuće trake","title":"IFrame podešavanje","toolbar":"IFrame","tabindex":"Uklonite sa tabindeksa"},"image":{"alt":"Alternativni tekst","border":"Okvir","btnUpload":"Pošalji na server","button2Img":"Želite napraviti od odabrane slike tastera običnu sliku?","hSpace":"Vodoravna razdaljina","img2Button":"Želite od izabrane slike napraviti sliku tastera?","infoTab":"Osnovne karakteristike","linkTab":"Link","lockRatio":"Zadrži odnos","menu":"Osobine slike","resetSize":"Originalna veličina","title":"Osobine slike","titleButton":"Osobine tastera sa slikom","upload":"Postavi","urlMissing":"Nedostaje URL slike.","vSpace":"Uzdužna razdaljina","validateBorder":"Veličina okvira mora biti celi broj!","validateHSpace":"Vodoravna razdaljina mora bili celi broj!","validateVSpace":"Uzdužna razdaljina mora bili celi broj!"},"indent":{"indent":"Uvećaj marginu","outdent":"Smanji marginu"},"smiley":{"options":"Emotikon opcije","title":"Unesi emotikon","toolbar":"Emotikoni"},"language":{"button":"Podesi jezik","remove":"Odstrani jezik"},"link":{"acccessKey":"Kombinacija tastera","advanced":"Dalje mogućnosti","advisoryContentType":"Tip sadržaja pomoći","advisoryTitle":"Oznaka za pomoć","anchor":{"toolbar":"Unesi/izmeni sidro","menu":"Karakteristike sidra","title":"Karakteristike sidra","name":"Naziv sidra","errorName":"Unesite naziv sidra","errorWhitespace":"Anchor name cannot contain space characters","remove":"Ukloni sidro"},"anchorId":"Po Id-u elementa","anchorName":"Po nazivu sidra","charset":"Kod stranica navedenog sadržaja","cssClasses":"Stilske oznake","download":"Obavezno preuzimanje","displayText":"Prikazani tekst","emailAddress":"E-Mail adresa","emailBody":"Sadržaj poruke","emailSubject":"Naslov poruke","id":"Id","info":"Osnovne karakteristike","langCode":"Smer pisanja","langDir":"Smer pisanja","langDirLTR":"S leva na desno (LTR)","langDirRTL":"S desna na levo (RTL)","menu":"Izmeni link","name":"Naziv","noAnchors":"(Nema sidra u dokumentu)","noEmail":"Odredite e-mail adresu","noUrl":"Unesite URL linka","noTel":"Unesite broj telefona","other":"<оstalo>","phoneNumber":"Broj telefona","popupDependent":"Zavisno (Netscape)","popupFeatures":"Karakteristike iskačućeg prozora","popupFullScreen":"Prikaz preko celog ekrana (IE)","popupLeft":"Leva pozicija ","popupLocationBar":"Lokacija","popupMenuBar":"Kontekstni meni","popupResizable":"Promenljive veličine","popupScrollBars":"Klizač","popupStatusBar":"Statusna linija","popupToolbar":"Traka sa altakama","popupTop":"Gornja pozicija","rel":"Vrsta odnosа","selectAnchor":"Odaberi sidro","styles":"Stil","tabIndex":"Tab indeks","target":"Prikaži sadržaj","targetFrame":"<okvir>","targetFrameName":"Naziv okvira","targetPopup":" <iskačuć prozor>","targetPopupName":"Naziv iskačućeg prozora","title":"Karaktersitike linka","toAnchor":"Sidro na ovoj stranici","toEmail":"E-Mail","toUrl":"URL","toPhone":"Telefon","toolbar":"Unesi/izmeni link","type":"Vrsta linka","unlink":"Ukloni link","upload":"Postavi"},"list":{"bulletedlist":"Nаbrajanje","numberedlist":"Numerisanje"},"liststyle":{"bulletedTitle":"Karakteristike liste sa tačkama","circle":"Krug","decimal":"Arabski brojevi (1, 2, 3, etc.)","disc":"Disk","lowerAlpha":"Mala slova (a, b, c, d, e, etc.)","lowerRoman":"Rimska mala slova (i, ii, iii, iv, v, etc.)","none":"Nema","notset":"<not set>","numberedTitle":"Karakteristike liste sa brojevima","square":"Kvadrat","start":"Početni broj","type":"Tip","upperAlpha":"Velika slova (A, B, C, D, E, etc.)","upperRoman":"Rimska velika slova (I, II, III, IV, V, etc.)","validateStartNumber":"Početni broj liste mora biti celi broj."},"magicline":{"title":"Umetnite pasus ovde."},"maximize":{"maximize":"Maksimalna veličina","minimize":"Minimalna veličina"},"newpage":{"toolbar":"Nova stranica"},"pagebreak":{"alt":"Prelom stranice","toolbar":"Umetnite prelom stranice"},"pastetext":{"button":"Zalepi kao neformiran tekst","pasteNotification":"Pritisnite taster % 1 da bi ste nalepili. Pretraživač ne podržava lepljenje pomoću tastera na traci sa alatkama ili iz menija.","title":"Zalepi kao neformiran tekst"},"pastefromword":{"confirmCleanup":"Kopirani tekst je iz Word-a. Želite ga očistiti? ","error":"Zbog interne greške tekst nije očišćen.","title":"Zalepi iz Worda","toolbar":"Zalepi iz Worda"},"preview":{"preview":"Izgled stranice"},"print":{"toolbar":"Štampa"},"removeformat":{"toolbar":"Ukloni formatiranje"},"save":{"toolbar":"Sačuvaj"},"selectall":{"toolbar":"Označi sve"},"showblocks":{"toolbar":"Prikaži blokove"},"sourcearea":{"toolbar":"Izvorni kod"},"specialchar":{"options":"Opcije specijalnog karaktera","title":"Odaberite specijalni karakter","toolbar":"Unesi specijalni karakter"},"scayt":{"btn_about":"About SCAYT","btn_dictionaries":"Dictionaries","btn_disable":"Disable SCAYT","btn_enable":"Enable SCAYT","btn_langs":"Languages","btn_options":"Options","text_title":"Spell Check As You Type"},"stylescombo":{"label":"Stil","panelTitle":"Stilovi formatiranja","panelTitle1":"Blok stilovi","panelTitle2":"Inline stilovi","panelTitle3":"Stilovi objekta"},"table":{"border":"Veličina okvira","caption":"Naslov tabele","cell":{"menu":"Ćelija","insertBefore":"Ubaci levo","insertAfter":"Ubaci desno","deleteCell":"Obriši ćelije","merge":"Spoj ćelije","mergeRight":"Spolj ćelije desno","mergeDown":"Spolj čelije na dole","splitHorizontal":"Razdvoji ćelije vodoravno","splitVertical":"Razdvoji ćelije uspravno","title":"Karakteristike ćelija","cellType":"Tip ćelija","rowSpan":"Spoj uzdužno","colSpan":"Spoj vodoravno","wordWrap":"Brisanje dugačkih redova","hAlign":"Ravnanje vodoravno","vAlign":"Ravnanje uspravno","alignBaseline":"Bazna linija","bgColor":"Boja pozadine","borderColor":"Boja okvira","data":"Podatak","header":"Zaglavlje","columnHeader":"Zaglavlje kolone","rowHeader":"Zaglavlje reda","yes":"Da","no":"Nе","invalidWidth":"U polje širina možete upisati samo brojeve. ","invalidHeight":"U polje visina možete upisati samo brojeve.","invalidRowSpan":"U polje spoj uspravno  možete upistai samo brojeve.","invalidColSpan":"U polje spoj vodoravno možete upistai samo brojeve.","chooseColor":"Izaberi"},"cellPad":"Razmak ćelija","cellSpace":"Ćelijski prostor","column":{"menu":"Kolona","insertBefore":"Ubaci levo","insertAfter":"Ubaci desno","deleteColumn":"Obriši kolone"},"columns":"Kolona","deleteTable":"Izbriši tabelu","headers":"Zaglavlja","headersBoth":"Oba","headersColumn":"Prva kolona","headersNone":"Nema","headersRow":"Prvi red","heightUnit":"Jedinica visine","invalidBorder":"Veličina okvira mora biti broj.","invalidCellPadding":"Padding polja mora biti pozitivan broj.","invalidCellSpacing":"Razmak između ćelija mora biti pozitivan broj.","invalidCols":"Broj kolona mora biti broj veći od 0.","invalidHeight":"Visina tabele mora biti broj.","invalidRows":"Broj redova mora biti veći od 0.","invalidWidth":"Širina tabele mora biti broj.","menu":"Osobine tabele","row":{"menu":"Red","insertBefore":"Ubaci iznad","insertAfter":"Ubaci ispod","deleteRow":"Obriši redove"},"rows":"Redovi","summary":"Opis","title":"Karakteristike tabele","toolbar":"Tabela","widthPc":"procenata","widthPx":"piksela","widthUnit":"jedinica za širinu"},"undo":{"redo":"Ponovi ","undo":"Vrati"},"widget":{"move":"Kliknite i povucite da bi pomerali","label":"%1 modul"},"uploadwidget":{"abort":"Postavljanje je prekinuto sa strane korisnika","doneOne":"Datoteka je uspešno postavljena","doneMany":"%1 datoteka je uspešno postavljena","uploadOne":"Postavljanje datoteke  ({percentage}%)...","uploadMany":"Postavljanje datoteka, {current} of {max} done ({percentage}%)..."}};
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","cs",{embeddingInProgress:"Pokus o vnoření vložené URL",embeddingFailed:"Tato URL nemůže být automaticky vnořena."});
\ No newline at end of file
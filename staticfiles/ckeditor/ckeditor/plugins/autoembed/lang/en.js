@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","en",{embeddingInProgress:"Trying to embed pasted URL...",embeddingFailed:"This URL could not be automatically embedded."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","ku",{embeddingInProgress:"لەهەوڵی لکاندنی بەستەری ناونیشانە...",embeddingFailed:"ئەم بەستەرە خۆکارانە ناتواندرێت بخرێتە ناوێ."});
\ No newline at end of file
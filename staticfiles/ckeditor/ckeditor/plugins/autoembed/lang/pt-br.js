@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","pt-br",{embeddingInProgress:"Tentando embutir a URL colada...",embeddingFailed:"Esta URL não pode ser embutida automaticamente."});
\ No newline at end of file
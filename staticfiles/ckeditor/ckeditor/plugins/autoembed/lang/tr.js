@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("autoembed","tr",{embeddingInProgress:"Yapıştırdığınız URL gömülmeye çalışılıyor...",embeddingFailed:"Bu URL otomatik olarak gömülemedi."});
\ No newline at end of file
@@ -1,2 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","ar",{bgColor:"لون الخلفية",bgFixed:"جعلها علامة مائية",bgImage:"رابط الصورة الخلفية",charset:"ترميز الحروف",charsetASCII:"ASCII",charsetCE:"أوروبا الوسطى",charsetCR:"السيريلية",charsetCT:"الصينية التقليدية (Big5)",charsetGR:"اليونانية",charsetJP:"اليابانية",charsetKR:"الكورية",charsetOther:"ترميز آخر",charsetTR:"التركية",charsetUN:"Unicode (UTF-8)",charsetWE:"أوروبا الغربية",chooseColor:"اختر",design:"تصميم",docTitle:"عنوان الصفحة",docType:"ترويسة نوع  الصفحة",
-docTypeOther:"ترويسة نوع  صفحة أخرى",label:"خصائص الصفحة",margin:"هوامش الصفحة",marginBottom:"سفلي",marginLeft:"أيسر",marginRight:"أيمن",marginTop:"علوي",meta:"المعرّفات الرأسية",metaAuthor:"الكاتب",metaCopyright:"المالك",metaDescription:"وصف الصفحة",metaKeywords:"الكلمات الأساسية (مفصولة بفواصل)َ",other:"<أخرى>",previewHtml:'<p>هذه مجرد <strong>كتابة بسيطة</strong>من أجل التمثيل. <a href="javascript:void(0)">CKEditor</a>.</p>',title:"خصائص الصفحة",txtColor:"لون النص",xhtmlDec:"تضمين   إعلانات لغة XHTMLَ"});
\ No newline at end of file
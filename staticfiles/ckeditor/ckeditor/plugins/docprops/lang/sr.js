@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","sr",{bgColor:"Боја позадине",bgFixed:"Фиксирана позадина",bgImage:"УРЛ позадинске слике",charset:"Кодирање скупа карактера",charsetASCII:"ASCII",charsetCE:"Central European",charsetCR:"Cyrillic",charsetCT:"Chinese Traditional (Big5)",charsetGR:"Greek",charsetJP:"Japanese",charsetKR:"Korean",charsetOther:"Остала кодирања скупа карактера",charsetTR:"Turkish",charsetUN:"Unicode (UTF-8)",charsetWE:"Western European",chooseColor:"Choose",design:"Design",docTitle:"Наслов странице",
-docType:"Заглавље типа документа",docTypeOther:"Остала заглавља типа документа",label:"Особине документа",margin:"Маргине странице",marginBottom:"Доња",marginLeft:"Лева",marginRight:"Десна",marginTop:"Горња",meta:"Метаподаци",metaAuthor:"Аутор",metaCopyright:"Ауторска права",metaDescription:"Опис документа",metaKeywords:"Кључне речи за индексирање документа (раздвојене зарезом)",other:"<other>",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',
-title:"Особине документа",txtColor:"Боја текста",xhtmlDec:"Улључи XHTML декларације"});
\ No newline at end of file
@@ -1,3 +0,0 @@
-﻿CKEDITOR.plugins.setLang("docprops","tt",{bgColor:"Фон төсе",bgFixed:"Non-scrolling (Fixed) Background",bgImage:"Background Image URL",charset:"Character Set Encoding",charsetASCII:"ASCII",charsetCE:"Урта Ауропа",charsetCR:"Кириллик",charsetCT:"Гадәти кытай (Big5)",charsetGR:"Грек",charsetJP:"Япон",charsetKR:"Корей",charsetOther:"Other Character Set Encoding",charsetTR:"Төрек",charsetUN:"Юникод (UTF-8)",charsetWE:"Көнбатыш Ауропа",chooseColor:"Сайлау",design:"Дизайн",docTitle:"Бит исеме",docType:"Document Type Heading",
-docTypeOther:"Other Document Type Heading",label:"Документ үзлекләре",margin:"Page Margins",marginBottom:"Аска",marginLeft:"Сул",marginRight:"Уң як",marginTop:"Өскә",meta:"Метатег",metaAuthor:"Автор",metaCopyright:"Хокук иясе",metaDescription:"Документ тасвирламасы",metaKeywords:"Document Indexing Keywords (comma separated)",other:"Башка...",previewHtml:'<p>This is some <strong>sample text</strong>. You are using <a href="javascript:void(0)">CKEditor</a>.</p>',title:"Документ үзлекләре",txtColor:"Текст төсе",
-xhtmlDec:"Include XHTML Declarations"});
\ No newline at end of file
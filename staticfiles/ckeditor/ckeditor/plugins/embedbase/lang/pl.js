@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","pl",{pathName:"obiekt multimediów",title:"Osadzenie multimediów (oEmbed)",button:"Osadź obiekt multimediów (oEmbed)",unsupportedUrlGiven:"Podany adres URL nie jest obsługiwany.",unsupportedUrl:"Adres URL {url} nie jest obsługiwany przez funkcjonalność osadzania multimediów.",fetchingFailedGiven:"Nie udało się pobrać zawartości dla podanego adresu URL.",fetchingFailed:"Nie udało się pobrać zawartości dla {url}.",fetchingOne:"Pobieranie odpowiedzi oEmbed...",fetchingMany:"Pobieranie odpowiedzi oEmbed, gotowe {current} z {max}..."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("embedbase","pt-br",{pathName:"objeto de mídia",title:"Incorporação de Mídia",button:"Inserir Incorporação de Mídia",unsupportedUrlGiven:"A URL especificada não é suportada.",unsupportedUrl:"A UTL {url} não é suportada pela Incorporação de Mídia.",fetchingFailedGiven:"Falha ao obter conteúdo para a URL informada.",fetchingFailed:"Falha ao obter conteúdo para {url}.",fetchingOne:"Obtendo resposta oEmbed...",fetchingMany:"Obtendo respostas oEmbed, {current} de {max} completos..."});
\ No newline at end of file
@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("filetools","nl",{loadError:"Fout tijdens lezen van bestand.",networkError:"Netwerkfout tijdens uploaden van bestand.",httpError404:"HTTP fout tijdens uploaden van bestand (404: Bestand niet gevonden).",httpError403:"HTTP fout tijdens uploaden van bestand (403: Verboden).",httpError:"HTTP fout tijdens uploaden van bestand (fout status: %1).",noUrlError:"Upload URL is niet gedefinieerd.",responseError:"Ongeldig antwoord van server."});
\ No newline at end of file
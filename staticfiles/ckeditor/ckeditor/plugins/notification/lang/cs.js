@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","cs",{closed:"Oznámení zavřeno."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","en",{closed:"Notification closed."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","eo",{closed:"Sciigo fermita"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","it",{closed:"Notifica chiusa."});
\ No newline at end of file
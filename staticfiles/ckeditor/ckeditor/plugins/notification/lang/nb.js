@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","nb",{closed:"Varsling lukket."});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","sv",{closed:"Notifiering stängd."});
\ No newline at end of file
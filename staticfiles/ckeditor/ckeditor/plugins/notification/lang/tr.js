@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("notification","tr",{closed:"Uyarılar kapatıldı."});
\ No newline at end of file
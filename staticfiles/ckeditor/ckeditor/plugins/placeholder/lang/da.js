@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("placeholder","da",{title:"Egenskaber for pladsholder",toolbar:"Opret pladsholder",name:"Navn på pladsholder",invalidName:"Pladsholderen kan ikke være tom og må ikke indeholde nogen af følgende tegn: [, ], <, >",pathName:"pladsholder"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","de",{toolbar:"Quellcode",title:"Quellcode"});
\ No newline at end of file
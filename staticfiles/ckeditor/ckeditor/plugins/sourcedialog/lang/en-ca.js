@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","en-ca",{toolbar:"Source",title:"Source"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","es",{toolbar:"Fuente HTML",title:"Fuente HTML"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","eu",{toolbar:"HTML Iturburua",title:"HTML Iturburua"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","hu",{toolbar:"Forráskód",title:"Forráskód"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","id",{toolbar:"Sumber",title:"Sumber"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","km",{toolbar:"អក្សរ​កូដ",title:"អក្សរ​កូដ"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","ko",{toolbar:"소스",title:"소스"});
\ No newline at end of file
@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","lt",{toolbar:"Šaltinis",title:"Šaltinis"});
\ No newline at end of file
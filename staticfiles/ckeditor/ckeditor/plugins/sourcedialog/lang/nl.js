@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","nl",{toolbar:"Broncode",title:"Broncode"});
\ No newline at end of file
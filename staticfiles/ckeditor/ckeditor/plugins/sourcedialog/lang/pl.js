@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","pl",{toolbar:"Źródło dokumentu",title:"Źródło dokumentu"});
\ No newline at end of file
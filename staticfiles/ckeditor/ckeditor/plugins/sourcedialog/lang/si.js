@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","si",{toolbar:"මුලාශ්‍රය",title:"මුලාශ්‍රය"});
\ No newline at end of file
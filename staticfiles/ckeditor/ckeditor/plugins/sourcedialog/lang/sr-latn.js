@@ -1 +0,0 @@
-﻿CKEDITOR.plugins.setLang("sourcedialog","sr-latn",{toolbar:"Kôd",title:"Kôd"});
\ No newline at end of file
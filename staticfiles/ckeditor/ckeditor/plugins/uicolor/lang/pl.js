@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("uicolor","pl",{title:"Wybór koloru interfejsu",preview:"Podgląd na żywo",config:"Wklej poniższy łańcuch znaków do pliku config.js:",predefined:"Predefiniowane zestawy kolorów"});
\ No newline at end of file
@@ -1,5 +0,0 @@
-﻿/*
- Copyright (c) 2003-2015, CKSource - Frederico Knabben. All rights reserved.
- For licensing, see LICENSE.md or http://ckeditor.com/license
-*/
-CKEDITOR.plugins.setLang("widget","km",{move:"ចុច​ហើយ​ទាញ​ដើម្បី​ផ្លាស់​ទី"});
\ No newline at end of file
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class SubscriptionConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'subscription'
+
+    def ready(self):
+        from Nativeblog import spool
+        from .ingest import write_subscriptions
+        spool.register_handler('subscription', write_subscriptions)
@@ -0,0 +1,90 @@
+import threading
+import time
+
+from django.conf import settings
+
+from .models import Subscription, normalize_email
+
+
+class _Pending:
+    def __init__(self, site_id, email):
+        self.key = (site_id, email)
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SubscriptionBatcher:
+    """
+    Group commit for subscription writes. The first request in a batch becomes
+    the leader: it waits up to ``max_delay`` seconds for others to join, then
+    writes the whole batch with one ``bulk_create(ignore_conflicts=True)``.
+    Every caller gets back its (new or already existing) row.
+    """
+
+    def __init__(self, max_batch=500, max_delay=0.01):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._full = threading.Condition(self._lock)
+        self._pending = []
+
+    def submit(self, site_id, email):
+        item = _Pending(site_id, normalize_email(email))
+        with self._lock:
+            self._pending.append(item)
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_batch:
+                self._full.notify()
+            if leader:
+                deadline = time.monotonic() + self.max_delay
+                while len(self._pending) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._full.wait(remaining)
+                batch, self._pending = self._pending, []
+
+        if leader:
+            self._commit(batch)
+        item.done.wait()
+        if item.error is not None:
+            raise item.error
+        return item.result
+
+    def _commit(self, batch):
+        try:
+            keys = {item.key for item in batch}
+            Subscription.objects.bulk_create(
+                [Subscription(site_id=site_id, email=email) for site_id, email in keys],
+                batch_size=self.max_batch,
+                ignore_conflicts=True
+            )
+            rows = Subscription.objects.filter(
+                site_id__in={site_id for site_id, _ in keys},
+                email__in={email for _, email in keys}
+            )
+            by_key = {(row.site_id, row.email): row for row in rows}
+            for item in batch:
+                item.result = by_key.get(item.key)
+        except Exception as exc:
+            for item in batch:
+                item.error = exc
+        finally:
+            for item in batch:
+                item.done.set()
+
+
+def write_subscriptions(payloads):
+    """Spool handler: insert a batch of subscriptions, skipping known emails"""
+    Subscription.objects.bulk_create(
+        [Subscription(site_id=payload['site'], email=normalize_email(payload['email'])) for payload in payloads],
+        batch_size=500,
+        ignore_conflicts=True
+    )
+
+
+batcher = SubscriptionBatcher(
+    max_batch=settings.SUBSCRIPTION_BATCH_SIZE,
+    max_delay=settings.SUBSCRIPTION_BATCH_DELAY,
+)
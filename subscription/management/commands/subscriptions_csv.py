@@ -0,0 +1,90 @@
+import csv
+import sys
+
+from django.contrib.sites.models import Site
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+
+from subscription.models import Subscription, normalize_email
+
+
+class Command(BaseCommand):
+    help = 'Stream subscriptions to or from a CSV file with "email" and optional "site" (domain) columns'
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['import', 'export'])
+        parser.add_argument('path', help='CSV file, or "-" for stdin/stdout')
+        parser.add_argument('--site', help='Domain used for rows without a site column (and to filter exports)')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        site = None
+        if options['site']:
+            try:
+                site = Site.objects.get(domain=options['site'])
+            except Site.DoesNotExist:
+                raise CommandError(f'Site with domain "{options["site"]}" does not exist.')
+
+        if options['action'] == 'import':
+            self.import_csv(options['path'], site, options['batch_size'])
+        else:
+            self.export_csv(options['path'], site, options['batch_size'])
+
+    def _open(self, path, mode):
+        if path == '-':
+            return sys.stdin if mode == 'r' else sys.stdout
+        return open(path, mode, newline='', encoding='utf-8')
+
+    def import_csv(self, path, default_site, batch_size):
+        site_ids = {site.domain: site.id for site in Site.objects.all()}
+        batch, seen = [], set()
+        read = skipped = 0
+
+        handle = self._open(path, 'r')
+        try:
+            for row in csv.DictReader(handle):
+                read += 1
+                email = normalize_email(row.get('email'))
+                domain = (row.get('site') or '').strip()
+                site_id = site_ids.get(domain) if domain else getattr(default_site, 'id', None)
+                try:
+                    validate_email(email)
+                except ValidationError:
+                    site_id = None
+                if site_id is None or (site_id, email) in seen:
+                    skipped += 1
+                    continue
+                seen.add((site_id, email))
+                batch.append(Subscription(site_id=site_id, email=email))
+                if len(batch) >= batch_size:
+                    Subscription.objects.bulk_create(batch, ignore_conflicts=True)
+                    # Rows in earlier batches are deduplicated by the constraint
+                    batch, seen = [], set()
+            if batch:
+                Subscription.objects.bulk_create(batch, ignore_conflicts=True)
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+
+        self.stderr.write(self.style.SUCCESS(f'Read {read} row(s), skipped {skipped} invalid or duplicate row(s)'))
+
+    def export_csv(self, path, site, batch_size):
+        queryset = Subscription.objects.order_by('id')
+        if site:
+            queryset = queryset.filter(site=site)
+
+        handle = self._open(path, 'w')
+        written = 0
+        try:
+            writer = csv.writer(handle)
+            writer.writerow(['email', 'site'])
+            rows = queryset.values_list('email', 'site__domain').iterator(chunk_size=batch_size)
+            for email, domain in rows:
+                writer.writerow([email, domain])
+                written += 1
+        finally:
+            if handle is not sys.stdout:
+                handle.close()
+
+        self.stderr.write(self.style.SUCCESS(f'Exported {written} subscription(s)'))
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 22:33
+
+from django.db import migrations, models
+
+
+def normalize_and_dedupe(apps, schema_editor):
+    Subscription = apps.get_model('subscription', 'Subscription')
+    seen = set()
+    duplicates = []
+    for subscription in Subscription.objects.order_by('id').iterator(chunk_size=2000):
+        email = (subscription.email or '').strip().lower()
+        key = (subscription.site_id, email)
+        if key in seen:
+            duplicates.append(subscription.id)
+            continue
+        seen.add(key)
+        if email != subscription.email:
+            Subscription.objects.filter(id=subscription.id).update(email=email)
+    for start in range(0, len(duplicates), 500):
+        Subscription.objects.filter(id__in=duplicates[start:start + 500]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0002_alter_domain_unique'),
+        ('subscription', '0002_alter_subscription_email'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_and_dedupe, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='subscription',
+            constraint=models.UniqueConstraint(fields=('site', 'email'), name='subscription_unique_site_email'),
+        ),
+    ]
@@ -2,6 +2,20 @@ from django.db import models
 from django.contrib.sites.models import Site
 # Create your models here.
 
+
+def normalize_email(email):
+    return (email or '').strip().lower()
+
+
 class Subscription(models.Model):
     site = models.ForeignKey(Site, on_delete=models.CASCADE)
-    email = models.EmailField()
\ No newline at end of file
+    email = models.EmailField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['site', 'email'], name='subscription_unique_site_email'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.email = normalize_email(self.email)
+        super().save(*args, **kwargs)
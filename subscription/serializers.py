@@ -1,7 +1,13 @@
 from rest_framework import serializers
-from .models import Subscription
+from .models import Subscription, normalize_email
 
 class SubscriptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Subscription
         fields = ['id', 'site', 'email']
+        # Re-subscribing is idempotent, so the (site, email) constraint must
+        # not turn into a validation error
+        validators = []
+
+    def validate_email(self, value):
+        return normalize_email(value)
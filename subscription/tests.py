@@ -1,3 +1,104 @@
-from django.test import TestCase
+import os
+import tempfile
+import threading
 
-# Create your tests here.
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+
+from .ingest import SubscriptionBatcher
+from .models import Subscription
+
+
+def run_threads(target, count):
+    def run(index):
+        try:
+            target(index)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@override_settings(WRITE_BEHIND_ENABLED=False)
+class SubscribeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+
+    def test_resubscribing_returns_the_existing_row(self):
+        first = self.client.post('/api/subscription/subscribe-create/', {'site': self.site.id, 'email': ' A@Example.com '})
+        again = self.client.post('/api/subscription/subscribe-create/', {'site': self.site.id, 'email': 'a@example.com'})
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(first.json()['email'], 'a@example.com')
+        self.assertEqual(again.status_code, 201)
+        self.assertEqual(again.json()['id'], first.json()['id'])
+        self.assertEqual(Subscription.objects.count(), 1)
+
+
+@override_settings(WRITE_BEHIND_ENABLED=False)
+class BatcherTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+
+    def test_concurrent_duplicates_share_one_row(self):
+        batcher = SubscriptionBatcher(max_batch=50, max_delay=0.05)
+        results = {}
+
+        def submit(index):
+            results[index] = batcher.submit(self.site.id, f'user{index % 5}@example.com').id
+
+        run_threads(submit, 20)
+
+        self.assertEqual(Subscription.objects.count(), 5)
+        for index, subscription_id in results.items():
+            self.assertEqual(subscription_id, results[index % 5])
+
+    def test_concurrent_posts_are_idempotent(self):
+        codes = []
+
+        def post(index):
+            response = Client().post(
+                '/api/subscription/subscribe-create/', {'site': self.site.id, 'email': f'user{index % 10}@example.com'}
+            )
+            codes.append(response.status_code)
+
+        run_threads(post, 30)
+
+        self.assertEqual(codes, [201] * 30)
+        self.assertEqual(Subscription.objects.count(), 10)
+
+
+class CsvTests(TestCase):
+    def setUp(self):
+        self.site = Site.objects.get_or_create(domain='unplugwell.com', defaults={'name': 'Unplugwell'})[0]
+        self.directory = tempfile.mkdtemp()
+
+    def test_import_skips_invalid_and_duplicate_rows_and_export_round_trips(self):
+        Subscription.objects.create(site=self.site, email='x0@example.com')
+        source = os.path.join(self.directory, 'in.csv')
+        with open(source, 'w') as handle:
+            handle.write('email,site\n')
+            for index in range(1200):
+                handle.write(f'X{index % 1000}@example.com,unplugwell.com\n')
+            handle.write('not-an-email,unplugwell.com\n')
+            handle.write('a@example.com,unknown.example\n')
+
+        call_command('subscriptions_csv', 'import', source, batch_size=300, stderr=open(os.devnull, 'w'))
+        self.assertEqual(Subscription.objects.count(), 1000)
+
+        target = os.path.join(self.directory, 'out.csv')
+        call_command('subscriptions_csv', 'export', target, site='unplugwell.com', stderr=open(os.devnull, 'w'))
+        with open(target) as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(lines[0], 'email,site')
+        self.assertEqual(len(lines), 1001)
+        self.assertIn('x999@example.com,unplugwell.com', lines)
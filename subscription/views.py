@@ -1,10 +1,34 @@
 from django.shortcuts import render
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.response import Response
 from .models import Subscription
 from .serializers import SubscriptionSerializer
+from .ingest import batcher
 from rest_framework.permissions import AllowAny
+from Nativeblog import spool
+from Nativeblog.throttling import SiteRateThrottle
 
 class SubscriptionCreateView(generics.CreateAPIView):
     permission_classes = [AllowAny]
+    throttle_classes = [SiteRateThrottle]
+    throttle_scope = 'subscription'
     queryset = Subscription.objects.all()
     serializer_class = SubscriptionSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        if spool.is_enabled():
+            spool.append('subscription', {
+                'site': serializer.validated_data['site'].id,
+                'email': serializer.validated_data['email'],
+            })
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        subscription = batcher.submit(
+            serializer.validated_data['site'].id,
+            serializer.validated_data['email']
+        )
+        serializer = self.get_serializer(subscription)
+        headers = self.get_success_headers(serializer.data)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)